@@ -1,5 +1,16 @@
+from .async_space_file_manager import AsyncSpaceFileManager
+from .async_space_manager import AsyncSpaceManager
 from .space_executor import SpaceExecutor
 from .space_file_manager import SpaceFileManager
-from .space_manager import SpaceManager
+from .space_manager import SpaceManager, get_shared_space_manager
+from .space_worker_pool import SpaceWorkerPool
 
-__all__ = ["SpaceManager", "SpaceFileManager", "SpaceExecutor"]
+__all__ = [
+    "SpaceManager",
+    "SpaceFileManager",
+    "SpaceExecutor",
+    "AsyncSpaceManager",
+    "AsyncSpaceFileManager",
+    "SpaceWorkerPool",
+    "get_shared_space_manager",
+]
@@ -0,0 +1,119 @@
+"""
+_space_worker.py
+
+Entry point of the warm interpreters managed by SpaceWorkerPool. Only the
+standard library is used, so the worker starts without importing the
+package.
+
+Requests and responses are JSON objects, each sent as a 4-byte big-endian
+length followed by that many bytes of UTF-8. A request holds the ``argv``
+the interpreter would have been started with (``["-c", code, *args]``,
+``["-m", module, *args]`` or ``[script, *args]``) and the ``cwd`` to run
+in; the response holds ``returncode``, ``stdout`` and ``stderr``.
+"""
+
+import builtins
+import io
+import json
+import os
+import runpy
+import struct
+import sys
+import traceback
+
+_LENGTH = struct.Struct(">I")
+
+
+def write_frame(stream, message: dict):
+    """Write one length-prefixed JSON message and flush it."""
+    data = json.dumps(message).encode("utf-8")
+    stream.write(_LENGTH.pack(len(data)) + data)
+    stream.flush()
+
+
+def read_frame(stream):
+    """Read one length-prefixed JSON message, or None at end of stream."""
+    header = stream.read(_LENGTH.size)
+    if len(header) < _LENGTH.size:
+        return None
+    (length,) = _LENGTH.unpack(header)
+    data = stream.read(length)
+    if len(data) < length:
+        return None
+    return json.loads(data.decode("utf-8"))
+
+
+def _exit_code(exit: SystemExit) -> int:
+    if exit.code is None:
+        return 0
+    if isinstance(exit.code, int):
+        return exit.code
+    print(exit.code, file=sys.stderr)
+    return 1
+
+
+def _execute(argv: list) -> int:
+    """Run ``argv`` the way ``python <argv>`` would and return its code."""
+    try:
+        if argv[0] == "-c":
+            sys.argv = ["-c"] + argv[2:]
+            code = compile(argv[1], "<string>", "exec")
+            namespace = {"__name__": "__main__", "__builtins__": builtins}
+            # Running caller-supplied code is the worker's job, as with -c
+            exec(code, namespace)  # nosec B102
+        elif argv[0] == "-m":
+            sys.argv = argv[1:]
+            runpy.run_module(argv[1], run_name="__main__", alter_sys=True)
+        else:
+            sys.argv = list(argv)
+            runpy.run_path(argv[0], run_name="__main__")
+    except SystemExit as exit:
+        return _exit_code(exit)
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def handle(request: dict) -> dict:
+    """Run one request with captured output and restored process state."""
+    saved = (sys.argv, sys.stdin, sys.stdout, sys.stderr, list(sys.path))
+    environ = dict(os.environ)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    sys.stdin, sys.stdout, sys.stderr = io.StringIO(), stdout, stderr
+    home = os.getcwd()
+    try:
+        os.chdir(request.get("cwd") or home)
+        returncode = _execute(request["argv"])
+    finally:
+        os.chdir(home)
+        sys.argv, sys.stdin, sys.stdout, sys.stderr = saved[:4]
+        sys.path[:] = saved[4]
+        os.environ.clear()
+        os.environ.update(environ)
+    return {
+        "returncode": returncode,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def serve():
+    # Keep the protocol on private descriptors: anything else writing to
+    # fd 0/1 (e.g. a subprocess started by a command) must not corrupt it.
+    requests = os.fdopen(os.dup(0), "rb")
+    responses = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+
+    while True:
+        request = read_frame(requests)
+        if request is None:
+            return
+        write_frame(responses, handle(request))
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,126 @@
+"""
+async_space_file_manager.py
+
+asyncio facade over SpaceFileManager. File operations, including the space
+resolution that may refresh the index, run on a bounded thread pool with a
+per-space concurrency limit, so they never block the event loop.
+"""
+
+from concurrent.futures import Executor
+from typing import Dict, Iterable, List, Union
+
+from darca_log_facility.logger import DarcaLogger
+
+from darca_space_manager.async_space_manager import AsyncFacade
+from darca_space_manager.space_file_manager import SpaceFileManager
+
+logger = DarcaLogger(name="async_space_file_manager").get_logger()
+
+
+class AsyncSpaceFileManager(AsyncFacade):
+    """
+    Awaitable versions of the SpaceFileManager operations.
+
+    Example:
+        async with AsyncSpaceFileManager() as files:
+            config = await files.get_file("reports", "app.yaml", load=True)
+    """
+
+    def __init__(
+        self,
+        file_manager: SpaceFileManager = None,
+        max_workers: int = None,
+        per_space_limit: int = None,
+        executor: Executor = None,
+    ):
+        """
+        Args:
+            file_manager (SpaceFileManager): Manager to delegate to.
+                Defaults to a new one on the shared SpaceManager.
+            max_workers, per_space_limit, executor: See ``AsyncFacade``.
+        """
+        super().__init__(max_workers, per_space_limit, executor)
+        self.file_manager = file_manager or SpaceFileManager()
+        logger.debug("AsyncSpaceFileManager initialized.")
+
+    async def file_exists(self, space_name: str, relative_path: str) -> bool:
+        return await self._run(
+            space_name,
+            self.file_manager.file_exists,
+            space_name,
+            relative_path,
+        )
+
+    async def get_file(
+        self, space_name: str, relative_path: str, load: bool = False
+    ) -> Union[str, dict]:
+        return await self._run(
+            space_name,
+            self.file_manager.get_file,
+            space_name,
+            relative_path,
+            load,
+        )
+
+    async def set_file(
+        self, space_name: str, relative_path: str, content: Union[str, dict]
+    ) -> bool:
+        return await self._run(
+            space_name,
+            self.file_manager.set_file,
+            space_name,
+            relative_path,
+            content,
+        )
+
+    async def delete_file(self, space_name: str, relative_path: str) -> bool:
+        return await self._run(
+            space_name,
+            self.file_manager.delete_file,
+            space_name,
+            relative_path,
+        )
+
+    async def get_files(
+        self, space_name: str, paths: Iterable[str], load: bool = True
+    ) -> Dict[str, dict]:
+        return await self._run(
+            space_name, self.file_manager.get_files, space_name, paths, load
+        )
+
+    async def set_files(
+        self,
+        space_name: str,
+        files: Dict[str, Union[str, dict]],
+        atomic: bool = False,
+    ) -> Dict[str, dict]:
+        return await self._run(
+            space_name, self.file_manager.set_files, space_name, files, atomic
+        )
+
+    async def list_files(
+        self, space_name: str, recursive: bool = True
+    ) -> List[str]:
+        return await self._run(
+            space_name, self.file_manager.list_files, space_name, recursive
+        )
+
+    async def list_files_content(
+        self, space_name: str, include_content: bool = True
+    ) -> List[dict]:
+        return await self._run(
+            space_name,
+            self.file_manager.list_files_content,
+            space_name,
+            include_content,
+        )
+
+    async def get_file_last_modified(
+        self, space_name: str, relative_path: str
+    ) -> float:
+        return await self._run(
+            space_name,
+            self.file_manager.get_file_last_modified,
+            space_name,
+            relative_path,
+        )
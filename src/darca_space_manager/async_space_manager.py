@@ -0,0 +1,158 @@
+"""
+async_space_manager.py
+
+asyncio facade over SpaceManager. Every call runs the blocking filesystem
+work on a bounded thread pool, so an event loop is never blocked by index
+walks or disk I/O, and calls that target the same space are limited to a
+fixed number in flight at once.
+"""
+
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union
+
+from darca_log_facility.logger import DarcaLogger
+
+from darca_space_manager import config
+from darca_space_manager.space_manager import (
+    SpaceManager,
+    get_shared_space_manager,
+)
+
+logger = DarcaLogger(name="async_space_manager").get_logger()
+
+# Calls allowed in flight per space unless configured otherwise
+DEFAULT_PER_SPACE_LIMIT = 4
+
+
+class SpaceLimiter:
+    """
+    Per-space concurrency limit for coroutines on one event loop.
+
+    A semaphore is created the first time a space is used and dropped again
+    once no coroutine holds or waits for it, so the table only contains
+    spaces that are busy.
+    """
+
+    def __init__(self, limit: int = DEFAULT_PER_SPACE_LIMIT):
+        self.limit = limit
+        self._slots: Dict[str, list] = {}
+
+    @contextlib.asynccontextmanager
+    async def __call__(self, space_name: str):
+        slot = self._slots.get(space_name)
+        if slot is None:
+            slot = self._slots[space_name] = [asyncio.Semaphore(self.limit), 0]
+        slot[1] += 1
+        try:
+            async with slot[0]:
+                yield
+        finally:
+            slot[1] -= 1
+            if not slot[1]:
+                del self._slots[space_name]
+
+
+class AsyncFacade:
+    """
+    Shared plumbing of the async facades: a bounded executor for blocking
+    calls and a per-space ``SpaceLimiter``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        per_space_limit: int = None,
+        executor: Executor = None,
+    ):
+        """
+        Args:
+            max_workers (int): Size of the thread pool created when no
+                ``executor`` is given. Defaults to the
+                ``DARCA_SPACE_ASYNC_WORKERS`` environment variable, or 8.
+            per_space_limit (int): Calls allowed in flight per space.
+            executor (Executor): Run blocking calls on this executor instead
+                of a private pool, e.g. to share one between facades. It is
+                not shut down by ``close()``.
+        """
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers or config.get_async_workers(),
+            thread_name_prefix="space_async",
+        )
+        self._limiter = SpaceLimiter(
+            per_space_limit or DEFAULT_PER_SPACE_LIMIT
+        )
+
+    async def _run(self, space_name: Optional[str], func: Callable, *args):
+        """Run ``func(*args)`` on the executor, under the space's limit."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args)
+        if space_name is None:
+            return await loop.run_in_executor(self._executor, call)
+        async with self._limiter(space_name):
+            return await loop.run_in_executor(self._executor, call)
+
+    def close(self, wait: bool = True):
+        """Shut down the private executor, if this facade created one."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+
+class AsyncSpaceManager(AsyncFacade):
+    """
+    Awaitable versions of the SpaceManager operations.
+
+    Example:
+        async with AsyncSpaceManager() as spaces:
+            await spaces.create_space("reports")
+    """
+
+    def __init__(
+        self,
+        space_manager: SpaceManager = None,
+        max_workers: int = None,
+        per_space_limit: int = None,
+        executor: Executor = None,
+    ):
+        """
+        Args:
+            space_manager (SpaceManager): Manager to delegate to. Defaults
+                to the process-wide shared manager.
+            max_workers, per_space_limit, executor: See ``AsyncFacade``.
+        """
+        super().__init__(max_workers, per_space_limit, executor)
+        self.space_manager = space_manager or get_shared_space_manager()
+        logger.debug("AsyncSpaceManager initialized.")
+
+    async def create_space(
+        self, name: str, label: str = "", parent_path: str = None
+    ) -> bool:
+        return await self._run(
+            name, self.space_manager.create_space, name, label, parent_path
+        )
+
+    async def delete_space(self, name: str) -> bool:
+        return await self._run(name, self.space_manager.delete_space, name)
+
+    async def get_space(self, name: str) -> Union[dict, None]:
+        return await self._run(name, self.space_manager.get_space, name)
+
+    async def space_exists(self, name: str) -> bool:
+        return await self._run(name, self.space_manager.space_exists, name)
+
+    async def list_spaces(self, label_filter: str = None) -> List[dict]:
+        return await self._run(
+            None, self.space_manager.list_spaces, label_filter
+        )
+
+    async def refresh_index(self):
+        return await self._run(None, self.space_manager.refresh_index)
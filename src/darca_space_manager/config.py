@@ -8,6 +8,41 @@ def get_base_dir():
     )
 
 
+def get_metadata_workers():
+    """Get the number of metadata loader threads (from env or default)."""
+    return max(1, int(os.getenv("DARCA_SPACE_METADATA_WORKERS", "1")))
+
+
+def get_read_workers():
+    """Get the number of file reader threads (from env or default)."""
+    return max(1, int(os.getenv("DARCA_SPACE_READ_WORKERS", "1")))
+
+
+def get_write_workers():
+    """Get the number of file writer threads (from env or default)."""
+    return max(1, int(os.getenv("DARCA_SPACE_WRITE_WORKERS", "1")))
+
+
+def get_async_workers():
+    """Get the thread pool size of the async facades (from env or default)."""
+    return max(1, int(os.getenv("DARCA_SPACE_ASYNC_WORKERS", "8")))
+
+
+def get_pool_workers():
+    """Get the maximum number of warm space workers (from env or default)."""
+    return max(1, int(os.getenv("DARCA_SPACE_POOL_WORKERS", "4")))
+
+
+def get_index_backend():
+    """Get the space index store backend (from env or default)."""
+    return os.getenv("DARCA_SPACE_INDEX_BACKEND", "jsonl")
+
+
+def get_lazy_discovery():
+    """Whether SpaceManager should skip discovery on startup (from env)."""
+    return os.getenv("DARCA_SPACE_LAZY", "").lower() in ("1", "true", "yes")
+
+
 def get_directories():
     """Return the configured subdirectories."""
     base = get_base_dir()
@@ -0,0 +1,103 @@
+"""
+document_cache.py
+
+An opt-in LRU cache of parsed YAML/JSON documents for SpaceFileManager.
+
+Entries are looked up by space and file path and are only valid for the
+exact file they were parsed from: the file's inode, ``mtime_ns`` and size are
+stored with the document and compared on every lookup, so a file replaced or
+edited outside the API is parsed again. Writes through the SpaceFileManager
+also drop the entry explicitly, which covers filesystems with coarse mtimes.
+
+Callers get deep copies, so mutating a returned document never changes the
+cached one.
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Tuple
+
+
+class DocumentCache:
+    """
+    Least-recently-used cache of parsed documents, bounded by entry count
+    and by the total on-disk size of the cached files.
+
+    Example:
+        cache = DocumentCache(max_entries=512, max_bytes=32 * 1024**2)
+        file_mgr = SpaceFileManager(document_cache=cache)
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024**2):
+        """
+        Args:
+            max_entries (int): Maximum number of cached documents.
+            max_bytes (int): Maximum summed file size of cached documents.
+                Files larger than this are never cached.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(stat: os.stat_result) -> Tuple[int, int, int, int]:
+        return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def get(self, space: str, path: str, stat: os.stat_result) -> Any:
+        """
+        Return a copy of the cached document for ``path``, or None if there
+        is no entry for the file as described by ``stat``.
+        """
+        key = (space, path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != self._stamp(stat):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            document = entry[1]
+        return copy.deepcopy(document)
+
+    def put(self, space: str, path: str, stat: os.stat_result, document: Any):
+        """Cache a copy of ``document`` as parsed from the file at ``stat``."""
+        size = stat.st_size
+        if size > self.max_bytes:
+            return
+        document = copy.deepcopy(document)
+        key = (space, path)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (self._stamp(stat), document, size)
+            self._bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self._bytes > self.max_bytes
+            ):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def invalidate(self, space: str, path: str):
+        """Drop the entry for ``path`` in ``space``, if any."""
+        with self._lock:
+            self._discard((space, path))
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
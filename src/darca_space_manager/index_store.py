@@ -0,0 +1,502 @@
+"""
+index_store.py
+
+Persistence backends for the space index. The index is a catalogue of
+space metadata records; each backend stores it in ``METADATA_DIR`` in its
+own format and can load either the whole catalogue or a single record.
+
+Backends:
+    - ``jsonl``: one JSON record per line (default, fast to parse/write).
+    - ``sqlite``: a stdlib ``sqlite3`` database keyed by space name.
+    - ``yaml``: the original ``spaces_index.yaml`` (compat/export format).
+
+The file based backends (``jsonl`` and ``yaml``) write snapshots atomically
+(temporary file plus rename) and record single-space changes in an
+append-only journal next to the snapshot, which is folded back into the
+snapshot once it grows past a threshold.
+
+All backends share a lock file, ``spaces_index.lock``, which serializes
+writers across processes with ``fcntl.flock`` and holds a generation counter
+that every writer bumps. Platforms without ``fcntl`` fall back to no
+cross-process locking.
+"""
+
+import contextlib
+import json
+import os
+import secrets
+import sqlite3
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from darca_exception.exception import DarcaException
+from darca_file_utils.file_utils import FileUtils
+from darca_log_facility.logger import DarcaLogger
+from darca_yaml.yaml_utils import YamlUtils
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+LOCK_FILENAME = "spaces_index.lock"
+
+logger = DarcaLogger(name="index_store").get_logger()
+
+
+class IndexStoreException(DarcaException):
+    """Custom exception for errors in an index store."""
+
+    def __init__(self, message, error_code=None, metadata=None, cause=None):
+        super().__init__(
+            message=message,
+            error_code=error_code or "INDEX_STORE_ERROR",
+            metadata=metadata,
+            cause=cause,
+        )
+
+
+def fsync_directory(directory: str):
+    """
+    Flush a directory entry change (e.g. a rename) to disk. Platforms that
+    cannot open directories are skipped.
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def create_temp_file(path: str) -> Tuple[int, str]:
+    """
+    Create a uniquely named temporary file next to ``path`` for an atomic
+    replace and return its open descriptor and path. Unlike
+    ``tempfile.mkstemp`` (0600) the mode honours the umask, so the final
+    file stays readable for other users like the rest of the tree.
+    """
+    tmp_path = os.path.join(
+        os.path.dirname(path),
+        f".{os.path.basename(path)}.{secrets.token_hex(6)}.tmp",
+    )
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    return fd, tmp_path
+
+
+def atomic_write(path: str, write: Callable[[str], None]):
+    """
+    Write a file atomically: ``write`` fills a temporary file in the same
+    directory, which is fsynced and then renamed over ``path``, and the
+    rename itself is made durable by fsyncing the directory. Readers see
+    either the old or the new content, never a partial file.
+    """
+    fd, tmp_path = create_temp_file(path)
+    os.close(fd)
+    try:
+        write(tmp_path)
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    fsync_directory(os.path.dirname(path))
+
+
+class IndexStore:
+    """
+    Base class for space index backends.
+
+    Subclasses set ``filename`` and implement ``exists``, ``load``,
+    ``save`` and ``get``. ``add`` and ``remove`` apply a single change; the
+    default implementation rewrites the whole catalogue.
+    """
+
+    filename = None
+
+    def __init__(self, metadata_dir: str):
+        self.path = os.path.join(metadata_dir, self.filename)
+        self.lock_path = os.path.join(metadata_dir, LOCK_FILENAME)
+
+    @contextlib.contextmanager
+    def locked(self, exclusive: bool = True):
+        """
+        Hold the cross-process index lock for the duration of the block.
+        Writers take it exclusively, readers that need a consistent view of
+        the generation counter take it shared.
+        """
+        with open(self.lock_path, "a+") as f:
+            if fcntl is not None:
+                fcntl.flock(
+                    f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+                )
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def generation(self) -> int:
+        """Return the generation counter; 0 if nothing was written yet."""
+        try:
+            with open(self.lock_path, "r", encoding="utf-8") as f:
+                return int(f.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def bump_generation(self) -> int:
+        """
+        Increment and return the generation counter. The caller must hold
+        the exclusive lock.
+        """
+        generation = self.generation() + 1
+        with open(self.lock_path, "r+", encoding="utf-8") as f:
+            f.write(str(generation))
+            f.truncate()
+        return generation
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def stamp(self) -> Union[tuple, None]:
+        """
+        Cheap change marker for the persisted index: one stat call, no
+        parsing. Returns None if nothing has been persisted yet.
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def load(self) -> Dict:
+        """Load the full catalogue as ``{"spaces": [...]}``."""
+        raise NotImplementedError
+
+    def save(self, index: Dict):
+        """Persist the full catalogue."""
+        raise NotImplementedError
+
+    def get(self, name: str) -> Optional[dict]:
+        """Load a single space record by name, or None if absent."""
+        raise NotImplementedError
+
+    def add(self, space: dict):
+        """Persist one added (or replaced) space record."""
+        index = self.load() if self.exists() else {"spaces": []}
+        _apply(index["spaces"], {"op": "add", "space": space})
+        self.save(index)
+
+    def remove(self, names: Iterable[str]):
+        """Persist the removal of the given space names."""
+        index = self.load() if self.exists() else {"spaces": []}
+        _apply(index["spaces"], {"op": "remove", "names": list(names)})
+        self.save(index)
+
+    def export_yaml(self, path: str):
+        """Write the catalogue to ``path`` in the YAML index format."""
+        YamlUtils.save_yaml_file(path, self.load())
+
+
+def _apply(spaces: List[dict], entry: dict):
+    """
+    Apply one journal entry to a list of space records in place. Entries
+    are idempotent, so replaying a journal over a snapshot that already
+    contains some of its changes is harmless.
+    """
+    if entry["op"] == "add":
+        space = entry["space"]
+        for i, existing in enumerate(spaces):
+            if existing["name"] == space["name"]:
+                spaces[i] = space
+                return
+        spaces.append(space)
+    elif entry["op"] == "remove":
+        names = set(entry["names"])
+        spaces[:] = [s for s in spaces if s["name"] not in names]
+
+
+class JournaledIndexStore(IndexStore):
+    """
+    File based store with atomic snapshots and an append-only journal.
+
+    ``add``/``remove`` append one JSON line to ``<snapshot>.journal``
+    instead of rewriting the snapshot. Loading replays the journal over the
+    snapshot. Once ``compact_after`` entries have been appended, the
+    journal is folded into a fresh snapshot. A torn last line left by a
+    crash mid-append is ignored.
+
+    Subclasses implement ``_load_snapshot``, ``_write_snapshot`` and may
+    override ``_get_snapshot`` for cheaper single-record reads.
+    """
+
+    compact_after = 200
+
+    def __init__(self, metadata_dir: str, compact_after: int = None):
+        super().__init__(metadata_dir)
+        self.journal_path = self.path + ".journal"
+        if compact_after is not None:
+            self.compact_after = compact_after
+        self._journal_entries = None
+
+    def _snapshot_exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _load_snapshot(self) -> Dict:
+        raise NotImplementedError
+
+    def _write_snapshot(self, path: str, index: Dict):
+        raise NotImplementedError
+
+    def _get_snapshot(self, name: str) -> Optional[dict]:
+        return next(
+            (s for s in self._load_snapshot()["spaces"] if s["name"] == name),
+            None,
+        )
+
+    def _read_journal(self) -> List[dict]:
+        entries = []
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        logger.warning(
+                            f"⚠️ Ignoring incomplete journal entry in "
+                            f"{self.journal_path}."
+                        )
+                        break
+                    entries.append(json.loads(line))
+        except FileNotFoundError:
+            pass
+        self._journal_entries = len(entries)
+        return entries
+
+    def exists(self) -> bool:
+        return self._snapshot_exists() or os.path.exists(self.journal_path)
+
+    def stamp(self) -> Union[tuple, None]:
+        snapshot = super().stamp()
+        try:
+            st = os.stat(self.journal_path)
+            journal = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            journal = None
+        if snapshot is None and journal is None:
+            return None
+        return (snapshot, journal)
+
+    def load(self) -> Dict:
+        if self._snapshot_exists():
+            index = self._load_snapshot()
+        else:
+            index = {"spaces": []}
+        for entry in self._read_journal():
+            _apply(index["spaces"], entry)
+        return index
+
+    def save(self, index: Dict):
+        atomic_write(self.path, lambda tmp: self._write_snapshot(tmp, index))
+        # Truncate only after the new snapshot is in place; replaying the
+        # old journal over it would be a no-op anyway.
+        if os.path.exists(self.journal_path):
+            os.truncate(self.journal_path, 0)
+        self._journal_entries = 0
+
+    def get(self, name: str) -> Optional[dict]:
+        if not self.exists():
+            return None
+        record = self._get_snapshot(name) if self._snapshot_exists() else None
+        for entry in self._read_journal():
+            if entry["op"] == "add" and entry["space"]["name"] == name:
+                record = entry["space"]
+            elif entry["op"] == "remove" and name in entry["names"]:
+                record = None
+        return record
+
+    def _append(self, entry: dict):
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        if self._journal_entries is None:
+            self._read_journal()
+        else:
+            self._journal_entries += 1
+        if self._journal_entries >= self.compact_after:
+            self.compact()
+
+    def add(self, space: dict):
+        self._append({"op": "add", "space": space})
+
+    def remove(self, names: Iterable[str]):
+        self._append({"op": "remove", "names": list(names)})
+
+    def compact(self):
+        """Fold the journal into a new snapshot and empty the journal."""
+        logger.debug(f"🧹 Compacting index journal {self.journal_path}.")
+        self.save(self.load())
+
+
+class YamlIndexStore(JournaledIndexStore):
+    """The original YAML index. Snapshot reads parse the whole file."""
+
+    filename = "spaces_index.yaml"
+
+    def _snapshot_exists(self) -> bool:
+        return FileUtils.file_exist(self.path)
+
+    def _load_snapshot(self) -> Dict:
+        return YamlUtils.load_yaml_file(self.path) or {"spaces": []}
+
+    def _write_snapshot(self, path: str, index: Dict):
+        YamlUtils.save_yaml_file(path, index)
+
+
+class JsonLinesIndexStore(JournaledIndexStore):
+    """
+    One compact JSON record per line. ``get`` decodes only the lines that
+    mention the requested name instead of the whole catalogue.
+    """
+
+    filename = "spaces_index.jsonl"
+
+    def _load_snapshot(self) -> Dict:
+        with open(self.path, "r", encoding="utf-8") as f:
+            return {"spaces": [json.loads(line) for line in f if line.strip()]}
+
+    def _write_snapshot(self, path: str, index: Dict):
+        with open(path, "w", encoding="utf-8") as f:
+            for space in index["spaces"]:
+                f.write(json.dumps(space, separators=(",", ":")) + "\n")
+
+    def _get_snapshot(self, name: str) -> Optional[dict]:
+        needle = json.dumps(name)
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if needle not in line:
+                    continue
+                record = json.loads(line)
+                if record.get("name") == name:
+                    return record
+        return None
+
+
+class SqliteIndexStore(IndexStore):
+    """
+    A stdlib ``sqlite3`` database with one row per space, keyed by name.
+    Single records are fetched by primary key.
+    """
+
+    filename = "spaces_index.db"
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS spaces ("
+            "name TEXT PRIMARY KEY, position INTEGER, record TEXT)"
+        )
+        return conn
+
+    def stamp(self) -> Union[tuple, None]:
+        base = super().stamp()
+        if base is None:
+            return None
+        try:
+            wal = os.stat(self.path + "-wal")
+            return base + (wal.st_mtime_ns, wal.st_size)
+        except FileNotFoundError:
+            return base
+
+    def load(self) -> Dict:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT record FROM spaces ORDER BY position"
+            ).fetchall()
+        finally:
+            conn.close()
+        return {"spaces": [json.loads(r[0]) for r in rows]}
+
+    def save(self, index: Dict):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM spaces")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO spaces (name, position, record) "
+                    "VALUES (?, ?, ?)",
+                    (
+                        (s["name"], i, json.dumps(s))
+                        for i, s in enumerate(index["spaces"])
+                    ),
+                )
+        finally:
+            conn.close()
+
+    def get(self, name: str) -> Optional[dict]:
+        if not self.exists():
+            return None
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT record FROM spaces WHERE name = ?", (name,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
+
+    def add(self, space: dict):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO spaces (name, position, record) "
+                    "VALUES (?, COALESCE((SELECT position FROM spaces "
+                    "WHERE name = ?), (SELECT IFNULL(MAX(position), -1) + 1 "
+                    "FROM spaces)), ?)",
+                    (space["name"], space["name"], json.dumps(space)),
+                )
+        finally:
+            conn.close()
+
+    def remove(self, names: Iterable[str]):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "DELETE FROM spaces WHERE name = ?",
+                    ((n,) for n in names),
+                )
+        finally:
+            conn.close()
+
+
+INDEX_BACKENDS = {
+    "jsonl": JsonLinesIndexStore,
+    "sqlite": SqliteIndexStore,
+    "yaml": YamlIndexStore,
+}
+
+
+def get_index_store(backend: str, metadata_dir: str) -> IndexStore:
+    """Instantiate the index store registered under ``backend``."""
+    try:
+        store_cls = INDEX_BACKENDS[backend]
+    except KeyError:
+        raise IndexStoreException(
+            f"Unknown index backend '{backend}'.",
+            error_code="UNKNOWN_INDEX_BACKEND",
+            metadata={
+                "backend": backend,
+                "available": sorted(INDEX_BACKENDS),
+            },
+        )
+    logger.debug(f"🗄️ Using '{backend}' index store in {metadata_dir}.")
+    return store_cls(metadata_dir)
@@ -6,17 +6,53 @@ darca-executor.
 FIXME: Jail the command to the space directory.
 """
 
+import asyncio
+import codecs
+import contextlib
+import inspect
 import os
-from typing import Dict, List, Optional, Union
+import signal
+import subprocess  # nosec B404
+import time
+from collections import deque
+from functools import partial
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 from darca_exception.exception import DarcaException
 from darca_executor import DarcaExecError, DarcaExecutor
 from darca_log_facility.logger import DarcaLogger
 
-from darca_space_manager.space_manager import SpaceManager
+from darca_space_manager.space_manager import (
+    METADATA_FILENAME,
+    SPACE_MISS_TTL,
+    SpaceManager,
+    get_shared_space_manager,
+)
 
 logger = DarcaLogger(name="space_executor").get_logger()
 
+# Bytes read per pipe read when streaming command output
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Longest partial line buffered in line_mode before it is emitted as is
+STREAM_MAX_LINE = STREAM_CHUNK_SIZE
+
+# Characters of each stream kept by a streaming run_in_space by default
+STREAM_OUTPUT_TAIL = 1024 * 1024
+
+# Commands run in their own process group so they can be killed as a whole
+_POSIX = os.name == "posix"
+
 
 class SpaceExecutorException(DarcaException):
     """
@@ -44,17 +80,117 @@ class SpaceExecutor:
     using the darca-executor module.
     """
 
-    def __init__(self, use_shell: bool = False):
+    def __init__(
+        self, use_shell: bool = False, space_manager: SpaceManager = None
+    ):
         """
         Initialize the SpaceExecutor with a DarcaExecutor and a SpaceManager.
 
         Args:
             use_shell (bool): Whether to run commands through the shell.
+            space_manager (SpaceManager): Manager to resolve spaces with.
+                Defaults to the process-wide shared manager for the current
+                ``DARCA_SPACE_BASE``.
         """
-        self._space_manager = SpaceManager()
+        self._space_manager = space_manager or get_shared_space_manager()
+        self.use_shell = use_shell
+        self._space_paths = {}
+        self._space_paths_generation = None
+        # Unknown space names -> when a full refresh last failed to find them
+        self._space_misses = {}
         self._executor = DarcaExecutor(use_shell=use_shell)
         logger.debug(f"SpaceExecutor initialized (use_shell={use_shell}).")
 
+    def _check_space_paths(self):
+        """Drop cached resolutions and misses if the index changed."""
+        generation = self._space_manager.generation
+        if generation != self._space_paths_generation:
+            self._space_paths.clear()
+            self._space_misses.clear()
+            self._space_paths_generation = generation
+
+    def _get_space_path(self, space_name: str) -> Optional[str]:
+        """
+        Resolve a space name to its root path without rescanning.
+
+        Resolutions are cached until the index generation changes and are
+        validated on every use by checking that the space's
+        ``metadata.yaml`` still exists. A full index refresh is only done
+        when that fails, so spaces created or removed outside the API are
+        still handled; names it did not find are not rescanned again for
+        ``SPACE_MISS_TTL`` seconds or until the index changes.
+        """
+        self._space_manager.sync_index()
+        self._check_space_paths()
+
+        space_path = self._space_paths.get(space_name)
+        if space_path is None:
+            space = self._space_manager.get_space(space_name)
+            space_path = space["path"] if space else None
+        if space_path and os.path.isfile(
+            os.path.join(space_path, METADATA_FILENAME)
+        ):
+            self._space_paths[space_name] = space_path
+            return space_path
+
+        self._space_paths.pop(space_name, None)
+        if self._space_manager.lazy:
+            # Lazy managers defer reconciliation to an explicit call.
+            return None
+        missed = self._space_misses.get(space_name, -SPACE_MISS_TTL)
+        if time.monotonic() - missed < SPACE_MISS_TTL:
+            return None
+        logger.debug(f"Space '{space_name}' not resolved, refreshing index.")
+        self._space_manager.refresh_index()
+        self._check_space_paths()
+        space = self._space_manager.get_space(space_name)
+        if not space:
+            self._space_misses[space_name] = time.monotonic()
+            return None
+        self._space_paths[space_name] = space["path"]
+        return space["path"]
+
+    def resolve_space(
+        self, space_name: str, cwd: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Resolve a space and the working directory for a command in it: the
+        space's root, or ``cwd`` inside it.
+
+        Returns:
+            Tuple[str, str]: The space's root path and the working
+            directory.
+
+        Raises:
+            SpaceExecutorException: If the space does not exist or ``cwd``
+                escapes it.
+        """
+        space_path = self._get_space_path(space_name)
+        if not space_path:
+            logger.error(f"Space '{space_name}' not found.")
+            raise SpaceExecutorException(
+                message=f"Space '{space_name}' does not exist.",
+                metadata={"space": space_name},
+            )
+
+        logger.debug(f"Resolved space '{space_name}' to path: {space_path}")
+
+        # Combine 'cwd' if provided, ensuring it doesn't escape the space
+        final_cwd = space_path
+        if cwd:
+            combined_path = os.path.join(space_path, cwd)
+            final_cwd = os.path.normpath(combined_path)
+            # Use commonpath check to detect boundary escapes
+            if os.path.commonpath(
+                [space_path, final_cwd]
+            ) != os.path.commonpath([space_path]):
+                raise SpaceExecutorException(
+                    message="Subdirectory path escapes space boundaries.",
+                    metadata={"space": space_name, "requested_cwd": cwd},
+                )
+
+        return space_path, final_cwd
+
     def run_in_space(
         self,
         space_name: str,
@@ -64,6 +200,10 @@ class SpaceExecutor:
         check: bool = True,
         env: Optional[dict] = None,
         timeout: Optional[int] = 30,
+        on_output: Optional[Callable[[str, str], None]] = None,
+        line_mode: bool = False,
+        log_file: Optional[str] = None,
+        output_tail: Optional[int] = None,
     ) -> "DarcaExecutor.CompletedProcess":
         """
         Run a command within the specified space directory using DarcaExecutor.
@@ -81,6 +221,13 @@ class SpaceExecutor:
             cwd (Optional[str]): An additional subdirectory path within the
             space. This will be appended to the space's root path before
             passing to DarcaExecutor as the working directory (cwd).
+            on_output, line_mode, log_file, output_tail: Stream output as it
+            is produced instead of after the command exits; see
+            ``run_in_space_async``. When any of these is given the command
+            runs on a private event loop, so this cannot be called from
+            within a running one. Only the last ``output_tail`` characters
+            of each stream are returned (default ``STREAM_OUTPUT_TAIL``),
+            and none are kept when ``capture_output`` is False.
 
         Returns:
             subprocess.CompletedProcess: The result of the subprocess
@@ -90,32 +237,23 @@ class SpaceExecutor:
             SpaceExecutorException: If the space is not found, or if
             execution fails for any reason.
         """
-        # 1. Resolve the space path
-        self._space_manager.refresh_index()
-        space = self._space_manager.get_space(space_name)
-        if not space:
-            logger.error(f"Space '{space_name}' not found.")
-            raise SpaceExecutorException(
-                message=f"Space '{space_name}' does not exist.",
-                metadata={"space": space_name},
+        if on_output or log_file or output_tail is not None:
+            return self._run_streaming(
+                space_name,
+                command,
+                capture_output,
+                cwd=cwd,
+                check=check,
+                env=env,
+                timeout=timeout,
+                on_output=on_output,
+                line_mode=line_mode,
+                log_file=log_file,
+                output_tail=output_tail,
             )
 
-        space_path = space["path"]
-        logger.debug(f"Resolved space '{space_name}' to path: {space_path}")
-
-        # 1a. Combine 'cwd' if provided, ensuring it doesn't escape the space
-        final_cwd = space_path
-        if cwd:
-            combined_path = os.path.join(space_path, cwd)
-            final_cwd = os.path.normpath(combined_path)
-            # Use commonpath check to detect boundary escapes
-            if os.path.commonpath(
-                [space_path, final_cwd]
-            ) != os.path.commonpath([space_path]):
-                raise SpaceExecutorException(
-                    message="Subdirectory path escapes space boundaries.",
-                    metadata={"space": space_name, "requested_cwd": cwd},
-                )
+        # 1. Resolve the space path (and optional subdirectory)
+        _, final_cwd = self.resolve_space(space_name, cwd)
 
         # 2. Invoke DarcaExecutor
         try:
@@ -168,3 +306,481 @@ class SpaceExecutor:
                 metadata={"space": space_name, "command": command},
                 cause=e,
             )
+
+    def _run_streaming(
+        self,
+        space_name: str,
+        command: Union[List[str], str],
+        capture_output: bool,
+        **kwargs,
+    ) -> subprocess.CompletedProcess:
+        """Blocking wrapper around ``run_in_space_async`` for streaming."""
+        # Output that is not returned must not accumulate in memory
+        if not capture_output:
+            kwargs["output_tail"] = 0
+        elif kwargs.get("output_tail") is None:
+            kwargs["output_tail"] = STREAM_OUTPUT_TAIL
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise SpaceExecutorException(
+                message=(
+                    "Streaming run_in_space cannot be used inside a running "
+                    "event loop; use run_in_space_async instead."
+                ),
+                error_code="EVENT_LOOP_RUNNING",
+                metadata={"space": space_name, "command": command},
+            )
+        result = asyncio.run(
+            self.run_in_space_async(space_name, command, **kwargs)
+        )
+        return subprocess.CompletedProcess(
+            args=command,
+            returncode=result["returncode"],
+            stdout=result["stdout"] if capture_output else None,
+            stderr=result["stderr"] if capture_output else None,
+        )
+
+    def _resolve_log_file(self, space_name: str, log_file: str) -> str:
+        """Resolve a log file path relative to the space root."""
+        space_path = self._get_space_path(space_name)
+        log_path = os.path.normpath(os.path.join(space_path, log_file))
+        if (
+            os.path.commonpath([space_path, log_path])
+            != os.path.commonpath([space_path])
+            or log_path == space_path
+        ):
+            raise SpaceExecutorException(
+                message="Log file path escapes space boundaries.",
+                metadata={"space": space_name, "log_file": log_file},
+            )
+        return log_path
+
+    async def run_in_space_async(
+        self,
+        space_name: str,
+        command: Union[List[str], str],
+        cwd: Optional[str] = None,
+        check: bool = True,
+        env: Optional[dict] = None,
+        timeout: Optional[float] = 30,
+        on_output: Optional[Callable[[str, str], None]] = None,
+        line_mode: bool = False,
+        log_file: Optional[str] = None,
+        output_tail: Optional[int] = None,
+    ) -> dict:
+        """
+        Run a command within a space without blocking the event loop.
+
+        Output is read as it is produced; ``on_output(stream, text)`` is
+        called for every chunk (or, with ``line_mode``, every line) with
+        ``stream`` being ``"stdout"`` or ``"stderr"``. The callback may be
+        a coroutine function, in which case reading waits for it, which
+        applies backpressure to the command.
+
+        Args:
+            space_name (str): Name of the managed space.
+            command (List[str] | str): The command to execute; a list, or a
+                string if use_shell=True.
+            cwd (Optional[str]): Subdirectory of the space to run in.
+            check (bool): Raise if the command exits with a non-zero code.
+            env (Optional[dict]): Environment for the subprocess.
+            timeout (Optional[float]): Timeout in seconds; the process is
+                killed when it expires. On POSIX the command runs in its own
+                session, so processes it started are killed with it.
+            on_output (Optional[Callable]): Streaming output callback.
+            line_mode (bool): Pass whole lines to ``on_output`` instead of
+                chunks as they arrive. Lines longer than ``STREAM_MAX_LINE``
+                characters are passed on in pieces of that size.
+            log_file (Optional[str]): Path relative to the space root that
+                both streams are appended to as they arrive.
+            output_tail (Optional[int]): Keep only the last ``output_tail``
+                characters of each stream in the result, bounding memory for
+                long-running commands. ``None`` keeps everything.
+
+        Returns:
+            dict: ``space``, ``command``, ``returncode``, ``stdout``,
+            ``stderr``, ``truncated`` (True if the tail limit dropped
+            output), ``started_at`` (epoch seconds), ``duration`` (seconds)
+            and ``error`` (None).
+
+        Raises:
+            SpaceExecutorException: If the space is not found, the command
+            times out (``COMMAND_TIMEOUT``), fails with ``check`` set, or
+            cannot be started.
+        """
+        loop = asyncio.get_running_loop()
+
+        def resolve():
+            _, final_cwd = self.resolve_space(space_name, cwd)
+            if not log_file:
+                return final_cwd, None
+            log_path = self._resolve_log_file(space_name, log_file)
+            # Opened before the command starts, so a bad log file cannot
+            # leave a spawned process behind
+            try:
+                os.makedirs(os.path.dirname(log_path), exist_ok=True)
+                return final_cwd, open(log_path, "a", encoding="utf-8")
+            except OSError as e:
+                logger.error(
+                    "Cannot open log file '%s' in space '%s'.",
+                    log_file,
+                    space_name,
+                    exc_info=True,
+                )
+                raise SpaceExecutorException(
+                    message=(
+                        f"Cannot open log file '{log_file}' "
+                        f"in space '{space_name}'."
+                    ),
+                    metadata={"space": space_name, "log_file": log_file},
+                    cause=e,
+                )
+
+        final_cwd, log = await loop.run_in_executor(None, resolve)
+        started_at, started = time.time(), time.monotonic()
+
+        try:
+            if self.use_shell:
+                process = await asyncio.create_subprocess_shell(
+                    command,
+                    cwd=final_cwd,
+                    env=env,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    start_new_session=_POSIX,
+                )
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    cwd=final_cwd,
+                    env=env,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    start_new_session=_POSIX,
+                )
+        except Exception as e:
+            if log:
+                log.close()
+            logger.error(
+                "Unexpected error while running command in space '%s'.",
+                space_name,
+                exc_info=True,
+            )
+            raise SpaceExecutorException(
+                message=(
+                    f"Unexpected error while running command "
+                    f"in space '{space_name}'."
+                ),
+                metadata={"space": space_name, "command": command},
+                cause=e,
+            )
+
+        sink = _OutputSink(on_output, log, output_tail, line_mode)
+
+        async def pump(stream, name):
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            while True:
+                data = await stream.read(STREAM_CHUNK_SIZE)
+                text = decoder.decode(data, final=not data)
+                if text:
+                    await sink.feed(name, text)
+                if not data:
+                    await sink.flush(name)
+                    return
+
+        async def complete():
+            await asyncio.gather(
+                pump(process.stdout, "stdout"),
+                pump(process.stderr, "stderr"),
+                process.wait(),
+            )
+
+        try:
+            await asyncio.wait_for(complete(), timeout)
+        except asyncio.TimeoutError:
+            await _kill(process)
+            logger.error(
+                "Command in space '%s' timed out after %ss.",
+                space_name,
+                timeout,
+            )
+            raise SpaceExecutorException(
+                message=(
+                    f"Command in space '{space_name}' timed out "
+                    f"after {timeout}s."
+                ),
+                error_code="COMMAND_TIMEOUT",
+                metadata={
+                    "space": space_name,
+                    "command": command,
+                    "stdout": sink.text("stdout"),
+                    "stderr": sink.text("stderr"),
+                    "truncated": sink.truncated,
+                },
+            )
+        except BaseException:
+            # Cancelled (e.g. a streaming consumer stopped) or the output
+            # callback failed: don't leave the command running.
+            await _kill(process)
+            raise
+        finally:
+            if log:
+                log.close()
+
+        result = {
+            "space": space_name,
+            "command": command,
+            "returncode": process.returncode,
+            "stdout": sink.text("stdout"),
+            "stderr": sink.text("stderr"),
+            "truncated": sink.truncated,
+            "started_at": started_at,
+            "duration": time.monotonic() - started,
+            "error": None,
+        }
+        logger.info(
+            "Command '%s' in space '%s' completed with returncode %d "
+            "in %.3fs",
+            command,
+            space_name,
+            process.returncode,
+            result["duration"],
+        )
+        if check and process.returncode != 0:
+            raise SpaceExecutorException(
+                message=f"Failed to run command in space '{space_name}'.",
+                metadata={
+                    "space": space_name,
+                    "command": command,
+                    "returncode": process.returncode,
+                    "stdout": result["stdout"],
+                    "stderr": result["stderr"],
+                    "truncated": result["truncated"],
+                },
+            )
+        return result
+
+    async def stream_in_space(
+        self,
+        space_name: str,
+        command: Union[List[str], str],
+        line_mode: bool = True,
+        max_pending: int = 1024,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Run a command within a space and iterate over its output.
+
+        Yields ``(stream, text)`` tuples, one per line by default. At most
+        ``max_pending`` items are buffered; beyond that the command's
+        output is not read until the consumer catches up. Leaving the loop
+        early kills the command. Errors (a non-zero exit with ``check``, a
+        timeout) are raised once the output is exhausted.
+
+        Example:
+            async for stream, line in executor.stream_in_space(
+                "builds", ["make", "all"], timeout=3600, log_file="make.log"
+            ):
+                print(stream, line, end="")
+
+        Args:
+            space_name (str): Name of the managed space.
+            command (List[str] | str): The command to execute.
+            line_mode (bool): Yield lines instead of raw chunks.
+            max_pending (int): Maximum number of buffered items.
+            **kwargs: Other ``run_in_space_async`` arguments (``cwd``,
+                ``check``, ``env``, ``timeout``, ``log_file``,
+                ``output_tail``).
+        """
+        # The queue holds the output; only keep a short tail for errors
+        kwargs.setdefault("output_tail", STREAM_CHUNK_SIZE)
+        queue = asyncio.Queue(maxsize=max_pending)
+        done = object()
+
+        async def produce(stream, text):
+            await queue.put((stream, text))
+
+        async def run():
+            try:
+                return await self.run_in_space_async(
+                    space_name,
+                    command,
+                    on_output=produce,
+                    line_mode=line_mode,
+                    **kwargs,
+                )
+            finally:
+                if not asyncio.current_task().cancelling():
+                    await queue.put(done)
+
+        task = asyncio.ensure_future(run())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+            task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    async def run_many(
+        self,
+        specs: Iterable[dict],
+        max_parallel: int = 8,
+        on_output: Optional[Callable[[str, str, str], None]] = None,
+    ) -> List[dict]:
+        """
+        Run commands across spaces concurrently, at most ``max_parallel`` at
+        a time.
+
+        Each spec holds the keyword arguments of ``run_in_space_async``,
+        e.g. ``{"space_name": "a", "command": ["make"], "timeout": 600}``.
+        A failing command does not stop the others: its result carries the
+        exception in ``error`` (and the return code and output when known).
+        This includes errors raised by ``on_output`` and invalid specs.
+
+        Args:
+            specs (Iterable[dict]): One spec per command.
+            max_parallel (int): Maximum number of commands running at once.
+            on_output (Optional[Callable]): Called as
+                ``on_output(space_name, stream, text)`` for streamed output.
+
+        Returns:
+            List[dict]: One result per spec, in spec order, shaped like the
+            result of ``run_in_space_async``.
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def run(spec):
+            spec = dict(spec)
+            space_name = spec.pop("space_name", None)
+            callback = partial(on_output, space_name) if on_output else None
+            async with semaphore:
+                started_at, started = time.time(), time.monotonic()
+                try:
+                    return await self.run_in_space_async(
+                        space_name, on_output=callback, **spec
+                    )
+                except Exception as e:
+                    # Any failure, including a raising callback or a bad
+                    # spec, is recorded for this spec only
+                    metadata = getattr(e, "metadata", None) or {}
+                    return {
+                        "space": space_name,
+                        "command": spec.get("command"),
+                        "returncode": metadata.get("returncode"),
+                        "stdout": metadata.get("stdout", ""),
+                        "stderr": metadata.get("stderr", ""),
+                        "truncated": metadata.get("truncated", False),
+                        "started_at": started_at,
+                        "duration": time.monotonic() - started,
+                        "error": e,
+                    }
+
+        results = await asyncio.gather(*(run(spec) for spec in specs))
+        failed = sum(1 for result in results if result["error"])
+        logger.info(
+            "Ran %d commands across spaces, %d failed.", len(results), failed
+        )
+        return list(results)
+
+
+async def _kill(process: asyncio.subprocess.Process):
+    """
+    Kill a command started by ``run_in_space_async`` and wait for it.
+
+    On POSIX the command runs in its own session, so the whole process group
+    is killed; otherwise children of a shell would keep the output pipes,
+    and with them the wait, open until they finish on their own.
+    """
+    try:
+        if _POSIX:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+    await process.wait()
+
+
+class _OutputSink:
+    """
+    Fans streamed command output out to a callback, an optional log file
+    and a bounded per-stream tail kept for the result.
+    """
+
+    def __init__(
+        self,
+        on_output: Optional[Callable],
+        log: Optional[TextIO],
+        tail: Optional[int],
+        line_mode: bool,
+    ):
+        self._on_output = on_output
+        self._log = log
+        self._limit = tail
+        self._line_mode = line_mode
+        self._tails = {"stdout": deque(), "stderr": deque()}
+        self._sizes = {"stdout": 0, "stderr": 0}
+        self._partial = {"stdout": "", "stderr": ""}
+        self.truncated = False
+
+    async def feed(self, name: str, text: str):
+        if self._log:
+            self._log.write(text)
+        self._keep(name, text)
+        if not self._on_output:
+            return
+        if not self._line_mode:
+            await self._emit(name, text)
+            return
+        lines = (self._partial[name] + text).split("\n")
+        partial = lines.pop()
+        for line in lines:
+            await self._emit(name, line + "\n")
+        # Don't buffer output without newlines indefinitely
+        while len(partial) > STREAM_MAX_LINE:
+            await self._emit(name, partial[:STREAM_MAX_LINE])
+            partial = partial[STREAM_MAX_LINE:]
+        self._partial[name] = partial
+
+    async def flush(self, name: str):
+        """Emit a final line that has no trailing newline."""
+        if self._on_output and self._partial[name]:
+            await self._emit(name, self._partial[name])
+        self._partial[name] = ""
+
+    async def _emit(self, name: str, text: str):
+        result = self._on_output(name, text)
+        if inspect.isawaitable(result):
+            await result
+
+    def _keep(self, name: str, text: str):
+        if self._limit == 0:
+            self.truncated = self.truncated or bool(text)
+            return
+        tail = self._tails[name]
+        tail.append(text)
+        self._sizes[name] += len(text)
+        if self._limit is None:
+            return
+        while self._sizes[name] > self._limit:
+            excess = self._sizes[name] - self._limit
+            head = tail[0]
+            if len(head) <= excess:
+                tail.popleft()
+                self._sizes[name] -= len(head)
+            else:
+                tail[0] = head[excess:]
+                self._sizes[name] -= excess
+            self.truncated = True
+
+    def text(self, name: str) -> str:
+        return "".join(self._tails[name])
@@ -6,9 +6,28 @@ Supports reading, writing, deleting, and listing files within spaces,
 with automatic handling of YAML/JSON content types.
 """
 
+import contextlib
+import errno
 import json
+import mmap
 import os
-from typing import List, Union
+import shutil
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from darca_exception.exception import DarcaException
 from darca_file_utils.directory_utils import DirectoryUtils
@@ -16,13 +35,36 @@ from darca_file_utils.file_utils import FileUtils
 from darca_log_facility.logger import DarcaLogger
 from darca_yaml.yaml_utils import YamlUtils
 
+from darca_space_manager import config
+from darca_space_manager.document_cache import DocumentCache
+from darca_space_manager.index_store import create_temp_file, fsync_directory
 from darca_space_manager.space_manager import (
+    SPACE_MISS_TTL,
     SpaceManager,
+    get_shared_space_manager,
 )
 
 # Initialize logger
 logger = DarcaLogger(name="space_file_manager").get_logger()
 
+# Leading bytes inspected to tell ascii from binary files
+SNIFF_BYTES = 8192
+# Cached classifications before the cache is reset
+FILE_TYPE_CACHE_SIZE = 100_000
+# Buffer size for streaming reads and writes
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Staging directory (inside the space) used by atomic set_files
+STAGING_PREFIX = ".darca-staging-"
+STAGING_BACKUP = ".replaced"
+# Files handed to a reader thread at once, and batches queued per thread
+READ_BATCH = 32
+READ_AHEAD = 4
+
+
+def _looks_binary(data: bytes) -> bool:
+    """A NUL or any byte outside 7-bit ASCII marks data as binary."""
+    return b"\0" in data or not data.isascii()
+
 
 class SpaceFileManagerException(DarcaException):
     """Custom exception for errors in the SpaceFileManager."""
@@ -36,38 +78,204 @@ class SpaceFileManagerException(DarcaException):
         )
 
 
-class SpaceFileManager:
-    def __init__(self):
-        self._space_manager = SpaceManager()
+def _is_a_directory(path: str) -> IsADirectoryError:
+    """The error writing a file over the directory ``path`` raises."""
+    return IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), path)
 
-    def _resolve_file_path(self, space_name: str, relative_path: str) -> str:
-        self._space_manager.refresh_index()
+
+class SpaceFileWriter:
+    """
+    Binary write stream returned by ``SpaceFileManager.open_write_stream``.
+
+    Data goes to a temporary file next to the target. ``close()`` (or
+    leaving a ``with`` block normally) fsyncs it, renames it over the
+    target and fsyncs the directory, so readers see either the old file or
+    the complete new one, also after a crash.
+    Leaving a ``with`` block through an exception, or calling ``abort()``,
+    discards the temporary file and leaves the target untouched.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_close: Callable[[], None] = None,
+    ):
+        self.path = path
+        self.bytes_written = 0
+        self.closed = False
+        self._on_close = on_close
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, self._tmp_path = create_temp_file(path)
+        self._file = os.fdopen(fd, "wb", buffering=chunk_size)
+
+    def write(self, data: Union[bytes, str]) -> int:
+        """Write bytes (or text, encoded as UTF-8) to the stream."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        written = self._file.write(data)
+        self.bytes_written += written
+        return written
+
+    def close(self):
+        """Commit the written data to the target path."""
+        if self.closed:
+            return
+        self.closed = True
         try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            os.replace(self._tmp_path, self.path)
+            fsync_directory(os.path.dirname(self.path))
+        except BaseException:
+            self._discard()
+            raise
+        finally:
+            if self._on_close:
+                self._on_close()
+
+    def abort(self):
+        """Discard everything written and leave the target untouched."""
+        if self.closed:
+            return
+        self.closed = True
+        self._discard()
+
+    def _discard(self):
+        self._file.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> "SpaceFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class SpaceFileManager:
+    def __init__(
+        self,
+        space_manager: SpaceManager = None,
+        read_workers: int = None,
+        write_workers: int = None,
+        document_cache: DocumentCache = None,
+    ):
+        """
+        Args:
+            space_manager (SpaceManager): Manager to resolve spaces with.
+                Defaults to the process-wide shared manager for the current
+                ``DARCA_SPACE_BASE``.
+            read_workers (int): Number of threads ``iter_files_content``
+                reads files with. Defaults to the
+                ``DARCA_SPACE_READ_WORKERS`` environment variable, or 1
+                (serial).
+            write_workers (int): Number of threads ``set_files`` writes
+                with. Defaults to the ``DARCA_SPACE_WRITE_WORKERS``
+                environment variable, or 1 (serial).
+            document_cache (DocumentCache): Opt-in cache of parsed
+                YAML/JSON documents used by ``get_file(..., load=True)``
+                and ``get_files``. Disabled by default.
+        """
+        self._space_manager = space_manager or get_shared_space_manager()
+        self.read_workers = (
+            read_workers
+            if read_workers is not None
+            else config.get_read_workers()
+        )
+        self.write_workers = (
+            write_workers
+            if write_workers is not None
+            else config.get_write_workers()
+        )
+        self._document_cache = document_cache
+        self._space_paths = {}
+        self._space_paths_generation = None
+        # Unknown space names -> when a full refresh last failed to find them
+        self._space_misses = {}
+        self._file_types = {}
+
+    def _check_space_paths(self):
+        """Drop cached resolutions and misses if the index changed."""
+        generation = self._space_manager.generation
+        if generation != self._space_paths_generation:
+            self._space_paths.clear()
+            self._space_misses.clear()
+            self._space_paths_generation = generation
+
+    def _get_space_path(self, space_name: str) -> Union[str, None]:
+        """
+        Resolve a space name to its root path.
+
+        Resolutions are cached until the index generation changes, which
+        covers both changes made through the SpaceManager and changes
+        picked up from other writers by ``sync_index()``. A full index
+        refresh is only done as a fallback when the space is unknown, so
+        spaces created outside the API are still found. Names the fallback
+        did not find are not rescanned again for ``SPACE_MISS_TTL`` seconds
+        or until the index changes.
+        """
+        self._space_manager.sync_index()
+        self._check_space_paths()
+
+        if space_name in self._space_paths:
+            return self._space_paths[space_name]
+
+        space = self._space_manager.get_space(space_name)
+        if not space and self._space_manager.lazy:
+            # Lazy managers defer reconciliation to an explicit call.
+            return None
+        if not space:
+            missed = self._space_misses.get(space_name, -SPACE_MISS_TTL)
+            if time.monotonic() - missed < SPACE_MISS_TTL:
+                return None
+            logger.debug(
+                f"Space '{space_name}' not in index, refreshing index."
+            )
+            self._space_manager.refresh_index()
+            self._check_space_paths()
             space = self._space_manager.get_space(space_name)
             if not space:
-                raise SpaceFileManagerException(
-                    message=f"Space '{space_name}' does not exist.",
-                    error_code="SPACE_NOT_FOUND",
-                    metadata={"space": space_name},
-                )
+                self._space_misses[space_name] = time.monotonic()
+                return None
+
+        self._space_paths[space_name] = space["path"]
+        return space["path"]
+
+    def _join_space_path(
+        self, space_name: str, space_path: str, relative_path: str
+    ) -> str:
+        """Join a relative path onto a resolved space, refusing escapes."""
+        full_path = os.path.normpath(os.path.join(space_path, relative_path))
 
-            space_path = space["path"]
-            full_path = os.path.normpath(
-                os.path.join(space_path, relative_path)
+        if not full_path.startswith(space_path):
+            raise SpaceFileManagerException(
+                message="Access outside space boundary is not allowed.",
+                error_code="INVALID_FILE_PATH",
+                metadata={"space": space_name, "resolved_path": full_path},
             )
 
-            if not full_path.startswith(space_path):
+        logger.debug(
+            f"Resolved file path for '{relative_path}' in "
+            f"space '{space_name}': {full_path}"
+        )
+        return full_path
+
+    def _resolve_file_path(self, space_name: str, relative_path: str) -> str:
+        try:
+            space_path = self._get_space_path(space_name)
+            if not space_path:
                 raise SpaceFileManagerException(
-                    message="Access outside space boundary is not allowed.",
-                    error_code="INVALID_FILE_PATH",
-                    metadata={"space": space_name, "resolved_path": full_path},
+                    message=f"Space '{space_name}' does not exist.",
+                    error_code="SPACE_NOT_FOUND",
+                    metadata={"space": space_name},
                 )
 
-            logger.debug(
-                f"Resolved file path for '{relative_path}' in "
-                f"space '{space_name}': {full_path}"
-            )
-            return full_path
+            return self._join_space_path(space_name, space_path, relative_path)
         except Exception:
             logger.error(
                 f"Failed to resolve file path in space '{space_name}'.",
@@ -91,6 +299,67 @@ class SpaceFileManager:
             )
             raise
 
+    def _load_document(
+        self, file_path: str, space_name: str, relative_path: str
+    ) -> Union[dict, list]:
+        """Parse a YAML/JSON file, through the document cache if enabled."""
+        cache = self._document_cache
+        if cache is not None:
+            stat = os.stat(file_path)
+            document = cache.get(space_name, file_path, stat)
+            if document is not None:
+                logger.debug(
+                    f"Using cached document '{relative_path}' "
+                    f"from space '{space_name}'."
+                )
+                return document
+
+        if file_path.endswith(".json"):
+            logger.debug(
+                f"Loading JSON file '{relative_path}' "
+                f"from space '{space_name}'."
+            )
+            with open(file_path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        else:
+            logger.debug(
+                f"Loading YAML file '{relative_path}' "
+                f"from space '{space_name}'."
+            )
+            document = YamlUtils.load_yaml_file(file_path)
+
+        if cache is not None:
+            cache.put(space_name, file_path, stat, document)
+        return document
+
+    def _forget_document(self, space_name: str, file_path: str):
+        if self._document_cache is not None:
+            self._document_cache.invalidate(space_name, file_path)
+
+    def _read_content(
+        self,
+        file_path: str,
+        space_name: str,
+        relative_path: str,
+        load: bool,
+    ) -> Union[str, dict]:
+        """Read a file, parsing YAML/JSON by extension when ``load``."""
+        if load:
+            if file_path.endswith((".yaml", ".yml", ".json")):
+                return self._load_document(
+                    file_path, space_name, relative_path
+                )
+            else:
+                logger.warning(
+                    f"Unsupported file type for loading: {relative_path}"
+                )
+
+        logger.debug(
+            f"Reading raw content from file '{relative_path}' in "
+            f"space '{space_name}'."
+        )
+        return FileUtils.read_file(file_path, mode="r", encoding="utf-8")
+
     def get_file(
         self, space_name: str, relative_path: str, load: bool = False
     ) -> Union[str, dict]:
@@ -101,31 +370,43 @@ class SpaceFileManager:
         )
 
         try:
-            if load:
-                if file_path.endswith((".yaml", ".yml")):
-                    logger.debug(
-                        f"Loading YAML file '{relative_path}' "
-                        f"from space '{space_name}'."
-                    )
-                    return YamlUtils.load_yaml_file(file_path)
-                elif file_path.endswith(".json"):
-                    logger.debug(
-                        f"Loading JSON file '{relative_path}' "
-                        f"from space '{space_name}'."
-                    )
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        return json.load(f)
-                else:
-                    logger.warning(
-                        f"Unsupported file type for loading: {relative_path}"
-                    )
+            return self._read_content(
+                file_path, space_name, relative_path, load
+            )
 
-            logger.debug(
-                f"Reading raw content from file '{relative_path}' in "
-                f"space '{space_name}'."
+        except Exception as e:
+            logger.error(
+                f"Failed to read file '{relative_path}' in "
+                f"space '{space_name}'.",
+                exc_info=True,
             )
-            return FileUtils.read_file(file_path, mode="r", encoding="utf-8")
+            raise SpaceFileManagerException(
+                message=(
+                    f"Failed to read file '{relative_path}' in "
+                    f"space '{space_name}'."
+                ),
+                error_code="FILE_READ_FAILED",
+                metadata={"space": space_name, "file": relative_path},
+                cause=e,
+            )
+
+    def get_file_bytes(self, space_name: str, relative_path: str) -> bytes:
+        """
+        Read a file's raw bytes, for binary artifacts ``get_file`` cannot
+        decode.
 
+        Raises:
+            SpaceFileManagerException: If the path escapes the space or the
+                file cannot be read.
+        """
+        file_path = self._resolve_file_path(space_name, relative_path)
+        logger.debug(
+            f"Reading bytes of file '{relative_path}' in space "
+            f"'{space_name}'."
+        )
+        try:
+            with open(file_path, "rb") as f:
+                return f.read()
         except Exception as e:
             logger.error(
                 f"Failed to read file '{relative_path}' in "
@@ -142,44 +423,343 @@ class SpaceFileManager:
                 cause=e,
             )
 
-    def set_file(
-        self, space_name: str, relative_path: str, content: Union[str, dict]
-    ) -> bool:
+    def open_mmap(
+        self, space_name: str, relative_path: str
+    ) -> Union[mmap.mmap, memoryview]:
+        """
+        Map a file read-only into memory, so large files can be consumed
+        without copying them.
+
+        The caller owns the mapping and should close it, e.g.::
+
+            with file_mgr.open_mmap("models", "weights.bin") as data:
+                header = data[:16]
+
+        Returns:
+            mmap.mmap: A read-only mapping of the file. Empty files cannot be
+            mapped and give an empty ``memoryview`` instead.
+
+        Raises:
+            SpaceFileManagerException: If the path escapes the space or the
+                file cannot be mapped.
+        """
         file_path = self._resolve_file_path(space_name, relative_path)
         logger.debug(
-            f"Writing to file '{relative_path}' in space '{space_name}'."
+            f"Mapping file '{relative_path}' in space '{space_name}'."
         )
+        try:
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return memoryview(b"")
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception as e:
+            logger.error(
+                f"Failed to map file '{relative_path}' in "
+                f"space '{space_name}'.",
+                exc_info=True,
+            )
+            raise SpaceFileManagerException(
+                message=(
+                    f"Failed to map file '{relative_path}' in "
+                    f"space '{space_name}'."
+                ),
+                error_code="FILE_MMAP_FAILED",
+                metadata={"space": space_name, "file": relative_path},
+                cause=e,
+            )
 
+    def open_read_stream(
+        self,
+        space_name: str,
+        relative_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> BinaryIO:
+        """
+        Open a file in a space for buffered binary reading.
+
+        Args:
+            chunk_size (int): Read buffer size in bytes.
+
+        Returns:
+            BinaryIO: A file object the caller must close.
+
+        Raises:
+            SpaceFileManagerException: If the path escapes the space or the
+                file cannot be opened.
+        """
+        file_path = self._resolve_file_path(space_name, relative_path)
         try:
-            if isinstance(content, dict):
-                if file_path.endswith((".yaml", ".yml")):
-                    YamlUtils.save_yaml_file(file_path, content)
-                elif file_path.endswith(".json"):
-                    json_content = json.dumps(content, indent=2)
-                    FileUtils.write_file(file_path, json_content)
-                else:
-                    raise SpaceFileManagerException(
-                        message="Unsupported file extension for dict content.",
-                        error_code="UNSUPPORTED_DICT_SERIALIZATION",
-                        metadata={
-                            "space": space_name,
-                            "file": relative_path,
-                            "type": str(type(content)),
-                        },
-                    )
-            elif isinstance(content, str):
-                FileUtils.write_file(file_path, content)
+            return open(file_path, "rb", buffering=chunk_size)
+        except Exception as e:
+            logger.error(
+                f"Failed to open file '{relative_path}' in "
+                f"space '{space_name}'.",
+                exc_info=True,
+            )
+            raise SpaceFileManagerException(
+                message=(
+                    f"Failed to read file '{relative_path}' in "
+                    f"space '{space_name}'."
+                ),
+                error_code="FILE_READ_FAILED",
+                metadata={"space": space_name, "file": relative_path},
+                cause=e,
+            )
+
+    def iter_chunks(
+        self,
+        space_name: str,
+        relative_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Yield a file's content in chunks of at most ``chunk_size`` bytes,
+        so only one chunk is held in memory at a time.
+
+        Raises:
+            SpaceFileManagerException: If the path escapes the space or the
+                file cannot be read.
+        """
+        with self.open_read_stream(space_name, relative_path, chunk_size) as f:
+            try:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+            except OSError as e:
+                raise SpaceFileManagerException(
+                    message=(
+                        f"Failed to read file '{relative_path}' in "
+                        f"space '{space_name}'."
+                    ),
+                    error_code="FILE_READ_FAILED",
+                    metadata={"space": space_name, "file": relative_path},
+                    cause=e,
+                )
+
+    def open_write_stream(
+        self,
+        space_name: str,
+        relative_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> SpaceFileWriter:
+        """
+        Open a file in a space for streaming writes.
+
+        The data lands atomically when the returned writer is closed; see
+        ``SpaceFileWriter``. Missing parent directories are created.
+
+        Args:
+            chunk_size (int): Write buffer size in bytes.
+
+        Raises:
+            SpaceFileManagerException: If the path escapes the space or the
+                temporary file cannot be created.
+        """
+        file_path = self._resolve_file_path(space_name, relative_path)
+        logger.debug(
+            f"Opening write stream for '{relative_path}' in "
+            f"space '{space_name}'."
+        )
+        try:
+            return SpaceFileWriter(
+                file_path,
+                chunk_size=chunk_size,
+                on_close=partial(self._forget_document, space_name, file_path),
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to open write stream for '{relative_path}' in "
+                f"space '{space_name}'.",
+                exc_info=True,
+            )
+            raise SpaceFileManagerException(
+                message=(
+                    f"Failed to write file '{relative_path}' in "
+                    f"space '{space_name}'."
+                ),
+                error_code="FILE_WRITE_FAILED",
+                metadata={"space": space_name, "file": relative_path},
+                cause=e,
+            )
+
+    def write_from_iterable(
+        self,
+        space_name: str,
+        relative_path: str,
+        chunks: Iterable[Union[bytes, str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Stream ``chunks`` (bytes, or text encoded as UTF-8) into a file,
+        replacing it atomically once the iterable is exhausted. If the
+        iterable raises, the previous file is left untouched.
+
+        Returns:
+            int: The number of bytes written.
+
+        Raises:
+            SpaceFileManagerException: If the path escapes the space or the
+                file cannot be written.
+        """
+        writer = self.open_write_stream(space_name, relative_path, chunk_size)
+        try:
+            with writer:
+                for chunk in chunks:
+                    writer.write(chunk)
+        except Exception as e:
+            logger.error(
+                f"Failed to write file '{relative_path}' in "
+                f"space '{space_name}'.",
+                exc_info=True,
+            )
+            raise SpaceFileManagerException(
+                message=(
+                    f"Failed to write file '{relative_path}' in "
+                    f"space '{space_name}'."
+                ),
+                error_code="FILE_WRITE_FAILED",
+                metadata={"space": space_name, "file": relative_path},
+                cause=e,
+            )
+        logger.info(
+            f"File '{relative_path}' successfully written in "
+            f"space '{space_name}' ({writer.bytes_written} bytes)."
+        )
+        return writer.bytes_written
+
+    def get_files(
+        self,
+        space_name: str,
+        paths: Iterable[str],
+        load: bool = True,
+        workers: Optional[int] = None,
+    ) -> Dict[str, dict]:
+        """
+        Read many files from a space in one call.
+
+        The space is resolved once and the files are read on a thread pool.
+        As with ``get_file``, ``load`` parses ``.yaml``/``.yml`` and
+        ``.json`` files and returns other files as text. A file that cannot
+        be read does not fail the batch.
+
+        Args:
+            space_name (str): The space to read from.
+            paths (Iterable[str]): Relative paths of the files.
+            load (bool): Parse YAML/JSON files by extension.
+            workers (int, optional): Number of reader threads. Defaults to
+                the manager's ``read_workers``.
+
+        Returns:
+            Dict[str, dict]: For each path, in input order,
+            ``{"content": str | dict | None, "error": Exception or None}``.
+            Errors are ``SpaceFileManagerException`` with code
+            ``FILE_READ_FAILED`` or ``INVALID_FILE_PATH``.
+
+        Raises:
+            SpaceFileManagerException: If the space doesn't exist.
+        """
+        paths = list(dict.fromkeys(paths))
+        logger.debug(
+            f"Reading {len(paths)} files in space '{space_name}' "
+            f"with load={load}."
+        )
+        space_path = self._get_space_path(space_name)
+        if not space_path:
+            raise SpaceFileManagerException(
+                message=f"Space '{space_name}' does not exist.",
+                error_code="SPACE_NOT_FOUND",
+                metadata={"space": space_name},
+            )
+
+        def read(relative_path):
+            try:
+                file_path = self._join_space_path(
+                    space_name, space_path, relative_path
+                )
+            except SpaceFileManagerException as e:
+                return {"content": None, "error": e}
+            try:
+                content = self._read_content(
+                    file_path, space_name, relative_path, load
+                )
+                return {"content": content, "error": None}
+            except Exception as e:
+                logger.warning(
+                    f"Failed to read file '{relative_path}' in space "
+                    f"'{space_name}': {e}"
+                )
+                return {
+                    "content": None,
+                    "error": SpaceFileManagerException(
+                        message=(
+                            f"Failed to read file '{relative_path}' in "
+                            f"space '{space_name}'."
+                        ),
+                        error_code="FILE_READ_FAILED",
+                        metadata={"space": space_name, "file": relative_path},
+                        cause=e,
+                    ),
+                }
+
+        workers = self.read_workers if workers is None else workers
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="space_file_reader"
+            ) as pool:
+                results = list(pool.map(read, paths))
+        else:
+            results = [read(path) for path in paths]
+        return dict(zip(paths, results))
+
+    def _write_content(
+        self,
+        file_path: str,
+        space_name: str,
+        relative_path: str,
+        content: Union[str, dict],
+    ):
+        """Serialise ``content`` by type and extension and write it."""
+        if isinstance(content, dict):
+            if relative_path.endswith((".yaml", ".yml")):
+                YamlUtils.save_yaml_file(file_path, content)
+            elif relative_path.endswith(".json"):
+                json_content = json.dumps(content, indent=2)
+                FileUtils.write_file(file_path, json_content)
             else:
                 raise SpaceFileManagerException(
-                    message="Unsupported content type for writing.",
-                    error_code="UNSUPPORTED_CONTENT_TYPE",
+                    message="Unsupported file extension for dict content.",
+                    error_code="UNSUPPORTED_DICT_SERIALIZATION",
                     metadata={
                         "space": space_name,
                         "file": relative_path,
                         "type": str(type(content)),
                     },
                 )
+        elif isinstance(content, str):
+            FileUtils.write_file(file_path, content)
+        else:
+            raise SpaceFileManagerException(
+                message="Unsupported content type for writing.",
+                error_code="UNSUPPORTED_CONTENT_TYPE",
+                metadata={
+                    "space": space_name,
+                    "file": relative_path,
+                    "type": str(type(content)),
+                },
+            )
+
+    def set_file(
+        self, space_name: str, relative_path: str, content: Union[str, dict]
+    ) -> bool:
+        file_path = self._resolve_file_path(space_name, relative_path)
+        logger.debug(
+            f"Writing to file '{relative_path}' in space '{space_name}'."
+        )
 
+        try:
+            self._write_content(file_path, space_name, relative_path, content)
             logger.info(
                 f"File '{relative_path}' successfully written in "
                 f"space '{space_name}'."
@@ -192,6 +772,217 @@ class SpaceFileManager:
                 exc_info=True,
             )
             raise
+        finally:
+            self._forget_document(space_name, file_path)
+
+    def set_files(
+        self,
+        space_name: str,
+        files: Dict[str, Union[str, dict]],
+        atomic: bool = False,
+        workers: Optional[int] = None,
+    ) -> Dict[str, dict]:
+        """
+        Write many files into a space in one call.
+
+        The space is resolved once, every parent directory is created once
+        and the files are written on a bounded thread pool. Content is
+        serialised exactly as ``set_file`` does.
+
+        With ``atomic`` the files are first written to a staging directory
+        inside the space and only moved into place when all of them were
+        written. If anything fails, no file in the space is changed and the
+        files that were already replaced are restored.
+
+        Args:
+            space_name (str): The space to write to.
+            files (Dict[str, str | dict]): Content by relative path.
+            atomic (bool): Apply all writes or none of them.
+            workers (int, optional): Number of writer threads. Defaults to
+                the manager's ``write_workers``.
+
+        Returns:
+            Dict[str, dict]: For each path, in input order,
+            ``{"success": bool, "error": Exception or None}``.
+
+        Raises:
+            SpaceFileManagerException: If the space doesn't exist, or, with
+                ``atomic``, if any file could not be written
+                (``BATCH_WRITE_FAILED``, per-file results in metadata).
+        """
+        logger.debug(
+            f"Writing {len(files)} files in space '{space_name}' "
+            f"(atomic={atomic})."
+        )
+        space_path = self._get_space_path(space_name)
+        if not space_path:
+            raise SpaceFileManagerException(
+                message=f"Space '{space_name}' does not exist.",
+                error_code="SPACE_NOT_FOUND",
+                metadata={"space": space_name},
+            )
+
+        errors = {}
+        targets = {}
+        for relative_path in files:
+            try:
+                target = self._join_space_path(
+                    space_name, space_path, relative_path
+                )
+            except SpaceFileManagerException as e:
+                errors[relative_path] = e
+                continue
+            if os.path.isdir(target):
+                # Refused like set_file does; replacing it would discard
+                # the directory's content
+                errors[relative_path] = _is_a_directory(target)
+                continue
+            targets[relative_path] = target
+
+        staging = None
+        if atomic and not errors:
+            staging = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=space_path)
+        try:
+            if not atomic or staging:
+                errors.update(
+                    self._write_batch(
+                        space_name,
+                        space_path,
+                        files,
+                        targets,
+                        staging,
+                        self.write_workers if workers is None else workers,
+                    )
+                )
+            if staging and not errors:
+                self._commit_staged(space_path, targets, staging)
+        except Exception as e:
+            logger.error(
+                f"Failed to apply staged files in space '{space_name}'.",
+                exc_info=True,
+            )
+            errors = {path: e for path in files}
+        finally:
+            if staging:
+                shutil.rmtree(staging, ignore_errors=True)
+            for target in targets.values():
+                self._forget_document(space_name, target)
+
+        results = {
+            path: {
+                "success": path not in errors and not (atomic and errors),
+                "error": errors.get(path),
+            }
+            for path in files
+        }
+        if atomic and errors:
+            raise SpaceFileManagerException(
+                message=(
+                    f"Failed to write {len(errors)} of {len(files)} files "
+                    f"in space '{space_name}'; no file was changed."
+                ),
+                error_code="BATCH_WRITE_FAILED",
+                metadata={"space": space_name, "results": results},
+                cause=next(iter(errors.values())),
+            )
+        logger.info(
+            f"{len(files) - len(errors)} of {len(files)} files written in "
+            f"space '{space_name}'."
+        )
+        return results
+
+    def _write_batch(
+        self,
+        space_name: str,
+        space_path: str,
+        files: Dict[str, Union[str, dict]],
+        targets: Dict[str, str],
+        staging: Optional[str],
+        workers: int,
+    ) -> Dict[str, Exception]:
+        """
+        Write ``files`` to their targets (or their place under ``staging``)
+        and return the errors by relative path.
+        """
+        destinations = {
+            path: (
+                os.path.join(staging, os.path.relpath(target, space_path))
+                if staging
+                else target
+            )
+            for path, target in targets.items()
+        }
+        # A parent that cannot be created only fails the files below it
+        failed_directories = {}
+        for directory in sorted(
+            {os.path.dirname(d) for d in destinations.values()}
+        ):
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError as e:
+                failed_directories[directory] = e
+
+        def write(path):
+            error = failed_directories.get(os.path.dirname(destinations[path]))
+            if error is not None:
+                logger.warning(
+                    f"Failed to create the directory of '{path}' in space "
+                    f"'{space_name}': {error}"
+                )
+                return path, error
+            try:
+                self._write_content(
+                    destinations[path], space_name, path, files[path]
+                )
+                return path, None
+            except Exception as e:
+                logger.warning(
+                    f"Failed to write file '{path}' in space "
+                    f"'{space_name}': {e}"
+                )
+                return path, e
+
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="space_file_writer"
+            ) as pool:
+                outcomes = list(pool.map(write, destinations))
+        else:
+            outcomes = [write(path) for path in destinations]
+        return {path: e for path, e in outcomes if e is not None}
+
+    def _commit_staged(
+        self, space_path: str, targets: Dict[str, str], staging: str
+    ):
+        """
+        Move staged files into place. Replaced files are kept under the
+        staging directory until every move succeeded, so a failure part way
+        restores the previous state.
+        """
+        backups = os.path.join(staging, STAGING_BACKUP)
+        for target in targets.values():
+            if os.path.isdir(target):
+                # Created since set_files checked; never move it aside
+                raise _is_a_directory(target)
+        applied = []
+        try:
+            for target in targets.values():
+                relative = os.path.relpath(target, space_path)
+                backup = None
+                if os.path.lexists(target):
+                    backup = os.path.join(backups, relative)
+                    os.makedirs(os.path.dirname(backup), exist_ok=True)
+                    os.replace(target, backup)
+                applied.append((target, backup))
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(os.path.join(staging, relative), target)
+        except Exception:
+            for target, backup in reversed(applied):
+                if backup:
+                    os.replace(backup, target)
+                elif os.path.lexists(target):
+                    os.remove(target)
+            raise
 
     def delete_file(self, space_name: str, relative_path: str) -> bool:
         file_path = self._resolve_file_path(space_name, relative_path)
@@ -213,11 +1004,13 @@ class SpaceFileManager:
                 exc_info=True,
             )
             raise
+        finally:
+            self._forget_document(space_name, file_path)
 
     def list_files(self, space_name: str, recursive: bool = True) -> List[str]:
         try:
-            space = self._space_manager.get_space(space_name)
-            if not space:
+            space_path = self._get_space_path(space_name)
+            if not space_path:
                 raise SpaceFileManagerException(
                     message=f"Space '{space_name}' not found.",
                     error_code="SPACE_NOT_FOUND",
@@ -225,7 +1018,7 @@ class SpaceFileManager:
                 )
 
             files = DirectoryUtils.list_directory(
-                space["path"], recursive=recursive
+                space_path, recursive=recursive
             )
             logger.info(
                 f"Listed files in space '{space_name}' "
@@ -238,87 +1031,244 @@ class SpaceFileManager:
             )
             raise
 
-    def list_files_content(self, space_name: str) -> List[dict]:
+    def _walk_files(
+        self, space_path: str
+    ) -> Iterator[Tuple[str, os.DirEntry]]:
         """
-        Return a list describing each file within a space, including the
-        file's relative path, type ('ascii' or 'binary'), and content if ascii.
+        Yield ``(relative_path, DirEntry)`` for every file below
+        ``space_path``. Names are sorted and the files of a directory come
+        before those of its subdirectories.
 
-        The output is a list of dicts:
-        [
-        {
-        "file_name": <relative path to file>,
-        "file_content": <ASCII text content or None>,
-        "type": "ascii" or "binary"
-        },
-        ...
-        ]
+        Entries are produced while the tree is walked, so nothing is held in
+        memory beyond the directories still to visit. The ``DirEntry`` carries
+        the stat data scandir already fetched for filtering.
+        """
+        stack = [(space_path, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            subdirs = []
+            for entry in entries:
+                relative = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, relative + os.sep))
+                elif entry.is_file():
+                    yield relative, entry
+            stack.extend(reversed(subdirs))
+
+    def _read_classified(
+        self,
+        path: str,
+        stat: os.stat_result,
+        max_bytes: Optional[int],
+        include_content: bool,
+    ) -> Tuple[str, Optional[bytes]]:
+        """
+        Classify a file as ``ascii`` or ``binary`` and optionally read it.
+
+        A leading chunk of ``SNIFF_BYTES`` is always inspected first, also
+        when ``max_bytes`` is smaller; binary files are never read past it.
+        Classifications are cached by inode, size and mtime, so unchanged
+        files are not opened again unless their content is requested.
+
+        Returns:
+            Tuple[str, Optional[bytes]]: The file type and, for ascii files
+            when ``include_content`` is set, the (possibly truncated) bytes.
+        """
+        key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        file_type = self._file_types.get(key)
+        if file_type == "binary" or (file_type and not include_content):
+            return file_type, None
+
+        # Always classify from a full sniff, even if less content is wanted,
+        # so the cached type does not depend on ``max_bytes``
+        with open(path, "rb") as f:
+            raw_data = f.read(SNIFF_BYTES)
+            binary = _looks_binary(raw_data)
+            if include_content and not binary:
+                if max_bytes is not None and max_bytes <= len(raw_data):
+                    raw_data = raw_data[:max_bytes]
+                elif len(raw_data) == SNIFF_BYTES:
+                    rest = f.read(
+                        -1 if max_bytes is None else max_bytes - SNIFF_BYTES
+                    )
+                    raw_data += rest
+                    binary = _looks_binary(rest)
+
+        file_type = "binary" if binary else "ascii"
+        if len(self._file_types) >= FILE_TYPE_CACHE_SIZE:
+            self._file_types.clear()
+        self._file_types[key] = file_type
+        return file_type, raw_data if include_content and not binary else None
+
+    def _describe_file(
+        self,
+        relative: str,
+        entry: os.DirEntry,
+        max_bytes: Optional[int],
+        max_file_size: Optional[int],
+        include_content: bool,
+    ) -> Tuple[str, Optional[dict], Optional[Exception]]:
+        """
+        Build the ``iter_files_content`` entry for one file.
+
+        Errors are returned rather than raised so that they can be reported
+        by the consuming thread, in walk order, when reading in parallel.
+
+        Returns:
+            Tuple: ``(relative, description, error)``. The description is
+            None if the file was filtered out by size or could not be read.
+        """
+        try:
+            stat = entry.stat()
+            if max_file_size is not None and stat.st_size > max_file_size:
+                return relative, None, None
+            file_type, raw_data = self._read_classified(
+                entry.path, stat, max_bytes, include_content
+            )
+        except Exception as file_err:
+            return relative, None, file_err
+
+        return (
+            relative,
+            {
+                "file_name": relative,
+                "file_content": (
+                    raw_data.decode("ascii") if raw_data is not None else None
+                ),
+                "type": file_type,
+                "size": stat.st_size,
+                "truncated": (
+                    raw_data is not None and len(raw_data) < stat.st_size
+                ),
+            },
+            None,
+        )
+
+    def _describe_in_order(
+        self,
+        describe: Callable,
+        files: Iterable[Tuple[str, os.DirEntry]],
+        workers: int,
+    ) -> Iterator[Tuple[str, Optional[dict], Optional[Exception]]]:
+        """
+        Run ``describe`` over ``files`` on a thread pool, yielding results in
+        the order of ``files``.
+
+        Files are handed to the pool in batches of ``READ_BATCH`` to keep the
+        per-task overhead small, and at most ``workers * READ_AHEAD`` batches
+        are in flight, which keeps memory bounded while the consumer is
+        slower than the readers.
+        """
+
+        def describe_batch(batch):
+            return [describe(*item) for item in batch]
+
+        pending = deque()
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="space_file_reader"
+        ) as pool:
+            try:
+                batch = []
+                for item in files:
+                    batch.append(item)
+                    if len(batch) < READ_BATCH:
+                        continue
+                    pending.append(pool.submit(describe_batch, batch))
+                    batch = []
+                    if len(pending) >= workers * READ_AHEAD:
+                        yield from pending.popleft().result()
+                if batch:
+                    pending.append(pool.submit(describe_batch, batch))
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                # Stop queued reads when the consumer stops early
+                for future in pending:
+                    future.cancel()
+
+    def iter_files_content(
+        self,
+        space_name: str,
+        max_bytes: Optional[int] = None,
+        max_file_size: Optional[int] = None,
+        extensions: Optional[Iterable[str]] = None,
+        include_content: bool = True,
+        workers: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """
+        Lazily yield a description of each file within a space.
+
+        Files are read one at a time while the space is walked, so memory
+        use is bounded by ``max_bytes`` (or the largest file) regardless of
+        the size of the space. Each yielded dict has the keys of
+        ``list_files_content`` plus:
+
+        - ``size``: the size of the file on disk in bytes.
+        - ``truncated``: True if only the first ``max_bytes`` were read.
 
         Args:
             space_name (str): The space to scan.
+            max_bytes (int, optional): Read at most this many bytes per file.
+            max_file_size (int, optional): Skip files larger than this many
+                bytes without opening them.
+            extensions (Iterable[str], optional): Only include files whose
+                name ends with one of these suffixes (e.g. ``[".txt"]``).
+            include_content (bool): If False, files are only classified from
+                their leading bytes and ``file_content`` is always None.
+            workers (int, optional): Number of reader threads. Defaults to
+                the manager's ``read_workers``. Entries are yielded in the
+                same order either way.
 
-        Returns:
-            List[dict]: A list of file info dictionaries.
+        Yields:
+            dict: One file info dictionary per file.
 
         Raises:
             SpaceFileManagerException: If the space doesn't exist or if any
                                     unexpected I/O errors occur.
         """
-        logger.debug(f"Collecting file contents in space '{space_name}'.")
+        logger.debug(f"Streaming file contents in space '{space_name}'.")
+        suffixes = tuple(extensions) if extensions is not None else None
         try:
-            # 1. Refresh the space index to ensure we have the latest info
-            self._space_manager.refresh_index()
-            # 2. Verify the space exists
-            space = self._space_manager.get_space(space_name)
-            if not space:
+            # 1. Resolve the space (cached until the index changes)
+            space_path = self._get_space_path(space_name)
+            if not space_path:
                 raise SpaceFileManagerException(
                     message=f"Space '{space_name}' not found.",
                     error_code="SPACE_NOT_FOUND",
                     metadata={"space": space_name},
                 )
 
-            # 3. Recursively list all entries in the space
-            all_entries = DirectoryUtils.list_directory(
-                space["path"], recursive=True
-            )
-
-            results = []
-            for entry in all_entries:
-                full_path = os.path.join(space["path"], entry)
-
-                # 4. Determine if file is ASCII or binary
-                try:
-                    if os.path.isfile(full_path):
-                        with open(full_path, "rb") as f:
-                            raw_data = f.read()
-
-                        try:
-                            # Attempt ASCII decode
-                            text_data = raw_data.decode("ascii")
-                            results.append(
-                                {
-                                    "file_name": entry,
-                                    "file_content": text_data,
-                                    "type": "ascii",
-                                }
-                            )
-                        except UnicodeDecodeError:
-                            # Mark as binary
-                            results.append(
-                                {
-                                    "file_name": entry,
-                                    "file_content": None,
-                                    "type": "binary",
-                                }
-                            )
-
-                except Exception as file_err:
+            # 2. Walk the space, filtering on name before anything is read
+            files = (
+                (relative, entry)
+                for relative, entry in self._walk_files(space_path)
+                if suffixes is None or relative.endswith(suffixes)
+            )
+
+            # 3. Classify each file, reading content only if asked to
+            describe = partial(
+                self._describe_file,
+                max_bytes=max_bytes,
+                max_file_size=max_file_size,
+                include_content=include_content,
+            )
+            workers = self.read_workers if workers is None else workers
+            if workers > 1:
+                outcomes = self._describe_in_order(describe, files, workers)
+            else:
+                outcomes = (describe(*item) for item in files)
+
+            for relative, description, file_err in outcomes:
+                if file_err is not None:
                     # Log a warning but skip this file
                     logger.warning(
-                        f"Failed to read file '{entry}' in space "
+                        f"Failed to read file '{relative}' in space "
                         f"'{space_name}': {file_err}"
                     )
-
-            return results
+                elif description is not None:
+                    yield description
 
         except Exception as e:
             logger.error(
@@ -334,12 +1284,53 @@ class SpaceFileManager:
                 cause=e,
             )
 
+    def list_files_content(
+        self, space_name: str, include_content: bool = True
+    ) -> List[dict]:
+        """
+        Return a list describing each file within a space, including the
+        file's relative path, type ('ascii' or 'binary'), and content if ascii.
+
+        The output is a list of dicts:
+        [
+        {
+        "file_name": <relative path to file>,
+        "file_content": <ASCII text content or None>,
+        "type": "ascii" or "binary",
+        "size": <size in bytes>,
+        "truncated": False
+        },
+        ...
+        ]
+
+        This materialises ``iter_files_content``; prefer the iterator for
+        large spaces.
+
+        Args:
+            space_name (str): The space to scan.
+            include_content (bool): If False, only classify files from their
+                leading bytes and leave ``file_content`` as None.
+
+        Returns:
+            List[dict]: A list of file info dictionaries.
+
+        Raises:
+            SpaceFileManagerException: If the space doesn't exist or if any
+                                    unexpected I/O errors occur.
+        """
+        logger.debug(f"Collecting file contents in space '{space_name}'.")
+        return list(
+            self.iter_files_content(
+                space_name, include_content=include_content
+            )
+        )
+
     def get_file_last_modified(
         self, space_name: str, relative_path: str
     ) -> float:
+        file_path = self._resolve_file_path(space_name, relative_path)
 
-        # Use the class's file_exists method to confirm the file is present.
-        if not self.file_exists(space_name, relative_path):
+        if not FileUtils.file_exist(file_path):
             raise SpaceFileManagerException(
                 message=(
                     f"File '{relative_path}' does not exist "
@@ -349,9 +1340,6 @@ class SpaceFileManager:
                 metadata={"space": space_name, "file": relative_path},
             )
 
-        # Now retrieve the actual file path for the os.path.getmtime call.
-        file_path = self._resolve_file_path(space_name, relative_path)
-
         try:
             return os.path.getmtime(file_path)
         except Exception as e:
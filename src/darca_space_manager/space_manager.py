@@ -12,24 +12,31 @@ FIXME Add a way to rename spaces.
 FIXME Add a way to move spaces.
 """
 
+import contextlib
 import datetime
+import functools
 import os
-from typing import Dict, List, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Union
 
 from darca_exception.exception import DarcaException
-from darca_file_utils.directory_utils import (
-    DirectoryUtils,
-    DirectoryUtilsException,
-)
-from darca_file_utils.file_utils import FileUtils
+from darca_file_utils.directory_utils import DirectoryUtils
 from darca_log_facility.logger import DarcaLogger
 from darca_yaml.yaml_utils import YamlUtils
 
 from darca_space_manager import config
+from darca_space_manager.index_store import YamlIndexStore, get_index_store
 
 logger = DarcaLogger(name="space_manager").get_logger()
 
 METADATA_FILENAME = "metadata.yaml"
+# Optional per-directory list of subdirectories (one relative path per line)
+# that discovery should not descend into, e.g. large data directories.
+IGNORE_FILENAME = ".spaceignore"
+# Seconds a space name that a full refresh did not find is reported missing
+# by the facades without rescanning, unless the index changes meanwhile.
+SPACE_MISS_TTL = 5.0
 
 
 class SpaceManagerException(DarcaException):
@@ -42,25 +49,214 @@ class SpaceManagerException(DarcaException):
         )
 
 
+def _synchronized(method):
+    """Run a SpaceManager method under the instance lock."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _transactional(method):
+    """Run a SpaceManager method inside an index write transaction."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._index_transaction():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _read_ignore_file(path: str) -> set:
+    """Parse an ignore file into a set of normalized relative paths."""
+    ignored = set()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    ignored.add(os.path.normpath(line.strip("/")))
+    except OSError as e:
+        logger.warning(f"⚠️ Failed to read ignore file {path}: {e}")
+    return ignored
+
+
+def walk_directories(
+    directory: str,
+) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """
+    Yield ``(path, entries)`` for ``directory`` and every directory below
+    it, in sorted depth-first order.
+
+    Uses ``os.scandir`` so each directory costs a single listing call and
+    no file list is materialised. Symlinked directories are not followed.
+    Subdirectories named in an ``IGNORE_FILENAME`` file are skipped
+    together with their subtree.
+    """
+    # Stack of (directory, ignored paths relative to that directory)
+    stack = [(directory, set())]
+    while stack:
+        current, inherited = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError as e:
+            if current == directory:
+                raise
+            logger.warning(f"⚠️ Skipping unreadable directory {current}: {e}")
+            continue
+
+        yield current, entries
+
+        subdirs = []
+        ignored = inherited
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.name)
+            elif entry.name == IGNORE_FILENAME:
+                ignored = ignored | _read_ignore_file(entry.path)
+
+        for name in sorted(subdirs, reverse=True):
+            if name in ignored:
+                logger.debug(
+                    f"⏭️ Skipping ignored directory "
+                    f"{os.path.join(current, name)}"
+                )
+                continue
+            # Carry deeper ignore entries down, relative to the child
+            prefix = name + os.sep
+            nested = {
+                p.split(os.sep, 1)[1] for p in ignored if p.startswith(prefix)
+            }
+            stack.append((os.path.join(current, name), nested))
+
+
+def discover_metadata_files(directory: str) -> Iterator[str]:
+    """Yield the full path of every metadata file below ``directory``."""
+    for _, entries in walk_directories(directory):
+        for entry in entries:
+            if entry.name == METADATA_FILENAME and not entry.is_dir(
+                follow_symlinks=False
+            ):
+                yield entry.path
+
+
+def load_space_metadata(full_path: str) -> tuple:
+    """
+    Load and validate one metadata file.
+
+    Returns:
+        tuple: ``(metadata, None)`` for a valid space, or
+        ``(None, reason)`` if the file must be skipped.
+    """
+    try:
+        metadata = YamlUtils.load_yaml_file(full_path)
+    except Exception as e:
+        return None, f"failed to load ({e})"
+    if not isinstance(metadata, dict) or not all(
+        k in metadata for k in ["name", "label", "path", "created_at"]
+    ):
+        return None, "incomplete metadata"
+    return metadata, None
+
+
+def _space_under(space: dict, path: str, nested: bool = True) -> bool:
+    """Whether ``space`` is rooted at ``path`` (or, nested, below it)."""
+    if space["path"] == path:
+        return True
+    return nested and space["path"].startswith(os.path.join(path, ""))
+
+
+def _same_spaces(first: List[dict], second: List[dict]) -> bool:
+    """Whether two lists hold the same space records, in any order."""
+
+    def key(space):
+        return space["name"], space["path"]
+
+    return len(first) == len(second) and sorted(first, key=key) == sorted(
+        second, key=key
+    )
+
+
 class SpaceManager:
-    def __init__(self):
+    def __init__(
+        self,
+        metadata_workers: int = None,
+        index_backend: str = None,
+        lazy: bool = None,
+    ):
+        """
+        Args:
+            metadata_workers (int): Number of threads used to load
+                metadata files during discovery. Defaults to the
+                ``DARCA_SPACE_METADATA_WORKERS`` environment variable, or 1
+                (serial loading).
+            index_backend (str): Index store backend (``jsonl``,
+                ``sqlite`` or ``yaml``). Defaults to the
+                ``DARCA_SPACE_INDEX_BACKEND`` environment variable, or
+                ``jsonl``.
+            lazy (bool): Trust the persisted index instead of rediscovering
+                all spaces on startup. Space records are then fetched one at
+                a time on first access, and reconciliation only happens on
+                ``refresh_index()`` or ``reconcile_in_background()``.
+                Defaults to the ``DARCA_SPACE_LAZY`` environment variable.
+        """
         config.ensure_directories_exist()
         dirs = config.get_directories()
         self.space_dir = dirs["SPACE_DIR"]
+        self.metadata_workers = (
+            metadata_workers
+            if metadata_workers is not None
+            else config.get_metadata_workers()
+        )
+        self._store = get_index_store(
+            index_backend or config.get_index_backend(),
+            dirs["METADATA_DIR"],
+        )
+        self.last_scan_issues = []
+        self._index_stamp = None
+        self._by_name = {}
+        self._by_label = {}
+        self._lookup_source = None
+        self._lock = threading.RLock()
+        self._in_transaction = False
+        self._generation = None
+        self.lazy = lazy if lazy is not None else config.get_lazy_discovery()
+        if self.lazy and self._store.exists():
+            # Only the in-memory cache starts empty; records are fetched
+            # from the store as they are needed.
+            self._complete = False
+            self._index_stamp = self._stat_index()
+            self._generation = self._store.generation()
+            self.index = {"spaces": []}
+            logger.info("✅ SpaceManager initialized (lazy).")
+            return
+        self._complete = True
         self.index = self._load_index()
         self.refresh_index()
         logger.info("✅ SpaceManager initialized and index refreshed.")
 
+    def _stat_index(self) -> Union[tuple, None]:
+        """Cheap change marker for the persisted index (see IndexStore)."""
+        return self._store.stamp()
+
     def _load_index(self) -> Dict:
         try:
-            index_file = os.path.join(
-                config.get_directories()["METADATA_DIR"], "spaces_index.yaml"
-            )
-            if not FileUtils.file_exist(index_file):
+            self._index_stamp = self._stat_index()
+            self._generation = self._store.generation()
+            if not self._store.exists():
+                legacy = YamlIndexStore(os.path.dirname(self._store.path))
+                if legacy.path != self._store.path and legacy.exists():
+                    logger.info("ℹ️ Importing legacy YAML index.")
+                    return legacy.load()
                 logger.info("ℹ️ Index file not found. Initializing new index.")
                 return {"spaces": []}
             logger.debug("🔍 Loading index file.")
-            return YamlUtils.load_yaml_file(index_file)
+            return self._store.load()
         except Exception as e:
             logger.error("❌ Failed to load index file.", exc_info=True)
             raise SpaceManagerException(
@@ -71,10 +267,10 @@ class SpaceManager:
 
     def _save_index(self):
         try:
-            index_file = os.path.join(
-                config.get_directories()["METADATA_DIR"], "spaces_index.yaml"
-            )
-            YamlUtils.save_yaml_file(index_file, self.index)
+            with self._index_transaction():
+                self._store.save(self.index)
+                self._generation = self._store.bump_generation()
+                self._index_stamp = self._stat_index()
             logger.debug("💾 Index successfully saved.")
         except Exception as e:
             logger.error("❌ Failed to save index.", exc_info=True)
@@ -84,6 +280,49 @@ class SpaceManager:
                 cause=e,
             )
 
+    def _save_delta(self, apply, *args):
+        """Persist a single index change through the store."""
+        try:
+            with self._index_transaction():
+                apply(*args)
+                self._generation = self._store.bump_generation()
+                self._index_stamp = self._stat_index()
+            logger.debug("💾 Index change successfully saved.")
+        except Exception as e:
+            logger.error("❌ Failed to save index change.", exc_info=True)
+            raise SpaceManagerException(
+                "Failed to save spaces index.",
+                error_code="INDEX_SAVE_FAILED",
+                cause=e,
+            )
+
+    def export_index(self, path: str = None) -> str:
+        """
+        Export the persisted index in the YAML index format.
+
+        Args:
+            path (str): Destination file. Defaults to ``spaces_index.yaml``
+                in the metadata directory.
+
+        Returns:
+            str: The path that was written.
+        """
+        path = path or os.path.join(
+            os.path.dirname(self._store.path), YamlIndexStore.filename
+        )
+        try:
+            self._store.export_yaml(path)
+            logger.info(f"📤 Index exported to '{path}'.")
+            return path
+        except Exception as e:
+            logger.error("❌ Failed to export index.", exc_info=True)
+            raise SpaceManagerException(
+                "Failed to export spaces index.",
+                error_code="INDEX_EXPORT_FAILED",
+                metadata={"path": path},
+                cause=e,
+            )
+
     def _generate_metadata(self, name: str, label: str, path: str) -> dict:
         return {
             "name": name,
@@ -96,41 +335,41 @@ class SpaceManager:
         }
 
     def _scan_directory(self, directory: str) -> List[dict]:
-        """Scan using DirectoryUtils for all metadata.yaml files."""
+        """
+        Discover all spaces below ``directory`` via their metadata.yaml.
+
+        With ``metadata_workers`` > 1 the metadata files are loaded on a
+        thread pool while the walk continues. Results keep discovery order
+        either way, and skipped files are reported in a single warning and
+        kept in ``last_scan_issues``.
+        """
         discovered = []
+        issues = []
 
         try:
-            all_files = DirectoryUtils.list_directory(
-                directory, recursive=True
-            )
-            metadata_files = [
-                f
-                for f in all_files
-                if os.path.basename(f) == METADATA_FILENAME
-            ]
-
-            for rel_path in metadata_files:
-                full_path = os.path.join(directory, rel_path)
-                try:
-                    metadata = YamlUtils.load_yaml_file(full_path)
-                    if all(
-                        k in metadata
-                        for k in ["name", "label", "path", "created_at"]
-                    ):
-                        discovered.append(metadata)
-                        logger.debug(
-                            f"🔎 Discovered valid space: {metadata['name']} at "
-                            f"{metadata['path']}"
-                        )
-                    else:
-                        logger.warning(
-                            f"⚠️ Incomplete metadata in {full_path}, skipping."
-                        )
-                except Exception as e:
-                    logger.warning(
-                        f"⚠️ Failed to load metadata in {full_path}: {e}"
-                    )
-        except DirectoryUtilsException as e:
+            paths = discover_metadata_files(directory)
+            if self.metadata_workers > 1:
+                with ThreadPoolExecutor(
+                    max_workers=self.metadata_workers,
+                    thread_name_prefix="space_metadata",
+                ) as pool:
+                    futures = [
+                        (p, pool.submit(load_space_metadata, p)) for p in paths
+                    ]
+                    results = [(p, f.result()) for p, f in futures]
+            else:
+                results = [(p, load_space_metadata(p)) for p in paths]
+
+            for full_path, (metadata, problem) in results:
+                if problem:
+                    issues.append(f"{full_path}: {problem}")
+                    continue
+                discovered.append(metadata)
+                logger.debug(
+                    f"🔎 Discovered valid space: {metadata['name']} at "
+                    f"{metadata['path']}"
+                )
+        except OSError as e:
             raise SpaceManagerException(
                 "Failed to scan directory.",
                 error_code="DIRECTORY_SCAN_FAILED",
@@ -141,6 +380,12 @@ class SpaceManager:
                 "Unexpected error during directory scan.", cause=e
             )
 
+        self.last_scan_issues = issues
+        if issues:
+            logger.warning(
+                f"⚠️ Skipped {len(issues)} space(s) with invalid metadata:\n"
+                + "\n".join(issues)
+            )
         return discovered
 
     def _get_space_path(self, name: str) -> str:
@@ -156,27 +401,298 @@ class SpaceManager:
             )
         return space["path"]
 
+    def _lookup(self) -> Dict[str, dict]:
+        """
+        Return the name -> space map for the current index, rebuilding the
+        name and label maps when ``self.index["spaces"]`` was replaced.
+        """
+        spaces = self.index["spaces"]
+        if spaces is None or spaces is not self._lookup_source:
+            by_name, by_label = {}, {}
+            for space in spaces:
+                if space["name"] in by_name:
+                    continue
+                by_name[space["name"]] = space
+                by_label.setdefault(space.get("label"), {})[
+                    space["name"]
+                ] = None
+            self._by_name, self._by_label = by_name, by_label
+            self._lookup_source = spaces
+        return self._by_name
+
+    def _remember(self, metadata: dict):
+        """Add a space record to the in-memory index and lookup maps."""
+        by_name = self._lookup()
+        self.index["spaces"].append(metadata)
+        by_name[metadata["name"]] = metadata
+        self._by_label.setdefault(metadata.get("label"), {})[
+            metadata["name"]
+        ] = None
+
+    def _index_add(self, metadata: dict):
+        """Apply a single created space to the index and persist it."""
+        self._remember(metadata)
+        self._save_delta(self._store.add, metadata)
+        logger.debug(f"➕ Added space '{metadata['name']}' to index.")
+
+    def _index_remove_tree(self, path: str, nested: bool = True) -> List[str]:
+        """
+        Drop the space at ``path`` and, with ``nested``, any space nested
+        below it from the index and persist the change. Returns the names
+        that were removed.
+        """
+        self._ensure_complete()
+        removed = [
+            s["name"]
+            for s in self.index["spaces"]
+            if _space_under(s, path, nested)
+        ]
+        self._lookup()
+        self.index["spaces"] = [
+            s for s in self.index["spaces"] if s["name"] not in removed
+        ]
+        for name in removed:
+            space = self._by_name.pop(name, None)
+            if space is not None:
+                self._by_label.get(space.get("label"), {}).pop(name, None)
+        self._lookup_source = self.index["spaces"]
+        self._save_delta(self._store.remove, removed)
+        logger.debug(f"➖ Removed spaces {removed} from index.")
+        return removed
+
+    def _reload(self):
+        """Replace the in-memory index with the persisted one."""
+        logger.debug("🔁 Index changed by another writer, reloading.")
+        if self._complete:
+            self.index = self._load_index()
+        else:
+            # Drop the records fetched so far; they are re-fetched on use.
+            self._index_stamp = self._stat_index()
+            self._generation = self._store.generation()
+            self.index = {"spaces": []}
+
+    @contextlib.contextmanager
+    def _index_transaction(self):
+        """
+        Serialize index writers across threads and processes. The outermost
+        transaction holds the exclusive index lock and first reloads the
+        index if another writer bumped the generation counter, so checks
+        made inside it (e.g. duplicate names) see every committed change.
+        Nested calls join the running transaction.
+        """
+        with self._lock:
+            if self._in_transaction:
+                yield
+                return
+            with self._store.locked():
+                self._in_transaction = True
+                try:
+                    if self._store.generation() != self._generation:
+                        self._reload()
+                    yield
+                finally:
+                    self._in_transaction = False
+
+    @property
+    def generation(self):
+        """
+        Index generation as of this instance's last load or save. It changes
+        with every index write, local or from another writer, so callers
+        can key caches derived from the index on it.
+        """
+        return self._generation
+
+    @_synchronized
+    def sync_index(self) -> bool:
+        """
+        Reload the persisted index if another writer changed it since this
+        instance last loaded or saved it. The common case is a single stat
+        call; the generation counter is only read when the stat changed.
+
+        Returns:
+            bool: True if the index was reloaded.
+        """
+        if self._in_transaction or self._stat_index() == self._index_stamp:
+            return False
+        with self._store.locked(exclusive=False):
+            if self._store.generation() == self._generation:
+                self._index_stamp = self._stat_index()
+                return False
+            self._reload()
+        return True
+
+    @_synchronized
+    def _ensure_complete(self):
+        """Load the full catalogue if only single records were fetched."""
+        if not self._complete:
+            logger.debug("📥 Loading full index from store.")
+            self.index = self._load_index()
+            self._complete = True
+
+    @_synchronized
+    def _fetch_space(self, name: str) -> Union[dict, None]:
+        """
+        Lazy mode lookup for a space that is not cached yet. The record is
+        read from the index store and checked against its metadata file; a
+        space that is not in the store is probed at its default location
+        under the space directory.
+        """
+        space = self._lookup().get(name)
+        if space is not None:
+            return space
+
+        space = self._store.get(name)
+        if space is not None and not os.path.isfile(
+            os.path.join(space["path"], METADATA_FILENAME)
+        ):
+            logger.info(f"🧹 Space '{name}' vanished, dropping from index.")
+            self._save_delta(self._store.remove, [name])
+            return None
+        if space is None:
+            candidate = os.path.join(self.space_dir, name, METADATA_FILENAME)
+            if not os.path.isfile(candidate):
+                return None
+            space, problem = load_space_metadata(candidate)
+            if problem or space["name"] != name:
+                return None
+            self._save_delta(self._store.add, space)
+
+        self._remember(space)
+        logger.debug(f"📥 Fetched space '{name}' on first access.")
+        return space
+
+    def reconcile_in_background(self) -> threading.Thread:
+        """
+        Run ``refresh_index()`` on a daemon thread, e.g. right after
+        constructing a lazy manager. Lookups keep working meanwhile, since
+        the discovery walk runs without holding the index lock.
+
+        Returns:
+            threading.Thread: The started reconcile thread.
+        """
+        thread = threading.Thread(
+            target=self.refresh_index, name="space_reconcile", daemon=True
+        )
+        thread.start()
+        return thread
+
     def refresh_index(self):
+        """
+        Reconcile the index with the filesystem by rediscovering every space
+        under the space directory. Mutations made through this class keep the
+        index up to date incrementally; an explicit refresh is only needed to
+        pick up spaces created or removed outside of the API.
+
+        The discovery walk runs without holding the instance or index lock,
+        so lookups and writers in this and other processes are only blocked
+        while the result is swapped in. Index changes committed during the
+        walk are merged into the result rather than overwritten.
+        """
         logger.info("🔄 Refreshing space index via recursive discovery.")
-        self.index["spaces"] = self._scan_directory(self.space_dir)
-        self._save_index()
+        with self._store.locked(exclusive=False):
+            generation = self._store.generation()
+        discovered = self._scan_directory(self.space_dir)
+
+        with self._index_transaction():
+            self._ensure_complete()
+            if self._store.generation() != generation:
+                discovered = self._merge_concurrent_changes(discovered)
+            if self._store.exists() and _same_spaces(
+                discovered, self.index["spaces"]
+            ):
+                # Nothing changed: don't make every reader reload the index
+                logger.debug("✅ Index already matches the filesystem.")
+                return
+            self.index["spaces"] = discovered
+            self._save_index()
+
+    def _merge_concurrent_changes(self, discovered: List[dict]) -> List[dict]:
+        """
+        Combine a discovery result with index changes committed while it
+        ran: spaces created meanwhile are kept, and spaces whose metadata
+        file is gone by now are dropped.
+        """
+
+        def present(space):
+            return os.path.isfile(
+                os.path.join(space["path"], METADATA_FILENAME)
+            )
+
+        names = {space["name"] for space in discovered}
+        merged = [space for space in discovered if present(space)]
+        merged.extend(
+            space
+            for space in self.index["spaces"]
+            if space["name"] not in names and present(space)
+        )
+        logger.debug("🔀 Merged index changes made during discovery.")
+        return merged
+
+    @_transactional
+    def add_discovered_space(self, metadata: dict) -> bool:
+        """
+        Patch a space that appeared outside the API into the index, e.g.
+        from a filesystem watcher. Known spaces are left untouched.
+
+        Returns:
+            bool: True if the index changed.
+        """
+        existing = self.get_space(metadata["name"])
+        if existing is not None:
+            if existing["path"] != metadata["path"]:
+                logger.warning(
+                    f"⚠️ Ignoring duplicate space name '{metadata['name']}' "
+                    f"at {metadata['path']}."
+                )
+            return False
+        self._index_add(metadata)
+        logger.info(f"👀 Picked up space '{metadata['name']}'.")
+        return True
+
+    @_transactional
+    def remove_discovered_spaces(
+        self, path: str, nested: bool = True
+    ) -> List[str]:
+        """
+        Drop the space rooted at ``path`` that disappeared outside the API
+        from the index.
+
+        Args:
+            path (str): Root path of the vanished space (or directory).
+            nested (bool): Also drop spaces nested below ``path``, for when
+                the whole directory is gone. Pass False when only the
+                space's own metadata file disappeared.
+
+        Returns:
+            List[str]: The names that were removed.
+        """
+        self._ensure_complete()
+        if not any(
+            _space_under(s, path, nested) for s in self.index["spaces"]
+        ):
+            return []
+        removed = self._index_remove_tree(path, nested)
+        logger.info(f"👀 Dropped vanished spaces {removed}.")
+        return removed
 
     def space_exists(self, name: str) -> bool:
-        exists = any(space["name"] == name for space in self.index["spaces"])
+        exists = self.get_space(name) is not None
         logger.debug(f"✅ Space exists check for '{name}': {exists}")
         return exists
 
     def get_space(self, name: str) -> Union[dict, None]:
         try:
-            return next(
-                (s for s in self.index["spaces"] if s["name"] == name), None
-            )
+            space = self._lookup().get(name)
+            if space is None and not self._complete:
+                space = self._fetch_space(name)
+            return space
         except Exception as e:
             logger.error(f"❌ Failed to get space '{name}'.", exc_info=True)
             raise SpaceManagerException(
                 "Failed to retrieve space.", metadata={"space": name}, cause=e
             )
 
+    @_transactional
     def create_space(
         self, name: str, label: str = "", parent_path: str = None
     ) -> bool:
@@ -254,8 +770,8 @@ class SpaceManager:
             metadata_path = os.path.join(destination_path, METADATA_FILENAME)
             YamlUtils.save_yaml_file(metadata_path, metadata)
 
-            # Refresh index
-            self.refresh_index()
+            # Record the new space in the index
+            self._index_add(metadata)
 
             logger.info(
                 f"✅ Space '{name}' created at '{destination_path}' "
@@ -278,6 +794,13 @@ class SpaceManager:
             )
 
     def delete_space(self, name: str) -> bool:
+        """
+        Delete a space and any space nested in it.
+
+        The directory is removed without holding the index lock, which is
+        only taken to drop the removed spaces from the index, so lookups
+        are not blocked while a large space is deleted.
+        """
         space = self.get_space(name)
         if not space:
             raise SpaceManagerException(
@@ -286,7 +809,8 @@ class SpaceManager:
 
         try:
             DirectoryUtils.remove_directory(space["path"])
-            self.refresh_index()
+            with self._index_transaction():
+                self._index_remove_tree(space["path"])
             logger.info(f"🗑️ Space '{name}' deleted.")
             return True
         except Exception as e:
@@ -300,15 +824,11 @@ class SpaceManager:
     def list_spaces(self, label_filter: str = None) -> List[dict]:
         try:
             logger.debug(f"📃 Listing spaces (filter: {label_filter})")
-            return (
-                [
-                    s
-                    for s in self.index["spaces"]
-                    if s.get("label") == label_filter
-                ]
-                if label_filter
-                else self.index["spaces"]
-            )
+            self._ensure_complete()
+            if not label_filter:
+                return self.index["spaces"]
+            by_name = self._lookup()
+            return [by_name[n] for n in self._by_label.get(label_filter, {})]
         except Exception as e:
             logger.error("❌ Failed to list spaces.", exc_info=True)
             raise SpaceManagerException(
@@ -384,7 +904,7 @@ class SpaceManager:
             )
 
     def get_directory_last_modified(
-        self, name: str, directory: str = None
+        self, name: str, directory: str = None, newer_than: float = None
     ) -> float:
         """
         Return the 'last modified' timestamp of a space (directory), in seconds
@@ -394,6 +914,13 @@ class SpaceManager:
 
         Args:
             name (str): The name of the space.
+            directory (str, optional): A subdirectory of the space to inspect
+                instead of the whole space.
+            newer_than (float, optional): Stop walking as soon as a file
+                newer than this timestamp is found and return that file's
+                mtime. Use this to answer "changed since?" without visiting
+                every file; the result is then only guaranteed to be greater
+                than ``newer_than``, not the newest mtime.
 
         Returns:
             float: The highest file modification timestamp (UTC) in the space,
@@ -428,32 +955,13 @@ class SpaceManager:
                     )
             else:
                 target_path = base_path
-            # Recursively list all entries (files + subdirectories)
-            # within the space.
-            all_entries = DirectoryUtils.list_directory(
-                space["path"], recursive=True
-            )
 
-            # If no entries at all, just return the directory's own
-            # modification time.
-            if not all_entries:
-                return os.path.getmtime(space["path"])
+            latest_timestamp = self._latest_file_mtime(target_path, newer_than)
 
-            latest_timestamp = 0.0
-            for entry in all_entries:
-                full_path = os.path.join(space["path"], entry)
-
-                # We only consider files, not subdirectories.
-                if os.path.isfile(full_path):
-                    file_mtime = os.path.getmtime(full_path)
-                    if file_mtime > latest_timestamp:
-                        latest_timestamp = file_mtime
-
-            # If no files were found at all (all_entries might have
-            # been directories),
-            # again fall back to the directory's own mtime.
-            if latest_timestamp == 0.0:
-                return os.path.getmtime(space["path"])
+            # If no files were found at all, fall back to the directory's
+            # own modification time.
+            if latest_timestamp is None:
+                return os.stat(target_path).st_mtime
 
             return latest_timestamp
 
@@ -471,3 +979,60 @@ class SpaceManager:
                 metadata={"space": name},
                 cause=e,
             )
+
+    @staticmethod
+    def _latest_file_mtime(
+        directory: str, newer_than: float = None
+    ) -> Union[float, None]:
+        """
+        Return the newest file mtime below ``directory``, or None if it holds
+        no files.
+
+        A single ``os.scandir`` pass visits each directory once and reuses
+        the stat data of its entries; directory symlinks are not followed.
+        With ``newer_than`` the walk returns the first mtime above it.
+        """
+        latest = None
+        stack = [directory]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        mtime = entry.stat().st_mtime
+                        if newer_than is not None and mtime > newer_than:
+                            return mtime
+                        if latest is None or mtime > latest:
+                            latest = mtime
+        return latest
+
+
+_shared_managers = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_space_manager(**kwargs) -> SpaceManager:
+    """
+    Return the process-wide SpaceManager for the current
+    ``DARCA_SPACE_BASE``, creating it on first use. All facades that are not
+    given an explicit manager share this instance and its warm index.
+
+    Args:
+        **kwargs: Passed to ``SpaceManager`` when the instance is created;
+            ignored afterwards.
+    """
+    key = os.path.realpath(config.get_base_dir())
+    with _shared_lock:
+        manager = _shared_managers.get(key)
+        if manager is None:
+            logger.debug(f"🌐 Creating shared SpaceManager for '{key}'.")
+            manager = SpaceManager(**kwargs)
+            _shared_managers[key] = manager
+        return manager
+
+
+def clear_shared_space_managers():
+    """Forget all shared SpaceManager instances (e.g. after a fork)."""
+    with _shared_lock:
+        _shared_managers.clear()
@@ -0,0 +1,315 @@
+"""
+space_watcher.py
+
+Keeps a SpaceManager index live while spaces are created or removed outside
+the API. On Linux the watcher uses inotify (through ctypes) to react to
+``metadata.yaml`` files appearing and disappearing; elsewhere it polls the
+space tree with the discovery walker. Either way the index is patched
+incrementally and a full ``refresh_index()`` is only used to recover from an
+inotify queue overflow.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from typing import Dict, Optional
+
+from darca_exception.exception import DarcaException
+from darca_log_facility.logger import DarcaLogger
+
+from darca_space_manager.space_manager import (
+    METADATA_FILENAME,
+    SpaceManager,
+    discover_metadata_files,
+    load_space_metadata,
+    walk_directories,
+)
+
+logger = DarcaLogger(name="space_watcher").get_logger()
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class SpaceWatcherException(DarcaException):
+    """Custom exception for errors in the SpaceWatcher."""
+
+    def __init__(self, message, error_code=None, metadata=None, cause=None):
+        super().__init__(
+            message=message,
+            error_code=error_code or "SPACE_WATCHER_ERROR",
+            metadata=metadata,
+            cause=cause,
+        )
+
+
+def _load_libc():
+    """Return libc with the inotify functions, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+        )
+        libc.inotify_init1
+        libc.inotify_add_watch
+        libc.inotify_rm_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class SpaceWatcher:
+    """
+    Background watcher that patches a SpaceManager's index when spaces are
+    created or removed on disk.
+
+    Example:
+        watcher = SpaceWatcher(manager).start()
+        ...
+        watcher.stop()
+    """
+
+    def __init__(
+        self,
+        space_manager: SpaceManager,
+        backend: str = "auto",
+        poll_interval: float = 2.0,
+    ):
+        """
+        Args:
+            space_manager (SpaceManager): The manager whose index is kept
+                up to date.
+            backend (str): ``inotify``, ``poll`` or ``auto`` (inotify when
+                available, polling otherwise).
+            poll_interval (float): Seconds between scans for the polling
+                backend.
+        """
+        if backend not in ("auto", "inotify", "poll"):
+            raise SpaceWatcherException(
+                f"Unknown watcher backend '{backend}'.",
+                error_code="UNKNOWN_WATCHER_BACKEND",
+                metadata={"backend": backend},
+            )
+        self._space_manager = space_manager
+        self._root = space_manager.space_dir
+        self._libc = _load_libc() if backend != "poll" else None
+        if backend == "inotify" and self._libc is None:
+            raise SpaceWatcherException(
+                "inotify is not available on this platform.",
+                error_code="INOTIFY_UNAVAILABLE",
+            )
+        self.backend = "inotify" if self._libc is not None else "poll"
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._fd = None
+        self._wakeup = None
+        self._watches: Dict[int, str] = {}
+        self._snapshot: Optional[Dict[str, int]] = None
+
+    # Lifecycle
+
+    def start(self) -> "SpaceWatcher":
+        """Start watching on a daemon thread and return self."""
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        if self.backend == "inotify":
+            self._open_inotify()
+            target = self._run_inotify
+        else:
+            self._snapshot = self._scan_snapshot()
+            target = self._run_poll
+        self._thread = threading.Thread(
+            target=target, name="space_watcher", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"👀 Watching '{self._root}' ({self.backend}).")
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the watcher thread and release the inotify descriptor."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        if self._wakeup is not None:
+            os.write(self._wakeup[1], b"x")
+        self._thread.join(timeout)
+        self._thread = None
+        for fd in [self._fd] + list(self._wakeup or ()):
+            if fd is not None:
+                os.close(fd)
+        self._fd, self._wakeup = None, None
+        self._watches.clear()
+        logger.info(f"🛑 Stopped watching '{self._root}'.")
+
+    def __enter__(self) -> "SpaceWatcher":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # Index patching shared by both backends
+
+    def _space_appeared(self, metadata_path: str):
+        metadata, problem = load_space_metadata(metadata_path)
+        if problem:
+            logger.warning(f"⚠️ Ignoring {metadata_path}: {problem}")
+            return
+        self._space_manager.add_discovered_space(metadata)
+
+    def _space_vanished(self, directory: str, nested: bool = False):
+        """
+        Drop the space rooted at ``directory``. Only a removed directory
+        (``nested``) takes the spaces below it along; a space that merely
+        lost its metadata file leaves its nested spaces intact.
+        """
+        self._space_manager.remove_discovered_spaces(directory, nested)
+
+    def _safely(self, handler, *args):
+        try:
+            handler(*args)
+        except Exception:
+            logger.error("❌ Failed to apply watched change.", exc_info=True)
+
+    # Polling backend
+
+    def _scan_snapshot(self) -> Dict[str, int]:
+        """Map every metadata file path to its mtime."""
+        snapshot = {}
+        for path in discover_metadata_files(self._root):
+            try:
+                snapshot[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return snapshot
+
+    def poll_once(self):
+        """Compare the space tree with the previous scan and patch deltas."""
+        current = self._scan_snapshot()
+        previous = self._snapshot or {}
+        for path in previous.keys() - current.keys():
+            self._safely(self._space_vanished, os.path.dirname(path))
+        for path, mtime in current.items():
+            if previous.get(path) != mtime:
+                self._safely(self._space_appeared, path)
+        self._snapshot = current
+
+    def _run_poll(self):
+        while not self._stop.wait(self.poll_interval):
+            self._safely(self.poll_once)
+
+    # inotify backend
+
+    def _open_inotify(self):
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise SpaceWatcherException(
+                "Failed to initialise inotify.",
+                error_code="INOTIFY_INIT_FAILED",
+                cause=OSError(err, os.strerror(err)),
+            )
+        self._fd = fd
+        self._wakeup = os.pipe()
+        self._watch_tree(self._root, announce=False)
+
+    def _add_watch(self, directory: str):
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), WATCH_MASK
+        )
+        if wd < 0:
+            err = ctypes.get_errno()
+            logger.warning(f"⚠️ Cannot watch {directory}: {os.strerror(err)}")
+            return
+        self._watches[wd] = directory
+
+    def _watch_tree(self, directory: str, announce: bool = True):
+        """
+        Watch ``directory`` and its subdirectories. With ``announce`` the
+        spaces already inside it are patched into the index, which covers
+        files created before the watch was in place.
+        """
+        try:
+            for path, entries in walk_directories(directory):
+                self._add_watch(path)
+                if announce and any(
+                    e.name == METADATA_FILENAME for e in entries
+                ):
+                    self._space_appeared(os.path.join(path, METADATA_FILENAME))
+        except OSError:
+            # The directory vanished again before we could watch it
+            pass
+
+    def _handle_event(self, wd: int, mask: int, name: str):
+        if mask & IN_Q_OVERFLOW:
+            logger.warning("⚠️ inotify queue overflow, full refresh.")
+            for watched in list(self._watches):
+                self._libc.inotify_rm_watch(self._fd, watched)
+            self._watches.clear()
+            self._space_manager.refresh_index()
+            self._watch_tree(self._root, announce=False)
+            return
+        if mask & IN_IGNORED:
+            self._watches.pop(wd, None)
+            return
+        directory = self._watches.get(wd)
+        if directory is None or not name:
+            return
+        path = os.path.join(directory, name)
+
+        if mask & IN_ISDIR:
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                self._watch_tree(path)
+            elif mask & (IN_MOVED_FROM | IN_DELETE):
+                self._space_vanished(path, nested=True)
+        elif name == METADATA_FILENAME:
+            if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                self._space_appeared(path)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                self._space_vanished(directory)
+
+    def _read_events(self):
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            end = offset + length
+            name = os.fsdecode(data[offset:end].rstrip(b"\0"))
+            offset = end
+            self._safely(self._handle_event, wd, mask, name)
+
+    def _run_inotify(self):
+        while not self._stop.is_set():
+            readable, _, _ = select.select([self._fd, self._wakeup[0]], [], [])
+            if self._fd in readable and not self._stop.is_set():
+                self._read_events()
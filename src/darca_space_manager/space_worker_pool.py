@@ -0,0 +1,447 @@
+"""
+space_worker_pool.py
+
+Warm Python interpreters for commands that run many times in a space.
+
+Starting an interpreter (and importing the same libraries again) often
+costs more than the work a short command does. A SpaceWorkerPool keeps
+interpreters running with the space as their working directory and sends
+them commands over pipes instead, so repeated ``python -c ...``,
+``python -m tool ...`` or ``python script.py ...`` invocations skip process
+and interpreter startup. Idle workers are evicted after ``idle_timeout``
+seconds and at most ``max_workers`` run at once across all spaces.
+
+Modules imported by a command stay imported in its worker, which is what
+makes later calls fast; each command still gets fresh ``__main__`` globals,
+``sys.argv``, ``os.environ``, standard streams and working directory.
+"""
+
+import os
+import signal
+import subprocess  # nosec B404
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from darca_log_facility.logger import DarcaLogger
+
+from darca_space_manager import config
+from darca_space_manager._space_worker import read_frame, write_frame
+from darca_space_manager.space_executor import (
+    SpaceExecutor,
+    SpaceExecutorException,
+)
+
+logger = DarcaLogger(name="space_worker_pool").get_logger()
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "_space_worker.py")
+
+# Runs the worker script without putting the package directory on sys.path,
+# so sys.path[0] is the working directory as with ``python -c``
+_BOOTSTRAP = (
+    "import runpy, sys; runpy.run_path(sys.argv.pop(1), run_name='__main__')"
+)
+
+_POSIX = os.name == "posix"
+
+
+class SpaceWorkerPoolException(SpaceExecutorException):
+    """Custom exception for errors in the SpaceWorkerPool."""
+
+    def __init__(self, message, error_code=None, metadata=None, cause=None):
+        super().__init__(
+            message=message,
+            error_code=error_code or "SPACE_WORKER_POOL_ERROR",
+            metadata=metadata,
+            cause=cause,
+        )
+
+
+class SpaceWorker:
+    """A warm interpreter bound to one space."""
+
+    def __init__(
+        self, space_name: str, space_path: str, env: Optional[dict] = None
+    ):
+        self.space_name = space_name
+        self.space_path = space_path
+        self.calls = 0
+        self.last_used = time.monotonic()
+        self._timed_out = False
+        try:
+            # Fixed argv: this interpreter running the packaged worker
+            self.process = subprocess.Popen(  # nosec B603
+                [sys.executable, "-c", _BOOTSTRAP, WORKER_SCRIPT],
+                cwd=space_path,
+                env=env,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                start_new_session=_POSIX,
+            )
+        except OSError as e:
+            raise SpaceWorkerPoolException(
+                f"Failed to start a worker for space '{space_name}'.",
+                error_code="WORKER_FAILED",
+                metadata={"space": space_name},
+                cause=e,
+            )
+        logger.debug(
+            f"Started worker {self.process.pid} for space '{space_name}'."
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def request(
+        self, argv: List[str], cwd: str, timeout: Optional[float]
+    ) -> dict:
+        """
+        Run one command and return the worker's response.
+
+        The worker is killed if it does not answer within ``timeout``; a
+        worker that times out or fails must not be reused.
+        """
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, self._expire)
+            timer.daemon = True
+            timer.start()
+        try:
+            write_frame(self.process.stdin, {"argv": argv, "cwd": cwd})
+            response = read_frame(self.process.stdout)
+        except (OSError, ValueError) as e:
+            response, cause = None, e
+        else:
+            cause = None
+        finally:
+            if timer:
+                timer.cancel()
+        self.calls += 1
+        self.last_used = time.monotonic()
+
+        if response is not None:
+            return response
+        if self._timed_out:
+            raise SpaceWorkerPoolException(
+                f"Command in space '{self.space_name}' timed out "
+                f"after {timeout}s.",
+                error_code="COMMAND_TIMEOUT",
+                metadata={"space": self.space_name, "command": argv},
+            )
+        raise SpaceWorkerPoolException(
+            f"Worker for space '{self.space_name}' exited unexpectedly.",
+            error_code="WORKER_FAILED",
+            metadata={
+                "space": self.space_name,
+                "command": argv,
+                "returncode": self.process.poll(),
+            },
+            cause=cause,
+        )
+
+    def _expire(self):
+        self._timed_out = True
+        self.kill()
+
+    def kill(self):
+        """Kill the worker and anything it started."""
+        try:
+            if _POSIX:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def close(self, timeout: float = 1.0):
+        """Ask the worker to exit by closing its input; kill it if needed."""
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.kill()
+            self.process.wait()
+        logger.debug(
+            f"Stopped worker {self.process.pid} for space "
+            f"'{self.space_name}' after {self.calls} calls."
+        )
+
+
+class SpaceWorkerPool:
+    """
+    Pool of warm per-space interpreters.
+
+    Example:
+        with SpaceWorkerPool(max_workers=4, idle_timeout=120) as pool:
+            for path in paths:
+                pool.run("reports", ["-m", "mytool", "render", path])
+    """
+
+    def __init__(
+        self,
+        executor: SpaceExecutor = None,
+        max_workers: int = None,
+        idle_timeout: float = 60.0,
+        env: Optional[dict] = None,
+    ):
+        """
+        Args:
+            executor (SpaceExecutor): Executor used to resolve spaces and
+                working directories. Defaults to a new one on the shared
+                SpaceManager.
+            max_workers (int): Maximum number of workers across all spaces.
+                Defaults to the ``DARCA_SPACE_POOL_WORKERS`` environment
+                variable, or 4.
+            idle_timeout (float): Seconds an idle worker is kept before it
+                is stopped.
+            env (Optional[dict]): Environment the workers are started with.
+        """
+        self._executor = executor or SpaceExecutor()
+        self.max_workers = max_workers or config.get_pool_workers()
+        self.idle_timeout = idle_timeout
+        self.env = env
+        self.spawned = 0
+        self.reused = 0
+        # Idle workers per space, most recently used last
+        self._idle: Dict[str, List[SpaceWorker]] = {}
+        self._busy = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._reaper = None
+
+    def run(
+        self,
+        space_name: str,
+        argv: List[str],
+        cwd: Optional[str] = None,
+        check: bool = True,
+        timeout: Optional[float] = 30,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a Python command in a warm worker of the space.
+
+        Args:
+            space_name (str): Name of the managed space.
+            argv (List[str]): The interpreter arguments, as in
+                ``python <argv>``: ``["-c", code, *args]``,
+                ``["-m", module, *args]`` or ``[script, *args]``.
+            cwd (Optional[str]): Subdirectory of the space to run in.
+            check (bool): Raise if the command exits with a non-zero code.
+            timeout (Optional[float]): Timeout in seconds. The worker is
+                killed when it expires.
+
+        Returns:
+            subprocess.CompletedProcess: The command's return code and
+            captured output.
+
+        Raises:
+            SpaceExecutorException: If the space or subdirectory cannot be
+            resolved, or the command fails with ``check`` set.
+            SpaceWorkerPoolException: If the pool is closed, the command
+            times out (``COMMAND_TIMEOUT``) or its worker dies
+            (``WORKER_FAILED``).
+        """
+        if not argv:
+            raise SpaceWorkerPoolException(
+                "No command given.",
+                error_code="INVALID_COMMAND",
+                metadata={"space": space_name},
+            )
+        space_path, final_cwd = self._executor.resolve_space(space_name, cwd)
+        worker = self._acquire(space_name, space_path)
+        reusable = False
+        try:
+            response = worker.request(list(argv), final_cwd, timeout)
+            reusable = True
+        finally:
+            self._release(worker, reusable)
+
+        result = subprocess.CompletedProcess(
+            args=[sys.executable] + list(argv),
+            returncode=response["returncode"],
+            stdout=response["stdout"],
+            stderr=response["stderr"],
+        )
+        logger.info(
+            "Command '%s' in space '%s' completed with returncode %d",
+            argv,
+            space_name,
+            result.returncode,
+        )
+        if check and result.returncode != 0:
+            raise SpaceExecutorException(
+                message=f"Failed to run command in space '{space_name}'.",
+                metadata={
+                    "space": space_name,
+                    "command": argv,
+                    "returncode": result.returncode,
+                    "stdout": result.stdout,
+                    "stderr": result.stderr,
+                },
+            )
+        return result
+
+    def _total(self) -> int:
+        return self._busy + sum(len(idle) for idle in self._idle.values())
+
+    def _take_idle(self, space_name: str, space_path: str):
+        """Pop a live idle worker of the space, or None."""
+        idle = self._idle.get(space_name, [])
+        stale = []
+        worker = None
+        while idle and worker is None:
+            candidate = idle.pop()
+            if candidate.alive and candidate.space_path == space_path:
+                worker = candidate
+            else:
+                stale.append(candidate)
+        if not idle:
+            self._idle.pop(space_name, None)
+        return worker, stale
+
+    def _take_oldest_idle(self) -> Optional[SpaceWorker]:
+        """Pop the least recently used idle worker of any space."""
+        oldest = None
+        for space_name, idle in self._idle.items():
+            if idle and (oldest is None or idle[0].last_used < oldest[1]):
+                oldest = (space_name, idle[0].last_used)
+        if oldest is None:
+            return None
+        idle = self._idle[oldest[0]]
+        worker = idle.pop(0)
+        if not idle:
+            del self._idle[oldest[0]]
+        return worker
+
+    def _acquire(self, space_name: str, space_path: str) -> SpaceWorker:
+        retired = []
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise SpaceWorkerPoolException(
+                        "The worker pool is closed.",
+                        error_code="POOL_CLOSED",
+                    )
+                worker, stale = self._take_idle(space_name, space_path)
+                retired.extend(stale)
+                if worker is not None:
+                    self._busy += 1
+                    self.reused += 1
+                    break
+                if self._total() >= self.max_workers:
+                    victim = self._take_oldest_idle()
+                    if victim is None:
+                        self._cond.wait()
+                        continue
+                    retired.append(victim)
+                self._busy += 1
+                self.spawned += 1
+                break
+        for stale in retired:
+            stale.close()
+
+        if worker is None:
+            try:
+                worker = SpaceWorker(space_name, space_path, self.env)
+            except Exception:
+                self._release(None, False)
+                raise
+            self._start_reaper()
+        return worker
+
+    def _release(self, worker: Optional[SpaceWorker], reusable: bool):
+        with self._cond:
+            self._busy -= 1
+            keep = (
+                worker is not None
+                and reusable
+                and not self._closed
+                and worker.alive
+            )
+            if keep:
+                self._idle.setdefault(worker.space_name, []).append(worker)
+            self._cond.notify()
+        if worker is not None and not keep:
+            worker.kill()
+            worker.close()
+
+    def evict_idle(self, max_idle: float = None) -> int:
+        """
+        Stop workers that have been idle longer than ``max_idle`` seconds
+        (default: ``idle_timeout``) and return how many were stopped.
+        """
+        max_idle = self.idle_timeout if max_idle is None else max_idle
+        deadline = time.monotonic() - max_idle
+        evicted = []
+        with self._cond:
+            for space_name in list(self._idle):
+                idle = self._idle[space_name]
+                keep = [w for w in idle if w.last_used > deadline]
+                evicted.extend(w for w in idle if w.last_used <= deadline)
+                if keep:
+                    self._idle[space_name] = keep
+                else:
+                    del self._idle[space_name]
+            if evicted:
+                self._cond.notify_all()
+        for worker in evicted:
+            worker.close()
+        if evicted:
+            logger.debug(f"Evicted {len(evicted)} idle workers.")
+        return len(evicted)
+
+    def _start_reaper(self):
+        with self._cond:
+            if self._reaper is not None or self._closed:
+                return
+            self._reaper = threading.Thread(
+                target=self._reap, name="space_worker_reaper", daemon=True
+            )
+            self._reaper.start()
+
+    def _reap(self):
+        interval = min(max(self.idle_timeout / 2, 0.05), 5.0)
+        while not self._stop.wait(interval):
+            try:
+                self.evict_idle()
+            except Exception:
+                logger.error("❌ Failed to evict idle workers.", exc_info=True)
+
+    def stats(self) -> dict:
+        """Return the number of idle and busy workers and usage counters."""
+        with self._cond:
+            return {
+                "idle": sum(len(idle) for idle in self._idle.values()),
+                "busy": self._busy,
+                "spawned": self.spawned,
+                "reused": self.reused,
+            }
+
+    def close(self):
+        """
+        Stop all idle workers. Workers busy with a command are stopped when
+        it finishes; the pool rejects new commands.
+        """
+        with self._cond:
+            self._closed = True
+            workers = [w for idle in self._idle.values() for w in idle]
+            self._idle.clear()
+            self._cond.notify_all()
+        self._stop.set()
+        if self._reaper is not None:
+            self._reaper.join()
+        for worker in workers:
+            worker.close()
+
+    def __enter__(self) -> "SpaceWorkerPool":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
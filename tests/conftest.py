@@ -6,6 +6,7 @@ import tempfile
 import pytest
 
 from darca_space_manager import SpaceExecutor, SpaceFileManager, SpaceManager
+from darca_space_manager.space_manager import clear_shared_space_managers
 
 
 @pytest.fixture(scope="function")
@@ -13,6 +14,7 @@ def temp_darca_env(monkeypatch):
     temp_dir = tempfile.mkdtemp(prefix="darca_test_env_")
     monkeypatch.setenv("DARCA_SPACE_BASE", temp_dir)
     yield temp_dir
+    clear_shared_space_managers()
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
@@ -0,0 +1,64 @@
+# tests/test_async_space_file_manager.py
+import asyncio
+
+import pytest
+
+from darca_space_manager.async_space_file_manager import AsyncSpaceFileManager
+from darca_space_manager.space_file_manager import (
+    SpaceFileManager,
+    SpaceFileManagerException,
+)
+
+
+def test_file_operations(space_manager):
+    space_manager.create_space("async_files")
+    sfm = SpaceFileManager(space_manager=space_manager)
+
+    async def scenario():
+        async with AsyncSpaceFileManager(file_manager=sfm) as files:
+            await asyncio.gather(
+                files.set_file("async_files", "a.txt", "A"),
+                files.set_file("async_files", "conf.yaml", {"x": 1}),
+            )
+            results = {
+                "exists": await files.file_exists("async_files", "a.txt"),
+                "text": await files.get_file("async_files", "a.txt"),
+                "yaml": await files.get_file(
+                    "async_files", "conf.yaml", load=True
+                ),
+                "listed": await files.list_files("async_files"),
+                "content": await files.list_files_content("async_files"),
+                "mtime": await files.get_file_last_modified(
+                    "async_files", "a.txt"
+                ),
+            }
+            await files.set_files("async_files", {"b.txt": "B"})
+            results["batch"] = await files.get_files("async_files", ["b.txt"])
+            await files.delete_file("async_files", "a.txt")
+            return results
+
+    results = asyncio.run(scenario())
+
+    assert results["exists"] is True
+    assert results["text"] == "A"
+    assert results["yaml"] == {"x": 1}
+    assert sorted(results["listed"]) == [
+        "a.txt",
+        "conf.yaml",
+        "metadata.yaml",
+    ]
+    assert len(results["content"]) == 3
+    assert isinstance(results["mtime"], float)
+    assert results["batch"]["b.txt"]["content"] == "B"
+    assert not sfm.file_exists("async_files", "a.txt")
+
+
+def test_errors_propagate(space_manager):
+    sfm = SpaceFileManager(space_manager=space_manager)
+
+    async def scenario():
+        async with AsyncSpaceFileManager(file_manager=sfm) as files:
+            await files.get_file("missing_space", "a.txt")
+
+    with pytest.raises(SpaceFileManagerException, match="does not exist"):
+        asyncio.run(scenario())
@@ -0,0 +1,107 @@
+# tests/test_async_space_manager.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from darca_space_manager.async_space_manager import (
+    AsyncSpaceManager,
+    SpaceLimiter,
+)
+
+
+def test_space_lifecycle(space_manager):
+    async def scenario():
+        async with AsyncSpaceManager(space_manager=space_manager) as spaces:
+            assert await spaces.create_space("async_space", label="a")
+            assert await spaces.space_exists("async_space")
+            space = await spaces.get_space("async_space")
+            listed = await spaces.list_spaces(label_filter="a")
+            deleted = await spaces.delete_space("async_space")
+            return space, listed, deleted
+
+    space, listed, deleted = asyncio.run(scenario())
+
+    assert space["name"] == "async_space"
+    assert [s["name"] for s in listed] == ["async_space"]
+    assert deleted
+    assert not space_manager.space_exists("async_space")
+
+
+def test_blocking_work_does_not_block_the_loop(space_manager):
+    def slow_refresh():
+        time.sleep(0.3)
+
+    space_manager.refresh_index = slow_refresh
+    ticks = []
+
+    async def heartbeat():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.02)
+
+    async def scenario():
+        async with AsyncSpaceManager(space_manager=space_manager) as spaces:
+            await asyncio.gather(spaces.refresh_index(), heartbeat())
+
+    asyncio.run(scenario())
+
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.3
+
+
+def test_per_space_limit(space_manager):
+    active = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+    lock = threading.Lock()
+
+    def fake_get_space(name):
+        with lock:
+            active[name] += 1
+            peak[name] = max(peak[name], active[name])
+        time.sleep(0.05)
+        with lock:
+            active[name] -= 1
+        return {"name": name}
+
+    space_manager.get_space = fake_get_space
+
+    async def scenario():
+        spaces = AsyncSpaceManager(
+            space_manager=space_manager, max_workers=8, per_space_limit=2
+        )
+        calls = [spaces.get_space(name) for name in "ab" * 5]
+        results = await asyncio.gather(*calls)
+        assert not spaces._limiter._slots
+        spaces.close()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == 10
+    assert peak == {"a": 2, "b": 2}
+
+
+def test_space_limiter_cleans_up():
+    async def scenario():
+        limiter = SpaceLimiter(limit=1)
+        async with limiter("x"):
+            assert "x" in limiter._slots
+        return limiter._slots
+
+    assert asyncio.run(scenario()) == {}
+
+
+def test_shared_executor_is_not_shut_down(space_manager):
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    async def scenario():
+        async with AsyncSpaceManager(
+            space_manager=space_manager, executor=executor
+        ) as spaces:
+            await spaces.list_spaces()
+
+    asyncio.run(scenario())
+
+    assert executor.submit(lambda: 42).result() == 42
+    executor.shutdown()
@@ -0,0 +1,72 @@
+# tests/test_document_cache.py
+from types import SimpleNamespace
+
+from darca_space_manager.document_cache import DocumentCache
+
+
+def _stat(ino=1, mtime_ns=100, size=10):
+    return SimpleNamespace(
+        st_dev=1, st_ino=ino, st_mtime_ns=mtime_ns, st_size=size
+    )
+
+
+def test_get_returns_copy():
+    cache = DocumentCache()
+    document = {"items": [1, 2]}
+    cache.put("space", "/a.yaml", _stat(), document)
+    document["items"].append(3)
+
+    first = cache.get("space", "/a.yaml", _stat())
+    first["items"].append(4)
+
+    assert cache.get("space", "/a.yaml", _stat()) == {"items": [1, 2]}
+    assert cache.hits == 2
+
+
+def test_changed_file_is_a_miss():
+    cache = DocumentCache()
+    cache.put("space", "/a.yaml", _stat(), {"v": 1})
+
+    assert cache.get("space", "/a.yaml", _stat(mtime_ns=200)) is None
+    assert cache.get("space", "/a.yaml", _stat(ino=2)) is None
+    assert cache.get("space", "/a.yaml", _stat(size=11)) is None
+    assert cache.get("other", "/a.yaml", _stat()) is None
+    assert cache.misses == 4
+
+
+def test_evicts_least_recently_used_entry():
+    cache = DocumentCache(max_entries=2)
+    cache.put("space", "/a", _stat(), "a")
+    cache.put("space", "/b", _stat(), "b")
+    cache.get("space", "/a", _stat())
+    cache.put("space", "/c", _stat(), "c")
+
+    assert len(cache) == 2
+    assert cache.get("space", "/b", _stat()) is None
+    assert cache.get("space", "/a", _stat()) == "a"
+
+
+def test_byte_limit():
+    cache = DocumentCache(max_bytes=25)
+    cache.put("space", "/huge", _stat(size=26), "x")
+    assert len(cache) == 0
+
+    cache.put("space", "/a", _stat(size=10), "a")
+    cache.put("space", "/b", _stat(size=10), "b")
+    cache.put("space", "/a", _stat(size=12), "a2")
+    cache.put("space", "/c", _stat(size=10), "c")
+
+    assert cache.get("space", "/b", _stat(size=10)) is None
+    assert cache.get("space", "/a", _stat(size=12)) == "a2"
+    assert cache.get("space", "/c", _stat(size=10)) == "c"
+
+
+def test_invalidate_and_clear():
+    cache = DocumentCache()
+    cache.put("space", "/a", _stat(), "a")
+    cache.put("space", "/b", _stat(), "b")
+
+    cache.invalidate("space", "/a")
+    assert cache.get("space", "/a", _stat()) is None
+    cache.clear()
+    assert len(cache) == 0
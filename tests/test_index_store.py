@@ -0,0 +1,208 @@
+# tests/test_index_store.py
+
+import os
+
+import pytest
+from darca_yaml.yaml_utils import YamlUtils
+
+from darca_space_manager.index_store import (
+    INDEX_BACKENDS,
+    IndexStore,
+    IndexStoreException,
+    JsonLinesIndexStore,
+    atomic_write,
+    get_index_store,
+)
+
+
+def _space(name, label=""):
+    return {
+        "name": name,
+        "label": label,
+        "path": f"/spaces/{name}",
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "subspaces": [],
+    }
+
+
+@pytest.fixture(params=sorted(INDEX_BACKENDS))
+def store(request, tmp_path):
+    return get_index_store(request.param, str(tmp_path))
+
+
+def test_roundtrip_keeps_order(store):
+    index = {"spaces": [_space("b"), _space("a", "x"), _space("c")]}
+    assert not store.exists()
+    store.save(index)
+    assert store.exists()
+    assert store.load() == index
+
+
+def test_get_single_record(store):
+    store.save({"spaces": [_space("alpha"), _space("al"), _space("beta")]})
+    assert store.get("al") == _space("al")
+    assert store.get("beta")["path"] == "/spaces/beta"
+    assert store.get("missing") is None
+
+
+def test_get_without_file(store):
+    assert store.get("anything") is None
+    assert store.stamp() is None
+
+
+def test_stamp_changes_on_save(store):
+    store.save({"spaces": [_space("a")]})
+    before = store.stamp()
+    store.save({"spaces": [_space("a"), _space("bb")]})
+    assert store.stamp() != before
+
+
+def test_export_yaml(store, tmp_path):
+    store.save({"spaces": [_space("a"), _space("b")]})
+    target = tmp_path / "export.yaml"
+    store.export_yaml(str(target))
+    assert YamlUtils.load_yaml_file(str(target)) == store.load()
+
+
+def test_yaml_store_empty_file(tmp_path):
+    store = get_index_store("yaml", str(tmp_path))
+    (tmp_path / store.filename).write_text("")
+    assert store.load() == {"spaces": []}
+
+
+def test_unknown_backend(tmp_path):
+    with pytest.raises(IndexStoreException, match="UNKNOWN_INDEX_BACKEND"):
+        get_index_store("xml", str(tmp_path))
+
+
+def test_base_store_is_abstract(tmp_path):
+    class Dummy(IndexStore):
+        filename = "dummy"
+
+    store = Dummy(str(tmp_path))
+    for call in (store.load, lambda: store.save({}), lambda: store.get("x")):
+        with pytest.raises(NotImplementedError):
+            call()
+
+
+def test_add_and_remove_deltas(store):
+    store.save({"spaces": [_space("a")]})
+    store.add(_space("b", "x"))
+    store.add(_space("a", "replaced"))
+    store.remove(["missing"])
+    store.remove(["b"])
+    store.add(_space("c"))
+
+    assert store.load() == {"spaces": [_space("a", "replaced"), _space("c")]}
+    assert store.get("a")["label"] == "replaced"
+    assert store.get("b") is None
+
+
+def test_deltas_on_empty_store(store):
+    store.add(_space("first"))
+    assert store.exists()
+    assert store.load() == {"spaces": [_space("first")]}
+
+
+def test_journal_append_leaves_snapshot_untouched(tmp_path):
+    store = JsonLinesIndexStore(str(tmp_path))
+    store.save({"spaces": [_space("a")]})
+    snapshot = os.stat(store.path)
+
+    store.add(_space("b"))
+    store.remove(["a"])
+
+    assert os.stat(store.path).st_mtime_ns == snapshot.st_mtime_ns
+    with open(store.journal_path) as f:
+        assert len(f.readlines()) == 2
+    assert store.load() == {"spaces": [_space("b")]}
+
+
+def test_journal_compaction(tmp_path):
+    store = JsonLinesIndexStore(str(tmp_path), compact_after=3)
+    for name in ("a", "b", "c", "d"):
+        store.add(_space(name))
+
+    with open(store.journal_path) as f:
+        assert len(f.readlines()) == 1
+    assert [s["name"] for s in store._load_snapshot()["spaces"]] == [
+        "a",
+        "b",
+        "c",
+    ]
+    assert [s["name"] for s in store.load()["spaces"]] == list("abcd")
+
+
+def test_journal_replay_is_idempotent(tmp_path):
+    store = JsonLinesIndexStore(str(tmp_path))
+    store.add(_space("a"))
+    store.remove(["zzz"])
+    journal = open(store.journal_path).read()
+    store.compact()
+    # Simulate a crash between snapshot rename and journal truncation
+    with open(store.journal_path, "w") as f:
+        f.write(journal)
+    assert store.load() == {"spaces": [_space("a")]}
+
+
+def test_torn_journal_line_is_ignored(tmp_path):
+    store = JsonLinesIndexStore(str(tmp_path))
+    store.add(_space("a"))
+    with open(store.journal_path, "a") as f:
+        f.write('{"op":"add","space":{"name":"b"')
+    assert store.load() == {"spaces": [_space("a")]}
+
+
+def test_atomic_write_failure_keeps_original(tmp_path):
+    target = tmp_path / "file.txt"
+    target.write_text("original")
+
+    def broken(tmp):
+        with open(tmp, "w") as f:
+            f.write("partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        atomic_write(str(target), broken)
+    assert target.read_text() == "original"
+    assert os.listdir(tmp_path) == ["file.txt"]
+
+
+def test_atomic_write_honours_umask(tmp_path):
+    target = tmp_path / "file.txt"
+    old_umask = os.umask(0o022)
+    try:
+        atomic_write(str(target), lambda tmp: open(tmp, "w").close())
+    finally:
+        os.umask(old_umask)
+    assert target.stat().st_mode & 0o777 == 0o644
+
+
+def test_base_store_deltas_rewrite_catalogue(tmp_path):
+    class Memory(IndexStore):
+        filename = "memory"
+        data = None
+
+        def exists(self):
+            return self.data is not None
+
+        def load(self):
+            return {"spaces": list(self.data["spaces"])}
+
+        def save(self, index):
+            self.data = index
+
+    store = Memory(str(tmp_path))
+    store.add(_space("a"))
+    store.add(_space("b"))
+    store.remove(["a"])
+    assert store.data == {"spaces": [_space("b")]}
+
+
+def test_generation_and_lock(store):
+    assert store.generation() == 0
+    with store.locked():
+        assert store.bump_generation() == 1
+        assert store.bump_generation() == 2
+    with store.locked(exclusive=False):
+        assert store.generation() == 2
@@ -1,10 +1,14 @@
 # tests/test_space_executor.py
 
+import asyncio
 import os
+import shutil
 import subprocess
+import time
 from unittest.mock import patch
 
 import pytest
+from darca_yaml.yaml_utils import YamlUtils
 
 from darca_space_manager.space_executor import SpaceExecutorException
 
@@ -143,3 +147,371 @@ def test_run_in_space_with_cwd_no_subdir(space_executor, space_manager):
         assert final_cwd.endswith("this_subdir_does_not_exist")
         assert result.returncode == 0
         assert "mocked stdout" in result.stdout
+
+
+def test_executor_uses_injected_space_manager(space_manager):
+    from darca_space_manager import SpaceExecutor
+
+    executor = SpaceExecutor(space_manager=space_manager)
+    assert executor._space_manager is space_manager
+    space_manager.create_space("injected_exec")
+    result = executor.run_in_space("injected_exec", ["ls", "."])
+    assert "metadata.yaml" in result.stdout
+
+
+def test_run_in_space_async_streams_output(space_executor, space_manager):
+    space_manager.create_space("async_exec")
+    chunks = []
+
+    result = asyncio.run(
+        space_executor.run_in_space_async(
+            "async_exec",
+            ["sh", "-c", "echo out; echo err >&2; pwd"],
+            on_output=lambda stream, text: chunks.append((stream, text)),
+        )
+    )
+
+    space_path = space_manager.get_space("async_exec")["path"]
+    assert result["returncode"] == 0
+    assert result["stdout"] == f"out\n{space_path}\n"
+    assert result["stderr"] == "err\n"
+    assert result["error"] is None
+    assert result["duration"] >= 0
+    assert "".join(t for s, t in chunks if s == "stdout") == result["stdout"]
+    assert "".join(t for s, t in chunks if s == "stderr") == "err\n"
+
+
+def test_run_in_space_async_failures(space_executor, space_manager):
+    space_manager.create_space("async_exec_fail")
+
+    with pytest.raises(SpaceExecutorException) as exc_info:
+        asyncio.run(
+            space_executor.run_in_space_async(
+                "async_exec_fail", ["sh", "-c", "echo bad >&2; exit 3"]
+            )
+        )
+    assert exc_info.value.metadata["returncode"] == 3
+    assert exc_info.value.metadata["stderr"] == "bad\n"
+
+    result = asyncio.run(
+        space_executor.run_in_space_async(
+            "async_exec_fail", ["sh", "-c", "exit 3"], check=False
+        )
+    )
+    assert result["returncode"] == 3
+
+    with pytest.raises(SpaceExecutorException, match="COMMAND_TIMEOUT"):
+        asyncio.run(
+            space_executor.run_in_space_async(
+                "async_exec_fail", ["sleep", "5"], timeout=0.2
+            )
+        )
+
+    with pytest.raises(SpaceExecutorException, match="does not exist"):
+        asyncio.run(
+            space_executor.run_in_space_async("no_such_space", ["true"])
+        )
+
+
+def test_run_many(space_executor, space_manager):
+    for name in ("many_a", "many_b", "many_c"):
+        space_manager.create_space(name)
+    specs = [
+        {"space_name": name, "command": ["sh", "-c", "sleep 0.3; pwd"]}
+        for name in ("many_a", "many_b", "many_c")
+    ]
+    specs.append({"space_name": "many_a", "command": ["false"]})
+    specs.append({"space_name": "missing", "command": ["true"]})
+    streamed = []
+
+    started = time.monotonic()
+    results = asyncio.run(
+        space_executor.run_many(
+            specs,
+            max_parallel=3,
+            on_output=lambda space, stream, text: streamed.append(space),
+        )
+    )
+    elapsed = time.monotonic() - started
+
+    assert [r["space"] for r in results] == [
+        "many_a",
+        "many_b",
+        "many_c",
+        "many_a",
+        "missing",
+    ]
+    for result in results[:3]:
+        assert result["error"] is None
+        assert result["stdout"].strip().endswith(result["space"])
+        assert result["duration"] >= 0.3
+    assert results[3]["returncode"] == 1
+    assert isinstance(results[3]["error"], SpaceExecutorException)
+    assert "does not exist" in str(results[4]["error"])
+    assert sorted(set(streamed)) == ["many_a", "many_b", "many_c"]
+    # The three sleeps ran concurrently
+    assert elapsed < 0.85
+
+
+def test_run_many_isolates_unexpected_errors(space_executor, space_manager):
+    space_manager.create_space("isolated")
+
+    def on_output(space, stream, text):
+        if "boom" in text:
+            raise RuntimeError("callback failed")
+
+    async def run():
+        results = await space_executor.run_many(
+            [
+                {"space_name": "isolated", "command": ["echo", "boom"]},
+                {"space_name": "isolated", "command": ["true"], "bad": 1},
+                {
+                    "space_name": "isolated",
+                    "command": ["sh", "-c", "sleep 0.2; echo ok"],
+                },
+            ],
+            on_output=on_output,
+        )
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        return results, pending
+
+    results, pending = asyncio.run(run())
+
+    assert isinstance(results[0]["error"], RuntimeError)
+    assert isinstance(results[1]["error"], TypeError)
+    assert results[2]["error"] is None
+    assert results[2]["stdout"] == "ok\n"
+    assert not pending
+
+
+def test_run_in_space_does_not_refresh_known_space(space_manager):
+    from darca_space_manager import SpaceExecutor
+
+    executor = SpaceExecutor(space_manager=space_manager)
+    space_manager.create_space("no_refresh_exec")
+
+    with patch.object(
+        space_manager, "refresh_index", side_effect=AssertionError
+    ):
+        for _ in range(3):
+            executor.run_in_space("no_refresh_exec", ["true"])
+
+    assert "no_refresh_exec" in executor._space_paths
+
+
+def test_run_in_space_local_recreate_and_misses(space_manager):
+    from darca_space_manager import SpaceExecutor
+
+    executor = SpaceExecutor(space_manager=space_manager)
+    space_manager.create_space("base_exec")
+    space_manager.create_space("moved_exec")
+    executor.run_in_space("moved_exec", ["true"])
+
+    with patch.object(
+        space_manager, "refresh_index", wraps=space_manager.refresh_index
+    ) as refresh:
+        # Re-created through the same manager: no refresh fallback needed
+        space_manager.delete_space("moved_exec")
+        space_manager.create_space("moved_exec", parent_path="base_exec")
+        result = executor.run_in_space("moved_exec", ["pwd"])
+        assert result.stdout.strip() == (
+            space_manager.get_space("moved_exec")["path"]
+        )
+        assert refresh.call_count == 0
+
+        # A missing space is rescanned once, not on every call
+        generation = space_manager.generation
+        for _ in range(5):
+            with pytest.raises(SpaceExecutorException):
+                executor.run_in_space("nope", ["true"])
+        assert refresh.call_count == 1
+        assert space_manager.generation == generation
+
+
+def test_run_in_space_refreshes_for_external_changes(space_manager):
+    from darca_space_manager import SpaceExecutor
+
+    executor = SpaceExecutor(space_manager=space_manager)
+    space_manager.create_space("deleted_exec")
+    executor.run_in_space("deleted_exec", ["true"])
+
+    # Created behind the index's back: found through the refresh fallback
+    external_path = os.path.join(space_manager.space_dir, "external_exec")
+    os.makedirs(external_path)
+    YamlUtils.save_yaml_file(
+        os.path.join(external_path, "metadata.yaml"),
+        {
+            "name": "external_exec",
+            "label": "",
+            "path": external_path,
+            "created_at": "2025-01-01T00:00:00+00:00",
+        },
+    )
+    result = executor.run_in_space("external_exec", ["pwd"])
+    assert result.stdout.strip() == external_path
+
+    # Removed behind the index's back: the cached path fails its
+    # metadata.yaml check and the refreshed index no longer knows it.
+    shutil.rmtree(space_manager.get_space("deleted_exec")["path"])
+    with pytest.raises(SpaceExecutorException, match="does not exist"):
+        executor.run_in_space("deleted_exec", ["true"])
+
+
+def test_run_in_space_async_line_mode_and_tail(space_executor, space_manager):
+    space_manager.create_space("lines")
+    lines = []
+
+    async def collect(stream, text):
+        lines.append((stream, text))
+
+    result = asyncio.run(
+        space_executor.run_in_space_async(
+            "lines",
+            ["sh", "-c", "printf 'one\\ntw'; sleep 0.1; printf 'o\\nend'"],
+            on_output=collect,
+            line_mode=True,
+            output_tail=6,
+        )
+    )
+
+    assert lines == [
+        ("stdout", "one\n"),
+        ("stdout", "two\n"),
+        ("stdout", "end"),
+    ]
+    assert result["stdout"] == "wo\nend"
+    assert result["truncated"] is True
+
+
+def test_run_in_space_async_line_mode_caps_long_lines(
+    space_executor, space_manager
+):
+    space_manager.create_space("long_lines")
+    chunks = []
+
+    with patch("darca_space_manager.space_executor.STREAM_MAX_LINE", 8):
+        asyncio.run(
+            space_executor.run_in_space_async(
+                "long_lines",
+                [
+                    "sh",
+                    "-c",
+                    "printf 'abcdefghijklmnopqrst'; sleep 0.1; printf 'u\\nv'",
+                ],
+                on_output=lambda stream, text: chunks.append(text),
+                line_mode=True,
+            )
+        )
+
+    assert chunks == ["abcdefgh", "ijklmnop", "qrstu\n", "v"]
+
+
+def test_run_in_space_async_log_file(space_executor, space_manager):
+    space_manager.create_space("logged")
+    space_path = space_manager.get_space("logged")["path"]
+
+    asyncio.run(
+        space_executor.run_in_space_async(
+            "logged", ["sh", "-c", "echo hello"], log_file="logs/run.log"
+        )
+    )
+    with open(os.path.join(space_path, "logs", "run.log")) as f:
+        assert f.read() == "hello\n"
+
+    with pytest.raises(SpaceExecutorException, match="Log file path"):
+        asyncio.run(
+            space_executor.run_in_space_async(
+                "logged", ["true"], log_file="../escape.log"
+            )
+        )
+
+    # A log file that cannot be opened fails before the command starts
+    os.makedirs(os.path.join(space_path, "logs", "dir.log"))
+    with pytest.raises(SpaceExecutorException, match="Cannot open log file"):
+        asyncio.run(
+            space_executor.run_in_space_async(
+                "logged", ["touch", "ran"], log_file="logs/dir.log"
+            )
+        )
+    assert not os.path.exists(os.path.join(space_path, "ran"))
+
+
+def test_stream_in_space(space_executor, space_manager):
+    space_manager.create_space("streamed")
+
+    async def consume(command, stop_after=None):
+        items = []
+        async for item in space_executor.stream_in_space("streamed", command):
+            items.append(item)
+            if stop_after and len(items) == stop_after:
+                break
+        return items
+
+    items = asyncio.run(consume(["sh", "-c", "echo a; echo b >&2; echo c"]))
+    assert [t for s, t in items if s == "stdout"] == ["a\n", "c\n"]
+    assert [t for s, t in items if s == "stderr"] == ["b\n"]
+
+    # Stopping early kills the command instead of waiting for it
+    start = time.monotonic()
+    items = asyncio.run(consume(["sh", "-c", "echo a; sleep 10"], 1))
+    assert items == [("stdout", "a\n")]
+    assert time.monotonic() - start < 5
+
+    with pytest.raises(SpaceExecutorException) as exc_info:
+        asyncio.run(consume(["sh", "-c", "echo partial; exit 2"]))
+    assert exc_info.value.metadata["returncode"] == 2
+    assert exc_info.value.metadata["stdout"] == "partial\n"
+
+
+def test_run_in_space_streaming_callback(space_executor, space_manager):
+    space_manager.create_space("sync_stream")
+    seen = []
+
+    result = space_executor.run_in_space(
+        "sync_stream",
+        ["sh", "-c", "echo x; echo y"],
+        on_output=lambda stream, text: seen.append(text),
+        line_mode=True,
+    )
+
+    assert isinstance(result, subprocess.CompletedProcess)
+    assert result.returncode == 0
+    assert result.stdout == "x\ny\n"
+    assert seen == ["x\n", "y\n"]
+
+    with pytest.raises(SpaceExecutorException) as exc_info:
+        space_executor.run_in_space(
+            "sync_stream", ["sh", "-c", "exit 3"], on_output=print
+        )
+    assert exc_info.value.metadata["returncode"] == 3
+
+    async def inside_loop():
+        space_executor.run_in_space("sync_stream", ["true"], on_output=print)
+
+    with pytest.raises(SpaceExecutorException) as exc_info:
+        asyncio.run(inside_loop())
+    assert exc_info.value.error_code == "EVENT_LOOP_RUNNING"
+
+
+def test_run_in_space_streaming_output_is_bounded(
+    space_executor, space_manager
+):
+    space_manager.create_space("bounded")
+    space_path = space_manager.get_space("bounded")["path"]
+    command = ["sh", "-c", "echo one; echo two"]
+    run_async = space_executor.run_in_space_async
+
+    with patch.object(
+        space_executor, "run_in_space_async", side_effect=run_async
+    ) as mocked:
+        result = space_executor.run_in_space(
+            "bounded", command, capture_output=False, log_file="job.log"
+        )
+        assert mocked.call_args.kwargs["output_tail"] == 0
+        space_executor.run_in_space("bounded", command, on_output=print)
+        assert mocked.call_args.kwargs["output_tail"] > 0
+
+    assert result.returncode == 0
+    assert result.stdout is None
+    with open(os.path.join(space_path, "job.log")) as f:
+        assert f.read() == "one\ntwo\n"
@@ -5,7 +5,12 @@ from unittest.mock import patch
 import pytest
 from darca_file_utils.file_utils import FileUtils, FileUtilsException
 
-from darca_space_manager.space_file_manager import SpaceFileManagerException
+from darca_space_manager.document_cache import DocumentCache
+from darca_space_manager.space_file_manager import (
+    SNIFF_BYTES,
+    SpaceFileManager,
+    SpaceFileManagerException,
+)
 
 
 def test_file_exists_true(space_file_manager):
@@ -380,3 +385,776 @@ def test_list_files_content_listing_error(space_file_manager):
 
     assert "LIST_FILES_CONTENT_FAILED" in str(exc_info.value)
     assert "listing_error_space" in str(exc_info.value)
+
+
+def test_resolve_file_path_uses_cache(space_file_manager, space_manager):
+    """
+    Once a space is resolved, per-file operations must not rescan the
+    space tree while the persisted index is unchanged.
+    """
+    space_manager.create_space("cached")
+    sfm = space_file_manager
+    sfm.set_file("cached", "a.txt", "A")
+
+    with patch.object(
+        sfm._space_manager, "refresh_index", side_effect=AssertionError
+    ), patch.object(
+        sfm._space_manager, "_scan_directory", side_effect=AssertionError
+    ):
+        assert sfm.get_file("cached", "a.txt") == "A"
+        assert sfm.file_exists("cached", "a.txt")
+        assert isinstance(sfm.get_file_last_modified("cached", "a.txt"), float)
+
+
+def test_resolve_file_path_invalidated_by_index_change(
+    space_file_manager, space_manager
+):
+    """
+    Deleting a space through another SpaceManager changes the index file,
+    which must invalidate the cached resolution.
+    """
+    sfm = space_file_manager
+    space_manager.create_space("volatile")
+    sfm.set_file("volatile", "a.txt", "A")
+    space_manager.delete_space("volatile")
+
+    with pytest.raises(SpaceFileManagerException, match="does not exist"):
+        sfm.get_file("volatile", "a.txt")
+
+
+def test_resolve_file_path_invalidated_by_same_manager(space_file_manager):
+    """
+    Changes made through the SpaceManager the file manager itself uses do
+    not make sync_index() report a change, but must still invalidate the
+    cached resolution.
+    """
+    sfm = space_file_manager
+    manager = sfm._space_manager
+    manager.create_space("base")
+    manager.create_space("same")
+    sfm.set_file("same", "a.txt", "A")
+    old_path = manager.get_space("same")["path"]
+    manager.delete_space("same")
+
+    with pytest.raises(SpaceFileManagerException) as exc_info:
+        sfm.set_file("same", "y.txt", "Y")
+    assert exc_info.value.error_code == "SPACE_NOT_FOUND"
+    assert not os.path.exists(old_path)
+
+    manager.create_space("same", parent_path="base")
+    sfm.set_file("same", "y.txt", "Y")
+    new_path = manager.get_space("same")["path"]
+    assert new_path != old_path
+    assert os.path.isfile(os.path.join(new_path, "y.txt"))
+    assert not os.path.exists(old_path)
+
+
+def test_unknown_space_is_not_rescanned_on_every_call(space_file_manager):
+    sfm = space_file_manager
+    manager = sfm._space_manager
+    generation = manager.generation
+
+    with patch.object(
+        manager, "refresh_index", wraps=manager.refresh_index
+    ) as refresh:
+        for _ in range(5):
+            with pytest.raises(SpaceFileManagerException):
+                sfm.get_file("nope", "a.txt")
+        assert refresh.call_count == 1
+        assert manager.generation == generation
+
+        # Creating the space changes the index and ends the negative cache
+        manager.create_space("nope")
+        sfm.set_file("nope", "a.txt", "A")
+        assert sfm.get_file("nope", "a.txt") == "A"
+        assert refresh.call_count == 1
+
+
+def test_resolve_file_path_refreshes_for_unknown_space(space_file_manager):
+    """
+    Spaces created on disk outside the API are found via the fallback
+    refresh.
+    """
+    sfm = space_file_manager
+    space_dir = sfm._space_manager.space_dir
+    external = os.path.join(space_dir, "external")
+    os.makedirs(external)
+    with open(os.path.join(external, "metadata.yaml"), "w") as f:
+        f.write(
+            f"name: external\nlabel: ''\npath: {external}\n"
+            "created_at: '2025-01-01T00:00:00+00:00'\n"
+        )
+
+    assert sfm.list_files("external") == ["metadata.yaml"]
+
+
+def test_facades_share_space_manager(temp_darca_env):
+    from darca_space_manager import SpaceExecutor, SpaceFileManager
+
+    sfm = SpaceFileManager()
+    executor = SpaceExecutor()
+    assert sfm._space_manager is executor._space_manager
+    assert SpaceFileManager()._space_manager is sfm._space_manager
+
+
+def test_injected_space_manager(space_manager):
+    from darca_space_manager import SpaceFileManager
+
+    sfm = SpaceFileManager(space_manager=space_manager)
+    assert sfm._space_manager is space_manager
+    space_manager.create_space("injected")
+    with patch.object(
+        space_manager, "refresh_index", side_effect=AssertionError
+    ):
+        assert sfm.set_file("injected", "a.txt", "A")
+
+
+def test_lazy_manager_unknown_space_does_not_refresh(space_manager):
+    from darca_space_manager import SpaceFileManager, SpaceManager
+
+    sfm = SpaceFileManager(space_manager=SpaceManager(lazy=True))
+    with patch.object(
+        sfm._space_manager, "refresh_index", side_effect=AssertionError
+    ), pytest.raises(SpaceFileManagerException, match="does not exist"):
+        sfm.get_file("ghost", "a.txt")
+
+
+def _make_content_space(space_manager, space_name):
+    space_manager.create_space(space_name)
+    space_path = space_manager.get_space(space_name)["path"]
+    os.makedirs(os.path.join(space_path, "logs"))
+    with open(os.path.join(space_path, "notes.txt"), "w") as f:
+        f.write("short")
+    with open(os.path.join(space_path, "logs", "big.log"), "w") as f:
+        f.write("x" * 1000)
+    return space_path
+
+
+def test_iter_files_content_is_lazy(space_file_manager, space_manager):
+    _make_content_space(space_manager, "stream_space")
+
+    entries = space_file_manager.iter_files_content("stream_space")
+
+    assert not isinstance(entries, list)
+    names = [entry["file_name"] for entry in entries]
+    assert names == [
+        "metadata.yaml",
+        "notes.txt",
+        os.path.join("logs", "big.log"),
+    ]
+
+
+def test_iter_files_content_truncates(space_file_manager, space_manager):
+    _make_content_space(space_manager, "truncate_space")
+
+    entries = {
+        entry["file_name"]: entry
+        for entry in space_file_manager.iter_files_content(
+            "truncate_space", max_bytes=10
+        )
+    }
+
+    big = entries[os.path.join("logs", "big.log")]
+    assert big["file_content"] == "x" * 10
+    assert big["size"] == 1000
+    assert big["truncated"] is True
+    assert entries["notes.txt"]["file_content"] == "short"
+    assert entries["notes.txt"]["truncated"] is False
+
+
+def test_iter_files_content_filters_before_reading(
+    space_file_manager, space_manager
+):
+    _make_content_space(space_manager, "filter_space")
+    original_open = open
+    opened = []
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(os.path.basename(path))
+        return original_open(path, *args, **kwargs)
+
+    with patch("builtins.open", side_effect=tracking_open):
+        entries = list(
+            space_file_manager.iter_files_content(
+                "filter_space",
+                max_file_size=100,
+                extensions=[".txt", ".log"],
+            )
+        )
+
+    assert [entry["file_name"] for entry in entries] == ["notes.txt"]
+    assert "big.log" not in opened
+    assert "metadata.yaml" not in opened
+
+
+def test_iter_files_content_space_not_found(space_file_manager):
+    with pytest.raises(SpaceFileManagerException) as exc_info:
+        next(space_file_manager.iter_files_content("no_such_space"))
+    assert "LIST_FILES_CONTENT_FAILED" in str(exc_info.value)
+
+
+class _CountingOpen:
+    """Wrap builtins.open and count the bytes read below ``root``."""
+
+    def __init__(self, root):
+        self.root = root
+        self.original = open
+        self.opened = 0
+        self.bytes_read = 0
+
+    def __call__(self, path, *args, **kwargs):
+        handle = self.original(path, *args, **kwargs)
+        if not str(path).startswith(self.root):
+            return handle
+        self.opened += 1
+        counter = self
+
+        class _Reader:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                handle.close()
+
+            def read(self, size=-1):
+                data = handle.read(size)
+                counter.bytes_read += len(data)
+                return data
+
+        return _Reader()
+
+
+def test_iter_files_content_sniffs_binary(space_file_manager, space_manager):
+    space_manager.create_space("sniff_space")
+    space_path = space_manager.get_space("sniff_space")["path"]
+    with open(os.path.join(space_path, "blob.bin"), "wb") as f:
+        f.write(b"\x00" + b"a" * (1024 * 1024))
+    counting = _CountingOpen(space_path)
+
+    with patch("builtins.open", side_effect=counting):
+        entries = list(
+            space_file_manager.iter_files_content(
+                "sniff_space", extensions=[".bin"]
+            )
+        )
+
+    assert entries[0]["type"] == "binary"
+    assert entries[0]["file_content"] is None
+    assert counting.bytes_read <= SNIFF_BYTES
+
+
+def test_iter_files_content_classification_cache(
+    space_file_manager, space_manager
+):
+    space_path = _make_content_space(space_manager, "classify_space")
+    first = space_file_manager.list_files_content(
+        "classify_space", include_content=False
+    )
+    counting = _CountingOpen(space_path)
+
+    with patch("builtins.open", side_effect=counting):
+        second = space_file_manager.list_files_content(
+            "classify_space", include_content=False
+        )
+
+    assert counting.opened == 0
+    assert second == first
+    assert all(entry["file_content"] is None for entry in second)
+
+    # A changed file gets a new cache key and is sniffed again
+    with open(os.path.join(space_path, "notes.txt"), "wb") as f:
+        f.write(b"\xffchanged")
+    entries = {
+        entry["file_name"]: entry
+        for entry in space_file_manager.iter_files_content(
+            "classify_space", include_content=False
+        )
+    }
+    assert entries["notes.txt"]["type"] == "binary"
+
+
+def test_iter_files_content_small_max_bytes_sniffs_fully(
+    space_file_manager, space_manager
+):
+    space_manager.create_space("short_sample")
+    space_path = space_manager.get_space("short_sample")["path"]
+    with open(os.path.join(space_path, "mixed.bin"), "wb") as f:
+        f.write(b"hello" + b"\x00\xff" * 100)
+    with open(os.path.join(space_path, "text.txt"), "wb") as f:
+        f.write(b"hello world")
+
+    def entries(**kwargs):
+        return {
+            entry["file_name"]: entry
+            for entry in space_file_manager.iter_files_content(
+                "short_sample", **kwargs
+            )
+        }
+
+    small = entries(max_bytes=4)
+    assert small["mixed.bin"]["type"] == "binary"
+    assert small["mixed.bin"]["file_content"] is None
+    assert small["text.txt"]["file_content"] == "hell"
+    assert small["text.txt"]["truncated"]
+
+    # The cached classification is the one from the full sniff
+    cached = entries(include_content=False)
+    assert cached["mixed.bin"]["type"] == "binary"
+    assert cached["text.txt"]["type"] == "ascii"
+
+
+def test_iter_files_content_reads_text_past_sniff(
+    space_file_manager, space_manager
+):
+    space_manager.create_space("long_text_space")
+    space_path = space_manager.get_space("long_text_space")["path"]
+    with open(os.path.join(space_path, "long.txt"), "w") as f:
+        f.write("a" * (SNIFF_BYTES * 2) + "é")
+
+    entries = list(
+        space_file_manager.iter_files_content(
+            "long_text_space", extensions=[".txt"]
+        )
+    )
+
+    assert entries[0]["type"] == "binary"
+    assert entries[0]["file_content"] is None
+
+
+def test_iter_files_content_parallel_matches_serial(
+    space_file_manager, space_manager, monkeypatch
+):
+    # Small batches so several of them are in flight at once
+    monkeypatch.setattr("darca_space_manager.space_file_manager.READ_BATCH", 2)
+    space_manager.create_space("parallel_space")
+    space_path = space_manager.get_space("parallel_space")["path"]
+    for i in range(60):
+        directory = os.path.join(space_path, f"d{i % 3}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"f{i:02}.txt"), "w") as f:
+            f.write(f"file {i}")
+
+    serial = list(space_file_manager.iter_files_content("parallel_space"))
+    parallel = list(
+        space_file_manager.iter_files_content("parallel_space", workers=4)
+    )
+
+    assert parallel == serial
+    assert len(parallel) == 61
+
+
+def test_iter_files_content_parallel_read_error(
+    space_manager, space_file_manager
+):
+    space_manager.create_space("parallel_error_space")
+    space_path = space_manager.get_space("parallel_error_space")["path"]
+    for name in ("a.txt", "failme.txt", "z.txt"):
+        with open(os.path.join(space_path, name), "w") as f:
+            f.write(name)
+    original_open = open
+
+    def mocked_open(path, mode="r", *args, **kwargs):
+        if "failme.txt" in str(path):
+            raise IOError("Mocked I/O error")
+        return original_open(path, mode, *args, **kwargs)
+
+    reader = SpaceFileManager(space_manager=space_manager, read_workers=3)
+    with patch("builtins.open", side_effect=mocked_open), patch(
+        "darca_space_manager.space_file_manager.logger"
+    ) as mock_logger:
+        names = [
+            entry["file_name"]
+            for entry in reader.iter_files_content("parallel_error_space")
+        ]
+
+    assert names == ["a.txt", "metadata.yaml", "z.txt"]
+    mock_logger.warning.assert_called_once()
+    assert "failme.txt" in mock_logger.warning.call_args[0][0]
+
+
+def test_read_workers_from_env(space_manager, monkeypatch):
+    monkeypatch.setenv("DARCA_SPACE_READ_WORKERS", "6")
+    assert SpaceFileManager(space_manager=space_manager).read_workers == 6
+
+
+def test_set_files_writes_batch(space_file_manager, space_manager):
+    space_manager.create_space("batch_space")
+    files = {
+        "a.txt": "A",
+        "conf/app.yaml": {"debug": True},
+        "conf/deep/data.json": {"items": [1, 2]},
+    }
+
+    with patch.object(
+        space_file_manager,
+        "_get_space_path",
+        wraps=space_file_manager._get_space_path,
+    ) as resolve:
+        results = space_file_manager.set_files("batch_space", files)
+
+    assert resolve.call_count == 1
+    assert list(results) == list(files)
+    assert all(r == {"success": True, "error": None} for r in results.values())
+    assert space_file_manager.get_file("batch_space", "a.txt") == "A"
+    assert space_file_manager.get_file(
+        "batch_space", "conf/app.yaml", load=True
+    ) == {"debug": True}
+    assert space_file_manager.get_file(
+        "batch_space", "conf/deep/data.json", load=True
+    ) == {"items": [1, 2]}
+
+
+def test_set_files_reports_per_file_errors(space_manager):
+    space_manager.create_space("batch_errors")
+    sfm = SpaceFileManager(space_manager=space_manager, write_workers=4)
+
+    results = sfm.set_files(
+        "batch_errors",
+        {"ok.txt": "fine", "bad.txt": 42, "../escape.txt": "nope"},
+    )
+
+    assert results["ok.txt"]["success"] is True
+    assert results["bad.txt"]["success"] is False
+    assert "UNSUPPORTED_CONTENT_TYPE" in str(results["bad.txt"]["error"])
+    assert "INVALID_FILE_PATH" in str(results["../escape.txt"]["error"])
+    assert sfm.get_file("batch_errors", "ok.txt") == "fine"
+
+
+def test_set_files_space_not_found(space_file_manager):
+    with pytest.raises(SpaceFileManagerException, match="SPACE_NOT_FOUND"):
+        space_file_manager.set_files("no_such_space", {"a.txt": "A"})
+
+
+def test_set_files_atomic_success(space_file_manager, space_manager):
+    space_manager.create_space("atomic_space")
+    space_path = space_manager.get_space("atomic_space")["path"]
+    space_file_manager.set_file("atomic_space", "keep.txt", "old")
+
+    results = space_file_manager.set_files(
+        "atomic_space",
+        {"keep.txt": "new", "sub/new.txt": "created"},
+        atomic=True,
+    )
+
+    assert all(r["success"] for r in results.values())
+    assert space_file_manager.get_file("atomic_space", "keep.txt") == "new"
+    assert (
+        space_file_manager.get_file("atomic_space", "sub/new.txt") == "created"
+    )
+    assert sorted(os.listdir(space_path)) == [
+        "keep.txt",
+        "metadata.yaml",
+        "sub",
+    ]
+
+
+def test_set_files_atomic_failure_changes_nothing(
+    space_file_manager, space_manager
+):
+    space_manager.create_space("atomic_fail")
+    space_path = space_manager.get_space("atomic_fail")["path"]
+    space_file_manager.set_file("atomic_fail", "keep.txt", "old")
+
+    with pytest.raises(SpaceFileManagerException) as exc_info:
+        space_file_manager.set_files(
+            "atomic_fail",
+            {"keep.txt": "new", "fresh.txt": "x", "bad.txt": 42},
+            atomic=True,
+        )
+
+    assert "BATCH_WRITE_FAILED" in str(exc_info.value)
+    results = exc_info.value.metadata["results"]
+    assert not any(r["success"] for r in results.values())
+    assert space_file_manager.get_file("atomic_fail", "keep.txt") == "old"
+    assert sorted(os.listdir(space_path)) == ["keep.txt", "metadata.yaml"]
+
+
+def test_set_files_atomic_rolls_back_partial_commit(
+    space_file_manager, space_manager
+):
+    space_manager.create_space("atomic_rollback")
+    space_path = space_manager.get_space("atomic_rollback")["path"]
+    space_file_manager.set_file("atomic_rollback", "a.txt", "old a")
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        if dst == os.path.join(space_path, "b.txt"):
+            raise OSError("Mocked rename failure")
+        return real_replace(src, dst)
+
+    with patch(
+        "darca_space_manager.space_file_manager.os.replace",
+        side_effect=failing_replace,
+    ), pytest.raises(SpaceFileManagerException, match="BATCH_WRITE_FAILED"):
+        space_file_manager.set_files(
+            "atomic_rollback",
+            {"a.txt": "new a", "b.txt": "new b"},
+            atomic=True,
+        )
+
+    assert space_file_manager.get_file("atomic_rollback", "a.txt") == "old a"
+    assert sorted(os.listdir(space_path)) == ["a.txt", "metadata.yaml"]
+
+
+def test_set_files_refuses_directory_targets(
+    space_file_manager, space_manager
+):
+    space_manager.create_space("dir_target")
+    space_path = space_manager.get_space("dir_target")["path"]
+    space_file_manager.set_file("dir_target", "data/keep.txt", "keep")
+
+    with pytest.raises(
+        SpaceFileManagerException, match="BATCH_WRITE_FAILED"
+    ) as exc_info:
+        space_file_manager.set_files(
+            "dir_target", {"data": "oops", "new.txt": "new"}, atomic=True
+        )
+    results = exc_info.value.metadata["results"]
+    assert isinstance(results["data"]["error"], IsADirectoryError)
+    assert not os.path.exists(os.path.join(space_path, "new.txt"))
+
+    results = space_file_manager.set_files(
+        "dir_target", {"data": "oops", "new.txt": "new"}
+    )
+    assert isinstance(results["data"]["error"], IsADirectoryError)
+    assert results["new.txt"]["success"] is True
+    assert space_file_manager.get_file("dir_target", "data/keep.txt") == "keep"
+
+
+def test_set_files_bad_parent_only_fails_its_files(
+    space_file_manager, space_manager
+):
+    space_manager.create_space("bad_parent")
+    space_file_manager.set_file("bad_parent", "blocker", "a file")
+
+    results = space_file_manager.set_files(
+        "bad_parent", {"blocker/inner.txt": "x", "ok.txt": "fine"}
+    )
+
+    assert results["blocker/inner.txt"]["success"] is False
+    assert isinstance(results["blocker/inner.txt"]["error"], OSError)
+    assert results["ok.txt"]["success"] is True
+    assert space_file_manager.get_file("bad_parent", "ok.txt") == "fine"
+
+
+def test_get_files_reads_batch(space_manager):
+    space_manager.create_space("read_batch")
+    sfm = SpaceFileManager(space_manager=space_manager, read_workers=4)
+    sfm.set_files(
+        "read_batch",
+        {
+            "a.txt": "A",
+            "conf/app.yaml": {"debug": True},
+            "conf/data.json": {"items": [1]},
+        },
+    )
+    paths = ["conf/data.json", "a.txt", "conf/app.yaml", "missing.txt"]
+
+    with patch.object(
+        sfm, "_get_space_path", wraps=sfm._get_space_path
+    ) as resolve:
+        results = sfm.get_files("read_batch", paths)
+
+    assert resolve.call_count == 1
+    assert list(results) == paths
+    assert results["a.txt"] == {"content": "A", "error": None}
+    assert results["conf/app.yaml"]["content"] == {"debug": True}
+    assert results["conf/data.json"]["content"] == {"items": [1]}
+    assert results["missing.txt"]["content"] is None
+    assert "FILE_READ_FAILED" in str(results["missing.txt"]["error"])
+
+
+def test_get_files_raw_and_invalid_path(space_file_manager, space_manager):
+    space_manager.create_space("read_raw")
+    space_file_manager.set_file("read_raw", "data.json", '{"a": 1}')
+
+    results = space_file_manager.get_files(
+        "read_raw", ["data.json", "../outside.txt"], load=False
+    )
+
+    assert results["data.json"]["content"] == '{"a": 1}'
+    assert "INVALID_FILE_PATH" in str(results["../outside.txt"]["error"])
+
+
+def test_get_files_space_not_found(space_file_manager):
+    with pytest.raises(SpaceFileManagerException, match="SPACE_NOT_FOUND"):
+        space_file_manager.get_files("no_such_space", ["a.txt"])
+
+
+def test_document_cache_skips_parsing(space_manager):
+    space_manager.create_space("cached_docs")
+    sfm = SpaceFileManager(
+        space_manager=space_manager, document_cache=DocumentCache()
+    )
+    sfm.set_file("cached_docs", "app.yaml", {"debug": True, "tags": ["a"]})
+    first = sfm.get_file("cached_docs", "app.yaml", load=True)
+    first["tags"].append("mutated")
+
+    with patch(
+        "darca_space_manager.space_file_manager.YamlUtils.load_yaml_file",
+        side_effect=AssertionError("parsed again"),
+    ):
+        second = sfm.get_file("cached_docs", "app.yaml", load=True)
+        batch = sfm.get_files("cached_docs", ["app.yaml"])
+
+    assert second == {"debug": True, "tags": ["a"]}
+    assert batch["app.yaml"]["content"] == second
+
+
+def test_document_cache_invalidated_by_writes(space_manager):
+    space_manager.create_space("cached_writes")
+    space_path = space_manager.get_space("cached_writes")["path"]
+    sfm = SpaceFileManager(
+        space_manager=space_manager, document_cache=DocumentCache()
+    )
+    sfm.set_file("cached_writes", "data.json", {"v": 1})
+    assert sfm.get_file("cached_writes", "data.json", load=True) == {"v": 1}
+    file_path = os.path.join(space_path, "data.json")
+    mtime_ns = os.stat(file_path).st_mtime_ns
+
+    # Same inode, size and mtime: only explicit invalidation catches this
+    sfm.set_file("cached_writes", "data.json", {"v": 2})
+    os.utime(file_path, ns=(mtime_ns, mtime_ns))
+    assert sfm.get_file("cached_writes", "data.json", load=True) == {"v": 2}
+
+    sfm.set_files("cached_writes", {"data.json": {"v": 3}})
+    os.utime(file_path, ns=(mtime_ns, mtime_ns))
+    assert sfm.get_file("cached_writes", "data.json", load=True) == {"v": 3}
+
+    sfm.delete_file("cached_writes", "data.json")
+    with pytest.raises(SpaceFileManagerException, match="FILE_READ_FAILED"):
+        sfm.get_file("cached_writes", "data.json", load=True)
+
+
+def test_get_file_bytes(space_file_manager, space_manager):
+    space_manager.create_space("bytes_space")
+    space_path = space_manager.get_space("bytes_space")["path"]
+    with open(os.path.join(space_path, "blob.bin"), "wb") as f:
+        f.write(b"\x00\xff\x10")
+
+    assert (
+        space_file_manager.get_file_bytes("bytes_space", "blob.bin")
+        == b"\x00\xff\x10"
+    )
+    with pytest.raises(SpaceFileManagerException, match="FILE_READ_FAILED"):
+        space_file_manager.get_file_bytes("bytes_space", "missing.bin")
+    with pytest.raises(SpaceFileManagerException, match="INVALID_FILE_PATH"):
+        space_file_manager.get_file_bytes("bytes_space", "../escape.bin")
+
+
+def test_open_mmap(space_file_manager, space_manager):
+    space_manager.create_space("mmap_space")
+    space_path = space_manager.get_space("mmap_space")["path"]
+    payload = bytes(range(256)) * 64
+    with open(os.path.join(space_path, "data.bin"), "wb") as f:
+        f.write(payload)
+    open(os.path.join(space_path, "empty.bin"), "wb").close()
+
+    with space_file_manager.open_mmap("mmap_space", "data.bin") as data:
+        assert len(data) == len(payload)
+        assert data[256:260] == b"\x00\x01\x02\x03"
+        with pytest.raises(TypeError):
+            data[0] = 1
+
+    with space_file_manager.open_mmap("mmap_space", "empty.bin") as data:
+        assert len(data) == 0
+
+    with pytest.raises(SpaceFileManagerException, match="FILE_MMAP_FAILED"):
+        space_file_manager.open_mmap("mmap_space", "missing.bin")
+    with pytest.raises(SpaceFileManagerException, match="INVALID_FILE_PATH"):
+        space_file_manager.open_mmap("mmap_space", "../escape.bin")
+
+
+def test_write_from_iterable_and_iter_chunks(
+    space_file_manager, space_manager
+):
+    space_manager.create_space("stream_io")
+    chunks = [b"a" * 1000, "b" * 1000, b"c" * 500]
+
+    written = space_file_manager.write_from_iterable(
+        "stream_io", "out/data.bin", iter(chunks), chunk_size=256
+    )
+
+    assert written == 2500
+    read_back = list(
+        space_file_manager.iter_chunks(
+            "stream_io", "out/data.bin", chunk_size=1024
+        )
+    )
+    assert [len(chunk) for chunk in read_back] == [1024, 1024, 452]
+    assert b"".join(read_back) == b"a" * 1000 + b"b" * 1000 + b"c" * 500
+
+
+def test_write_from_iterable_failure_keeps_old_file(
+    space_file_manager, space_manager
+):
+    space_manager.create_space("stream_fail")
+    space_path = space_manager.get_space("stream_fail")["path"]
+    space_file_manager.set_file("stream_fail", "data.txt", "old")
+
+    def broken_chunks():
+        yield b"partial"
+        raise RuntimeError("producer failed")
+
+    with pytest.raises(SpaceFileManagerException, match="FILE_WRITE_FAILED"):
+        space_file_manager.write_from_iterable(
+            "stream_fail", "data.txt", broken_chunks()
+        )
+
+    assert space_file_manager.get_file("stream_fail", "data.txt") == "old"
+    assert sorted(os.listdir(space_path)) == ["data.txt", "metadata.yaml"]
+
+
+def test_open_write_stream_is_atomic(space_file_manager, space_manager):
+    space_manager.create_space("stream_atomic")
+    space_file_manager.set_file("stream_atomic", "data.txt", "old")
+
+    with space_file_manager.open_write_stream(
+        "stream_atomic", "data.txt"
+    ) as writer:
+        writer.write("new ")
+        # Not visible until the stream is closed
+        assert space_file_manager.get_file("stream_atomic", "data.txt") == (
+            "old"
+        )
+        writer.write(b"content")
+
+    assert writer.bytes_written == 11
+    assert (
+        space_file_manager.get_file("stream_atomic", "data.txt")
+        == "new content"
+    )
+
+    writer = space_file_manager.open_write_stream("stream_atomic", "data.txt")
+    writer.write(b"discarded")
+    writer.abort()
+    assert (
+        space_file_manager.get_file("stream_atomic", "data.txt")
+        == "new content"
+    )
+
+
+def test_open_write_stream_syncs_directory(space_file_manager, space_manager):
+    space_manager.create_space("stream_sync")
+    space_path = space_manager.get_space("stream_sync")["path"]
+
+    with patch(
+        "darca_space_manager.space_file_manager.fsync_directory"
+    ) as fsync_directory:
+        with space_file_manager.open_write_stream(
+            "stream_sync", "sub/data.txt"
+        ) as writer:
+            writer.write(b"durable")
+            fsync_directory.assert_not_called()
+    fsync_directory.assert_called_once_with(os.path.join(space_path, "sub"))
+
+
+def test_stream_paths_are_checked(space_file_manager, space_manager):
+    space_manager.create_space("stream_bounds")
+
+    with pytest.raises(SpaceFileManagerException, match="INVALID_FILE_PATH"):
+        space_file_manager.open_write_stream("stream_bounds", "../x.bin")
+    with pytest.raises(SpaceFileManagerException, match="INVALID_FILE_PATH"):
+        space_file_manager.open_read_stream("stream_bounds", "../x.bin")
+    with pytest.raises(SpaceFileManagerException, match="FILE_READ_FAILED"):
+        list(space_file_manager.iter_chunks("stream_bounds", "missing.bin"))
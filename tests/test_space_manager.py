@@ -1,10 +1,14 @@
 # tests/test_space_manager.py
 
+import contextlib
 import os
+import threading
 import time
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from darca_yaml.yaml_utils import YamlUtils
 
 from darca_space_manager.space_manager import (
     SpaceManagerException,
@@ -97,6 +101,30 @@ def test_refresh_index_success(space_manager):
     assert space_manager.space_exists("refresh")
 
 
+def test_create_space_does_not_rescan(space_manager):
+    with patch.object(
+        space_manager, "_scan_directory", side_effect=AssertionError
+    ):
+        space_manager.create_space("delta")
+    assert space_manager.space_exists("delta")
+    assert space_manager._load_index()["spaces"][0]["name"] == "delta"
+
+
+def test_delete_space_removes_nested_from_index(space_manager):
+    space_manager.create_space("outer")
+    space_manager.create_space("inner", parent_path="outer/sub")
+    space_manager.create_space("outer_sibling")
+    with patch.object(
+        space_manager, "_scan_directory", side_effect=AssertionError
+    ):
+        space_manager.delete_space("outer")
+    assert not space_manager.space_exists("outer")
+    assert not space_manager.space_exists("inner")
+    assert space_manager.space_exists("outer_sibling")
+    persisted = [s["name"] for s in space_manager._load_index()["spaces"]]
+    assert persisted == ["outer_sibling"]
+
+
 # === Additional Coverage Tests ===
 
 
@@ -114,12 +142,13 @@ def test_load_index_failure(monkeypatch):
         space_manager.SpaceManagerException,
         match="Failed to load spaces index.",
     ):
-        space_manager.SpaceManager()._load_index()
+        space_manager.SpaceManager(index_backend="yaml")._load_index()
 
 
 def test_save_index_failure(space_manager, monkeypatch):
     monkeypatch.setattr(
-        "darca_yaml.yaml_utils.YamlUtils.save_yaml_file",
+        space_manager._store,
+        "save",
         lambda *_: (_ for _ in ()).throw(Exception("Fail save")),
     )
     space_manager.index["spaces"].append({"dummy": True})
@@ -154,12 +183,6 @@ def test_scan_directory_metadata_load_failure(
     failmeta.mkdir()
     (failmeta / "metadata.yaml").write_text("this: will break: badly")
 
-    monkeypatch.setattr(
-        "darca_file_utils.directory_utils.DirectoryUtils.list_directory",
-        lambda *_1, **_2: [
-            str((failmeta / "metadata.yaml").relative_to(tmp_path))
-        ],
-    )
     monkeypatch.setattr(space_manager, "space_dir", str(tmp_path))
 
     files = space_manager._scan_directory(str(tmp_path))
@@ -169,12 +192,11 @@ def test_scan_directory_metadata_load_failure(
     # caplog.messages)
 
 
-def test_scan_directory_exception(space_manager, monkeypatch):
-    monkeypatch.setattr(
-        "darca_file_utils.directory_utils.DirectoryUtils.list_directory",
-        lambda *_: (_ for _ in ()).throw(Exception("explosion")),
-    )
-    with pytest.raises(
+def test_scan_directory_exception(space_manager):
+    with patch(
+        "darca_space_manager.space_manager.os.scandir",
+        side_effect=Exception("explosion"),
+    ), pytest.raises(
         SpaceManagerException, match="Unexpected error during directory scan."
     ):
         space_manager._scan_directory("/tmp/fake")
@@ -273,19 +295,61 @@ def test_remove_directory_failure(space_manager, monkeypatch):
         space_manager.remove_directory("rmdirfail", "sub")
 
 
-def test_scan_directory_directoryutils_exception(space_manager, monkeypatch):
-    from darca_file_utils.directory_utils import DirectoryUtilsException
+def test_scan_directory_missing_root(space_manager, tmp_path):
+    with pytest.raises(SpaceManagerException, match="DIRECTORY_SCAN_FAILED"):
+        space_manager._scan_directory(str(tmp_path / "missing"))
 
-    def broken_list_directory(directory, recursive=True):
-        raise DirectoryUtilsException("Simulated failure")
 
-    monkeypatch.setattr(
-        "darca_file_utils.directory_utils.DirectoryUtils.list_directory",
-        broken_list_directory,
+def test_scan_directory_skips_unreadable_subdir(space_manager, tmp_path):
+    (tmp_path / "locked").mkdir()
+    real_scandir = os.scandir
+
+    def selective_scandir(path):
+        if str(path).endswith("locked"):
+            raise PermissionError("denied")
+        return real_scandir(path)
+
+    with patch(
+        "darca_space_manager.space_manager.os.scandir", selective_scandir
+    ):
+        assert space_manager._scan_directory(str(tmp_path)) == []
+
+
+def _write_metadata(directory, name):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "metadata.yaml").write_text(
+        f"name: {name}\nlabel: ''\npath: {directory}\n"
+        "created_at: '2025-01-01T00:00:00+00:00'\n"
     )
 
-    with pytest.raises(SpaceManagerException, match="DIRECTORY_SCAN_FAILED"):
-        space_manager._scan_directory("/dummy")
+
+def test_scan_directory_finds_nested_spaces(space_manager, tmp_path):
+    _write_metadata(tmp_path / "b", "b")
+    _write_metadata(tmp_path / "a", "a")
+    _write_metadata(tmp_path / "a" / "data" / "child", "child")
+    (tmp_path / "a" / "data" / "file.bin").write_bytes(b"x")
+
+    names = [m["name"] for m in space_manager._scan_directory(str(tmp_path))]
+    assert names == ["a", "child", "b"]
+
+
+def test_scan_directory_honours_ignore_file(space_manager, tmp_path):
+    _write_metadata(tmp_path / "a", "a")
+    _write_metadata(tmp_path / "a" / "big" / "hidden", "hidden")
+    _write_metadata(tmp_path / "a" / "deep" / "skip" / "also", "also")
+    _write_metadata(tmp_path / "a" / "deep" / "keep", "keep")
+    (tmp_path / "a" / ".spaceignore").write_text(
+        "# large data\nbig\n/deep/skip/\n"
+    )
+
+    with patch.object(
+        YamlUtils, "load_yaml_file", wraps=YamlUtils.load_yaml_file
+    ) as loader:
+        names = [
+            m["name"] for m in space_manager._scan_directory(str(tmp_path))
+        ]
+    assert names == ["a", "keep"]
+    assert loader.call_count == 2
 
 
 def test_get_space_path_success(space_manager):
@@ -355,51 +419,42 @@ def test_get_directory_last_modified_nonexistent_space(space_manager):
 
 def test_get_directory_last_modified_no_entries(space_manager):
     """
-    Force DirectoryUtils.list_directory to return an empty list,
-    ensuring we hit the line:
-        if not all_entries:
-            return os.path.getmtime(space["path"])
+    A space without any files (not even metadata.yaml) falls back to the
+    directory's own mtime.
     """
     space_name = "no_entries_space"
     space_manager.create_space(space_name)
+    dir_path = space_manager.get_space(space_name)["path"]
+    os.remove(os.path.join(dir_path, "metadata.yaml"))
 
-    # Mock list_directory to always return an empty list
-    with patch(
-        "darca_file_utils.directory_utils.DirectoryUtils.list_directory",
-        return_value=[],
-    ):
-        mtime = space_manager.get_directory_last_modified(space_name)
+    mtime = space_manager.get_directory_last_modified(space_name)
 
     # We expect a float (the directory's own mtime)
     assert isinstance(
         mtime, float
     ), "Should return a float for an empty directory."
-    # Optionally check that mtime matches the actual directory's mtime
-    dir_path = space_manager.get_space(space_name)["path"]
     assert abs(mtime - os.path.getmtime(dir_path)) < 0.01
 
 
 def test_get_directory_last_modified_only_subdirs_no_files(space_manager):
     """
-    By mocking DirectoryUtils.list_directory to return only subdirectories
-    (no files), we ensure 'all_entries' is non-empty while 'latest_timestamp'
-    remains 0.0, forcing the code to return the directory's own mtime.
+    A subdirectory that only holds (nested) directories has no file mtime,
+    so the subdirectory's own mtime is returned.
     """
     space_name = "only_subdirs_space"
     space_manager.create_space(space_name)
     space_path = space_manager.get_space(space_name)["path"]
+    tree_path = os.path.join(space_path, "tree")
+    for sub in ("sub1", os.path.join("sub2", "nested")):
+        os.makedirs(os.path.join(tree_path, sub))
 
-    # Mock DirectoryUtils.list_directory to return subdirectories (no files)
-    with patch(
-        "darca_file_utils.directory_utils.DirectoryUtils.list_directory"
-    ) as mock_list:
-        mock_list.return_value = ["sub1", "sub2", "sub2/nested"]
-
-        dir_mtime = space_manager.get_directory_last_modified(space_name)
+    dir_mtime = space_manager.get_directory_last_modified(
+        space_name, directory="tree"
+    )
 
     assert isinstance(dir_mtime, float), "Should return a float timestamp."
 
-    actual_mtime = os.path.getmtime(space_path)
+    actual_mtime = os.path.getmtime(tree_path)
     assert (
         abs(dir_mtime - actual_mtime) < 0.01
     ), "Expected the directory's own mtime since no files exist."
@@ -408,7 +463,7 @@ def test_get_directory_last_modified_only_subdirs_no_files(space_manager):
 def test_get_directory_last_modified_exception(space_manager):
     """
     Force an error inside get_directory_last_modified by mocking
-    DirectoryUtils.list_directory to raise an exception, ensuring we hit:
+    os.scandir to raise an exception, ensuring we hit:
 
         except Exception as e:
             logger.error(...)
@@ -418,7 +473,7 @@ def test_get_directory_last_modified_exception(space_manager):
     space_manager.create_space(space_name)
 
     with patch(
-        "darca_file_utils.directory_utils.DirectoryUtils.list_directory",
+        "darca_space_manager.space_manager.os.scandir",
         side_effect=OSError("Mocked error"),
     ):
         with pytest.raises(SpaceManagerException) as exc_info:
@@ -496,3 +551,436 @@ def test_get_directory_last_modified_subdirectory_escape(space_manager):
             space_name, directory="../escape"
         )
     assert "escapes space boundaries" in str(exc_info.value)
+
+
+def test_sync_index_reloads_only_on_change(space_manager):
+    from darca_space_manager.space_manager import SpaceManager
+
+    other = SpaceManager()
+    space_manager.sync_index()
+    assert not space_manager.sync_index()
+
+    other.create_space("from_other")
+    assert not space_manager.space_exists("from_other")
+    assert space_manager.sync_index()
+    assert space_manager.space_exists("from_other")
+    assert not space_manager.sync_index()
+
+
+def test_lookup_maps_follow_mutations(space_manager):
+    space_manager.create_space("a1", label="alpha")
+    space_manager.create_space("a2", label="alpha")
+    space_manager.create_space("b1", label="beta")
+    space_manager.delete_space("a1")
+
+    assert [s["name"] for s in space_manager.list_spaces("alpha")] == ["a2"]
+    assert [s["name"] for s in space_manager.list_spaces("beta")] == ["b1"]
+    assert space_manager.list_spaces("gamma") == []
+    assert space_manager.get_space("a1") is None
+    assert space_manager.get_space("b1")["label"] == "beta"
+
+
+def test_lookup_maps_rebuilt_when_index_replaced(space_manager):
+    space_manager.create_space("old", label="x")
+    space_manager.index = {
+        "spaces": [
+            {"name": "new", "label": "x", "path": "/p1", "created_at": ""},
+            {"name": "new", "label": "y", "path": "/p2", "created_at": ""},
+        ]
+    }
+    assert not space_manager.space_exists("old")
+    assert space_manager.get_space("new")["path"] == "/p1"
+    assert [s["path"] for s in space_manager.list_spaces("x")] == ["/p1"]
+
+
+def test_scan_directory_parallel_matches_serial(space_manager, tmp_path):
+    for i in range(12):
+        _write_metadata(tmp_path / f"s{i:02d}" / "nested", f"n{i}")
+        _write_metadata(tmp_path / f"s{i:02d}", f"s{i}")
+    (tmp_path / "bad").mkdir()
+    (tmp_path / "bad" / "metadata.yaml").write_text("name: only\n")
+
+    serial = space_manager._scan_directory(str(tmp_path))
+    space_manager.metadata_workers = 4
+    parallel = space_manager._scan_directory(str(tmp_path))
+
+    assert parallel == serial
+    assert len(parallel) == 24
+    assert len(space_manager.last_scan_issues) == 1
+    assert "incomplete metadata" in space_manager.last_scan_issues[0]
+
+
+def test_metadata_workers_from_env(temp_darca_env, monkeypatch):
+    from darca_space_manager.space_manager import SpaceManager
+
+    monkeypatch.setenv("DARCA_SPACE_METADATA_WORKERS", "8")
+    assert SpaceManager().metadata_workers == 8
+    assert SpaceManager(metadata_workers=2).metadata_workers == 2
+
+
+@pytest.mark.parametrize("backend", ["jsonl", "sqlite", "yaml"])
+def test_index_backend_persists_spaces(temp_darca_env, monkeypatch, backend):
+    from darca_space_manager.space_manager import SpaceManager
+
+    monkeypatch.setenv("DARCA_SPACE_INDEX_BACKEND", backend)
+    manager = SpaceManager()
+    manager.create_space("persisted", label="p")
+
+    assert os.path.basename(manager._store.path).startswith("spaces_index.")
+    assert manager._store.get("persisted")["label"] == "p"
+    assert SpaceManager().get_space("persisted")["label"] == "p"
+
+
+def test_load_index_imports_legacy_yaml(temp_darca_env):
+    from darca_space_manager.space_manager import SpaceManager
+
+    SpaceManager(index_backend="yaml").create_space("legacy")
+    manager = SpaceManager(index_backend="jsonl")
+    os.remove(manager._store.path)
+
+    loaded = manager._load_index()
+    assert [s["name"] for s in loaded["spaces"]] == ["legacy"]
+
+
+def test_export_index(space_manager):
+    space_manager.create_space("exported")
+    path = space_manager.export_index()
+    assert path.endswith("spaces_index.yaml")
+    assert YamlUtils.load_yaml_file(path) == space_manager.index
+
+
+def test_export_index_failure(space_manager, tmp_path):
+    with patch.object(
+        space_manager._store, "export_yaml", side_effect=OSError("ro")
+    ), pytest.raises(SpaceManagerException, match="INDEX_EXPORT_FAILED"):
+        space_manager.export_index(str(tmp_path / "out.yaml"))
+
+
+def test_create_space_appends_to_journal(space_manager):
+    store = space_manager._store
+    snapshot_mtime = os.stat(store.path).st_mtime_ns
+
+    space_manager.create_space("journaled")
+    space_manager.delete_space("journaled")
+
+    assert os.stat(store.path).st_mtime_ns == snapshot_mtime
+    with open(store.journal_path) as f:
+        assert len(f.readlines()) == 2
+
+
+def test_shared_space_manager_per_base(temp_darca_env, monkeypatch, tmp_path):
+    from darca_space_manager import get_shared_space_manager
+
+    first = get_shared_space_manager()
+    assert get_shared_space_manager() is first
+
+    monkeypatch.setenv("DARCA_SPACE_BASE", str(tmp_path))
+    other = get_shared_space_manager()
+    assert other is not first
+    assert other.space_dir.startswith(str(tmp_path))
+
+
+def test_lazy_manager_skips_discovery(space_manager):
+    from darca_space_manager.space_manager import SpaceManager
+
+    space_manager.create_space("known", label="k")
+    space_manager.create_space("nested", parent_path="known/sub")
+
+    with patch.object(
+        SpaceManager, "_scan_directory", side_effect=AssertionError
+    ):
+        lazy = SpaceManager(lazy=True)
+        assert lazy.index["spaces"] == []
+        assert lazy.get_space("nested")["name"] == "nested"
+        assert lazy.space_exists("known")
+        assert [s["name"] for s in lazy.list_spaces("k")] == ["known"]
+        assert len(lazy.list_spaces()) == 2
+
+
+def test_lazy_manager_probes_default_location(space_manager):
+    from darca_space_manager.space_manager import SpaceManager
+
+    lazy = SpaceManager(lazy=True)
+    assert lazy.get_space("outside") is None
+
+    _write_metadata(Path(space_manager.space_dir) / "outside", "outside")
+    assert lazy.get_space("outside")["name"] == "outside"
+    assert lazy._store.get("outside")["name"] == "outside"
+
+
+def test_lazy_manager_drops_vanished_space(space_manager):
+    import shutil
+
+    from darca_space_manager.space_manager import SpaceManager
+
+    space_manager.create_space("vanishing")
+    shutil.rmtree(space_manager.get_space("vanishing")["path"])
+
+    lazy = SpaceManager(lazy=True)
+    assert lazy.get_space("vanishing") is None
+    assert lazy._store.get("vanishing") is None
+
+
+def test_lazy_manager_without_index_discovers(temp_darca_env):
+    from darca_space_manager.space_manager import SpaceManager
+
+    lazy = SpaceManager(lazy=True)
+    assert lazy._complete
+    assert lazy._store.exists()
+
+
+def test_lazy_manager_sync_and_background_reconcile(space_manager):
+    from darca_space_manager.space_manager import SpaceManager
+
+    space_manager.create_space("first")
+    lazy = SpaceManager(lazy=True)
+    assert lazy.get_space("first")
+
+    space_manager.delete_space("first")
+    assert lazy.sync_index()
+    assert lazy.get_space("first") is None
+
+    lazy.reconcile_in_background().join()
+    assert lazy._complete
+
+
+def test_lookups_during_background_reconcile(space_manager):
+    from darca_space_manager import SpaceFileManager
+    from darca_space_manager.space_manager import SpaceManager
+
+    space_manager.create_space("busy")
+    lazy = SpaceManager(lazy=True)
+    files = SpaceFileManager(space_manager=lazy)
+    files.set_file("busy", "a.txt", "A")
+
+    with _blocked_scan(lazy) as started:
+        reconcile = lazy.reconcile_in_background()
+        assert started.wait(5)
+        assert _finishes(lambda: files.get_file("busy", "a.txt"), 2)
+        assert _finishes(lazy.sync_index, 2)
+    reconcile.join(5)
+    assert lazy._complete
+
+
+def test_lazy_from_env(space_manager, monkeypatch):
+    from darca_space_manager.space_manager import SpaceManager
+
+    monkeypatch.setenv("DARCA_SPACE_LAZY", "true")
+    assert SpaceManager().lazy
+
+
+@contextlib.contextmanager
+def _blocked_scan(manager):
+    """
+    Hold ``manager``'s discovery walk after it scanned the tree until the
+    block exits. Yields an event that is set once the walk is underway.
+    """
+    started, release = threading.Event(), threading.Event()
+    scan = manager._scan_directory
+
+    def slow_scan(directory):
+        result = scan(directory)
+        started.set()
+        release.wait(10)
+        return result
+
+    with patch.object(manager, "_scan_directory", side_effect=slow_scan):
+        try:
+            yield started
+        finally:
+            release.set()
+
+
+def _finishes(func, timeout=5):
+    """Run ``func`` on a thread and report whether it returned in time."""
+    thread = threading.Thread(target=func, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def test_delete_space_does_not_block_lookups(space_manager):
+    from darca_space_manager.space_manager import DirectoryUtils
+
+    space_manager.create_space("doomed")
+    space_manager.create_space("other")
+    started, release = threading.Event(), threading.Event()
+    remove = DirectoryUtils.remove_directory
+
+    def slow_remove(path):
+        remove(path)
+        started.set()
+        release.wait(10)
+
+    with patch.object(
+        DirectoryUtils, "remove_directory", side_effect=slow_remove
+    ):
+        delete = threading.Thread(
+            target=space_manager.delete_space, args=("doomed",)
+        )
+        delete.start()
+        try:
+            assert started.wait(5)
+            assert _finishes(space_manager.sync_index, 2)
+            assert _finishes(lambda: space_manager.get_space("other"), 2)
+        finally:
+            release.set()
+        delete.join(5)
+    assert space_manager.get_space("doomed") is None
+
+
+def test_refresh_index_without_changes_keeps_generation(space_manager):
+    space_manager.create_space("stable")
+    generation = space_manager.generation
+    stamp = space_manager._stat_index()
+
+    space_manager.refresh_index()
+
+    assert space_manager.generation == generation
+    assert space_manager._stat_index() == stamp
+
+    os.makedirs(os.path.join(space_manager.space_dir, "new_dir"))
+    YamlUtils.save_yaml_file(
+        os.path.join(space_manager.space_dir, "new_dir", "metadata.yaml"),
+        {
+            "name": "new_dir",
+            "label": "",
+            "path": os.path.join(space_manager.space_dir, "new_dir"),
+            "created_at": "2025-01-01T00:00:00+00:00",
+        },
+    )
+    space_manager.refresh_index()
+    assert space_manager.generation != generation
+    assert space_manager.get_space("new_dir")
+
+
+def test_refresh_index_does_not_block_writers(space_manager):
+    from darca_space_manager.space_manager import SpaceManager
+
+    space_manager.create_space("before")
+    with _blocked_scan(space_manager) as started:
+        refresh = threading.Thread(target=space_manager.refresh_index)
+        refresh.start()
+        assert started.wait(5)
+
+        other = SpaceManager()
+        assert _finishes(lambda: other.create_space("during"))
+    refresh.join(5)
+
+    # The space created during the walk survives the swap
+    assert space_manager.get_space("during")
+    assert space_manager.get_space("before")
+    assert SpaceManager().get_space("during")
+
+
+def _create_spaces_in_process(prefix, count):
+    from darca_space_manager.space_manager import SpaceManager
+
+    manager = SpaceManager()
+    for i in range(count):
+        manager.create_space(f"{prefix}_{i}")
+
+
+def test_concurrent_processes_do_not_lose_updates(space_manager):
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("fork")
+    workers = [
+        ctx.Process(target=_create_spaces_in_process, args=(f"w{n}", 5))
+        for n in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    persisted = {s["name"] for s in space_manager._store.load()["spaces"]}
+    assert persisted == {f"w{n}_{i}" for n in range(4) for i in range(5)}
+
+
+def test_create_space_sees_other_writer(space_manager):
+    from darca_space_manager.space_manager import SpaceManager
+
+    other = SpaceManager()
+    other.create_space("contested")
+    with pytest.raises(SpaceManagerException, match="already exists"):
+        space_manager.create_space("contested")
+
+
+def test_generation_counter(space_manager):
+    store = space_manager._store
+    before = store.generation()
+    space_manager.create_space("gen")
+    assert store.generation() == before + 1
+    assert space_manager._generation == before + 1
+
+
+def test_sync_index_ignores_touch_without_new_generation(space_manager):
+    space_manager.create_space("touched")
+    os.utime(space_manager._store.path, ns=(1, 1))
+
+    with patch.object(
+        space_manager, "_load_index", side_effect=AssertionError
+    ):
+        assert not space_manager.sync_index()
+    assert space_manager._index_stamp == space_manager._stat_index()
+
+
+def test_get_directory_last_modified_ignores_rest_of_space(space_manager):
+    space_manager.create_space("scoped_mtime")
+    base_path = space_manager.get_space("scoped_mtime")["path"]
+    os.makedirs(os.path.join(base_path, "old"))
+    old_file = os.path.join(base_path, "old", "a.txt")
+    new_file = os.path.join(base_path, "new.txt")
+    for path in (old_file, new_file):
+        with open(path, "w") as f:
+            f.write("x")
+    os.utime(old_file, (1_000_000, 1_000_000))
+    os.utime(new_file, (2_000_000, 2_000_000))
+
+    assert space_manager.get_directory_last_modified(
+        "scoped_mtime", directory="old"
+    ) == pytest.approx(1_000_000)
+
+
+def test_get_directory_last_modified_newer_than_stops_early(space_manager):
+    space_manager.create_space("cutoff_mtime")
+    base_path = space_manager.get_space("cutoff_mtime")["path"]
+    for i in range(5):
+        path = os.path.join(base_path, f"f{i}.txt")
+        with open(path, "w") as f:
+            f.write("x")
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+    os.utime(os.path.join(base_path, "metadata.yaml"), (1_000_000, 1_000_000))
+    stats = []
+    real_scandir = os.scandir
+
+    class _Entries:
+        def __init__(self, path):
+            self._it = real_scandir(path)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._it.close()
+
+        def __iter__(self):
+            for entry in self._it:
+                stats.append(entry.name)
+                yield entry
+
+    with patch(
+        "darca_space_manager.space_manager.os.scandir", side_effect=_Entries
+    ):
+        mtime = space_manager.get_directory_last_modified(
+            "cutoff_mtime", newer_than=1_000_000.5
+        )
+
+    assert mtime > 1_000_000.5
+    assert len(stats) < 6
+
+    assert space_manager.get_directory_last_modified(
+        "cutoff_mtime", newer_than=2_000_000
+    ) == pytest.approx(1_000_004)
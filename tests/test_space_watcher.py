@@ -0,0 +1,162 @@
+# tests/test_space_watcher.py
+
+import os
+import shutil
+import time
+from unittest.mock import patch
+
+import pytest
+
+from darca_space_manager.space_watcher import (
+    IN_Q_OVERFLOW,
+    SpaceWatcher,
+    SpaceWatcherException,
+    _load_libc,
+)
+
+requires_inotify = pytest.mark.skipif(
+    _load_libc() is None, reason="inotify not available"
+)
+
+
+def _write_space(directory, name):
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "metadata.yaml"), "w") as f:
+        f.write(
+            f"name: {name}\nlabel: ''\npath: {directory}\n"
+            "created_at: '2025-01-01T00:00:00+00:00'\n"
+        )
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+def test_unknown_backend(space_manager):
+    with pytest.raises(SpaceWatcherException, match="UNKNOWN_WATCHER"):
+        SpaceWatcher(space_manager, backend="fanotify")
+
+
+def test_inotify_unavailable(space_manager):
+    with patch(
+        "darca_space_manager.space_watcher._load_libc", return_value=None
+    ), pytest.raises(SpaceWatcherException, match="INOTIFY_UNAVAILABLE"):
+        SpaceWatcher(space_manager, backend="inotify")
+
+
+def test_poll_once_patches_index(space_manager):
+    watcher = SpaceWatcher(space_manager, backend="poll")
+    watcher._snapshot = watcher._scan_snapshot()
+    outside = os.path.join(space_manager.space_dir, "polled")
+    nested = os.path.join(outside, "deep", "child")
+
+    _write_space(outside, "polled")
+    _write_space(nested, "polled_child")
+    with patch.object(
+        space_manager, "refresh_index", side_effect=AssertionError
+    ):
+        watcher.poll_once()
+        assert space_manager.space_exists("polled")
+        assert space_manager.space_exists("polled_child")
+
+        shutil.rmtree(outside)
+        watcher.poll_once()
+    assert not space_manager.space_exists("polled")
+    assert not space_manager.space_exists("polled_child")
+
+
+def test_poll_metadata_removal_keeps_nested_spaces(space_manager):
+    watcher = SpaceWatcher(space_manager, backend="poll")
+    watcher._snapshot = watcher._scan_snapshot()
+    parent = os.path.join(space_manager.space_dir, "parent")
+    _write_space(parent, "parent")
+    _write_space(os.path.join(parent, "child"), "child")
+    watcher.poll_once()
+
+    os.remove(os.path.join(parent, "metadata.yaml"))
+    watcher.poll_once()
+
+    assert not space_manager.space_exists("parent")
+    assert space_manager.space_exists("child")
+
+
+def test_poll_thread_and_context_manager(space_manager):
+    with SpaceWatcher(space_manager, backend="poll", poll_interval=0.05):
+        _write_space(os.path.join(space_manager.space_dir, "bg"), "bg")
+        assert _wait_for(lambda: space_manager.space_exists("bg"))
+
+
+def test_invalid_metadata_is_ignored(space_manager):
+    watcher = SpaceWatcher(space_manager, backend="poll")
+    watcher._snapshot = {}
+    broken = os.path.join(space_manager.space_dir, "broken")
+    os.makedirs(broken)
+    with open(os.path.join(broken, "metadata.yaml"), "w") as f:
+        f.write("name: broken\n")
+    watcher.poll_once()
+    assert not space_manager.space_exists("broken")
+
+
+def test_own_spaces_are_not_duplicated(space_manager):
+    space_manager.create_space("mine")
+    watcher = SpaceWatcher(space_manager, backend="poll")
+    watcher._snapshot = {}
+    watcher.poll_once()
+    assert [s["name"] for s in space_manager.list_spaces()] == ["mine"]
+
+
+@requires_inotify
+def test_inotify_tracks_external_changes(space_manager):
+    root = space_manager.space_dir
+    with patch.object(
+        space_manager, "refresh_index", side_effect=AssertionError
+    ), SpaceWatcher(space_manager, backend="inotify") as watcher:
+        assert watcher.backend == "inotify"
+
+        _write_space(os.path.join(root, "live"), "live")
+        assert _wait_for(lambda: space_manager.space_exists("live"))
+
+        _write_space(os.path.join(root, "a", "b", "c"), "nested_live")
+        assert _wait_for(lambda: space_manager.space_exists("nested_live"))
+
+        os.remove(os.path.join(root, "live", "metadata.yaml"))
+        assert _wait_for(lambda: not space_manager.space_exists("live"))
+
+        shutil.move(os.path.join(root, "a"), os.path.join(root, "..", "a"))
+        assert _wait_for(lambda: not space_manager.space_exists("nested_live"))
+
+
+@requires_inotify
+def test_inotify_metadata_rename_keeps_nested_spaces(space_manager):
+    parent = os.path.join(space_manager.space_dir, "parent")
+    with SpaceWatcher(space_manager, backend="inotify"):
+        _write_space(parent, "parent")
+        _write_space(os.path.join(parent, "child"), "child")
+        assert _wait_for(lambda: space_manager.space_exists("child"))
+
+        # Editors that save by rename move the file away first
+        metadata = os.path.join(parent, "metadata.yaml")
+        os.rename(metadata, metadata + ".bak")
+        assert _wait_for(lambda: not space_manager.space_exists("parent"))
+        time.sleep(0.2)
+        assert space_manager.space_exists("child")
+
+        os.rename(metadata + ".bak", metadata)
+        assert _wait_for(lambda: space_manager.space_exists("parent"))
+
+
+@requires_inotify
+def test_inotify_overflow_triggers_refresh(space_manager):
+    watcher = SpaceWatcher(space_manager, backend="inotify").start()
+    try:
+        with patch.object(space_manager, "refresh_index") as refresh:
+            watcher._handle_event(-1, IN_Q_OVERFLOW, "")
+        refresh.assert_called_once()
+        assert watcher._watches
+    finally:
+        watcher.stop()
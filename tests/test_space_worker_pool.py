@@ -0,0 +1,138 @@
+# tests/test_space_worker_pool.py
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from darca_space_manager.space_executor import SpaceExecutorException
+from darca_space_manager.space_worker_pool import (
+    SpaceWorkerPool,
+    SpaceWorkerPoolException,
+)
+
+
+@pytest.fixture
+def pool(space_executor):
+    pool = SpaceWorkerPool(executor=space_executor, max_workers=2)
+    yield pool
+    pool.close()
+
+
+def test_run_reuses_warm_worker(pool, space_manager):
+    space_manager.create_space("warm")
+    space_path = space_manager.get_space("warm")["path"]
+    code = "import os, sys; print(os.getpid(), os.getcwd(), sys.argv[1:])"
+
+    first = pool.run("warm", ["-c", code, "a"])
+    second = pool.run("warm", ["-c", code, "b"])
+
+    pid, cwd, args = first.stdout.split(" ", 2)
+    assert first.returncode == 0
+    assert cwd == space_path
+    assert args == "['a']\n"
+    assert second.stdout.split(" ")[0] == pid
+    assert pool.stats() == {"idle": 1, "busy": 0, "spawned": 1, "reused": 1}
+
+
+def test_run_resolves_space_once(pool, space_manager):
+    space_manager.create_space("once")
+    executor = pool._executor
+
+    with patch.object(
+        executor, "_get_space_path", wraps=executor._get_space_path
+    ) as resolve:
+        pool.run("once", ["-c", "pass"])
+    assert resolve.call_count == 1
+
+
+def test_run_module_script_and_cwd(pool, space_manager):
+    space_manager.create_space("scripts")
+    space_path = space_manager.get_space("scripts")["path"]
+    os.makedirs(os.path.join(space_path, "sub"))
+    with open(os.path.join(space_path, "greet.py"), "w") as f:
+        f.write("import sys\nprint('hello', *sys.argv[1:])\n")
+
+    assert pool.run("scripts", ["greet.py", "x"]).stdout == "hello x\n"
+    assert pool.run("scripts", ["-m", "greet", "y"]).stdout == "hello y\n"
+    result = pool.run(
+        "scripts", ["-c", "import os; print(os.getcwd())"], cwd="sub"
+    )
+    assert result.stdout == os.path.join(space_path, "sub") + "\n"
+
+
+def test_run_restores_environment(pool, space_manager):
+    space_manager.create_space("environ")
+    code = "import os, sys; print(os.environ.get(sys.argv[1]))"
+
+    pool.run("environ", ["-c", "import os; os.environ['LEAKED'] = '1'"])
+    pool.run("environ", ["-c", "import os; os.environ.pop('PATH')"])
+
+    assert pool.run("environ", ["-c", code, "LEAKED"]).stdout == "None\n"
+    assert pool.run("environ", ["-c", code, "PATH"]).stdout != "None\n"
+    assert pool.stats()["spawned"] == 1
+
+
+def test_run_failures(pool, space_manager):
+    space_manager.create_space("failing")
+
+    result = pool.run(
+        "failing",
+        ["-c", "import sys; print('oops', file=sys.stderr); sys.exit(3)"],
+        check=False,
+    )
+    assert result.returncode == 3
+    assert result.stderr == "oops\n"
+
+    with pytest.raises(SpaceExecutorException) as exc_info:
+        pool.run("failing", ["-c", "raise ValueError('bad')"])
+    assert exc_info.value.metadata["returncode"] == 1
+    assert "ValueError: bad" in exc_info.value.metadata["stderr"]
+
+    # The worker survives failing commands
+    assert pool.stats()["spawned"] == 1
+
+    with pytest.raises(SpaceExecutorException, match="does not exist"):
+        pool.run("missing", ["-c", "pass"])
+
+
+def test_run_timeout_and_crash_discard_worker(pool, space_manager):
+    space_manager.create_space("slow")
+
+    with pytest.raises(SpaceWorkerPoolException) as exc_info:
+        pool.run("slow", ["-c", "import time; time.sleep(10)"], timeout=0.5)
+    assert exc_info.value.error_code == "COMMAND_TIMEOUT"
+
+    with pytest.raises(SpaceWorkerPoolException) as exc_info:
+        pool.run("slow", ["-c", "import os; os._exit(5)"])
+    assert exc_info.value.error_code == "WORKER_FAILED"
+
+    assert pool.run("slow", ["-c", "print('ok')"]).stdout == "ok\n"
+    assert pool.stats()["spawned"] == 3
+
+
+def test_max_workers_evicts_least_recently_used(pool, space_manager):
+    for name in ("one", "two", "three"):
+        space_manager.create_space(name)
+        pool.run(name, ["-c", "pass"])
+
+    stats = pool.stats()
+    assert stats["idle"] == 2
+    assert stats["spawned"] == 3
+    assert set(pool._idle) == {"two", "three"}
+
+
+def test_idle_workers_are_evicted(space_executor, space_manager):
+    space_manager.create_space("idle")
+    with SpaceWorkerPool(executor=space_executor, idle_timeout=0.2) as pool:
+        pool.run("idle", ["-c", "pass"])
+        assert pool.stats()["idle"] == 1
+
+        deadline = time.monotonic() + 5
+        while pool.stats()["idle"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pool.stats()["idle"] == 0
+
+    with pytest.raises(SpaceWorkerPoolException) as exc_info:
+        pool.run("idle", ["-c", "pass"])
+    assert exc_info.value.error_code == "POOL_CLOSED"